@@ -20,6 +20,8 @@ from distutils.util import strtobool
 from rest_framework.mixins import ListModelMixin
 from rest_framework.response import Response
 
+from geonode.base.api.planner import ResourceBaseSerializationPlanner
+
 
 class AdvertisedListMixin(ListModelMixin):
     def list(self, request, *args, **kwargs):
@@ -53,3 +55,16 @@ class AdvertisedListMixin(ListModelMixin):
 
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class ResourceBasePrefetchMixin:
+    """
+    Injects into the context of the list serializers the per-page lookups planned by the
+    "ResourceBaseSerializationPlanner", so that the computed fields do not query once per resource.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if kwargs.get("many") and args and self.request and self.request.method == "GET":
+            ResourceBaseSerializationPlanner.for_serializer(serializer).apply(serializer, args[0])
+        return serializer
@@ -16,21 +16,64 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import json
+import base64
+import hashlib
+import logging
+import datetime
+
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django.db.models import F, Model, Q
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_PAGE = getattr(settings, "REST_API_DEFAULT_PAGE", 1)
 DEFAULT_PAGE_SIZE = getattr(settings, "REST_API_DEFAULT_PAGE_SIZE", 10)
 DEFAULT_PAGE_QUERY_PARAM = getattr(settings, "REST_API_DEFAULT_PAGE_QUERY_PARAM", "page_size")
+DEFAULT_CURSOR_QUERY_PARAM = getattr(settings, "REST_API_DEFAULT_CURSOR_QUERY_PARAM", "cursor")
+
+CURSOR_TOTAL_QUERY_PARAM = "total"
+CURSOR_TOTAL_MODES = ("exact", "cached", "estimate", "none")
+CURSOR_TOTAL_CACHE_KEY_PREFIX = "api_cursor_total"
 
 
 class GeoNodeApiPagination(PageNumberPagination):
+    """
+    Page number pagination, with an opt-in keyset (cursor) mode enabled by passing the `cursor` query param
+    (empty for the first page).
+
+    Instead of an offset, the cursor holds the values of the sort fields of the last returned row,
+    plus its pk as a tie-breaker, so that the next page is fetched with a filter on them and deep pages
+    cost the same as the first one. Cursors are opaque and only go forward.
+
+    The `total` query param controls how the total count is computed:
+     - "exact": a `COUNT(*)` on each request
+     - "cached": the exact count, cached per query for `REST_API_CURSOR_TOTAL_CACHE_TIMEOUT` seconds
+     - "estimate": the planner estimate (PostgreSQL only, exact otherwise)
+     - "none": no count at all
+    """
+
     page = DEFAULT_PAGE
     page_size = DEFAULT_PAGE_SIZE
     page_size_query_param = DEFAULT_PAGE_QUERY_PARAM
+    cursor_mode = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = DEFAULT_CURSOR_QUERY_PARAM in request.query_params
+        if self.cursor_mode:
+            return self.paginate_queryset_by_cursor(queryset, request, view=view)
+        return super().paginate_queryset(queryset, request, view=view)
 
     def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return self.get_cursor_paginated_response(data)
         _paginated_response = {
             "links": {"next": self.get_next_link(), "previous": self.get_previous_link()},
             "total": self.page.paginator.count,
@@ -39,3 +82,145 @@ class GeoNodeApiPagination(PageNumberPagination):
         }
         _paginated_response.update(data)
         return Response(_paginated_response)
+
+    def paginate_queryset_by_cursor(self, queryset, request, view=None):
+        self.request = request
+        self.cursor_page_size = int(self.get_page_size(request) or DEFAULT_PAGE_SIZE)
+        self.cursor = request.query_params.get(DEFAULT_CURSOR_QUERY_PARAM) or None
+        self.total = self.get_cursor_total(queryset, request.query_params.get(CURSOR_TOTAL_QUERY_PARAM))
+
+        ordering = self.get_keyset_ordering(queryset)
+        queryset = queryset.order_by(
+            *[
+                F(field).desc(nulls_first=True) if descending else F(field).asc(nulls_last=True)
+                for field, descending in ordering
+            ]
+        )
+        if self.cursor:
+            queryset = queryset.filter(self.get_keyset_filter(ordering, self.decode_cursor(self.cursor, ordering)))
+
+        rows = list(queryset[: self.cursor_page_size + 1])
+        self.next_cursor = None
+        if len(rows) > self.cursor_page_size:
+            rows = rows[: self.cursor_page_size]
+            self.next_cursor = self.encode_cursor([self.get_row_value(rows[-1], field) for field, _ in ordering])
+        return rows
+
+    def get_cursor_paginated_response(self, data):
+        _paginated_response = {
+            "links": {"next": self.get_next_cursor_link(), "previous": None},
+            "total": self.total,
+            "cursor": self.cursor,
+            DEFAULT_PAGE_QUERY_PARAM: self.cursor_page_size,
+        }
+        _paginated_response.update(data)
+        return Response(_paginated_response)
+
+    def get_next_cursor_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), DEFAULT_CURSOR_QUERY_PARAM, self.next_cursor)
+
+    @staticmethod
+    def get_keyset_ordering(queryset) -> list:
+        """
+        Returns the ordering of the queryset as a list of (field, descending) tuples, ending with the pk.
+        """
+        order_by = queryset.query.order_by or (queryset.query.default_ordering and queryset.model._meta.ordering)
+        ordering = []
+        for field in order_by or ():
+            if not isinstance(field, str) or field == "?":
+                raise ParseError("Cursor pagination is not supported by the requested sorting")
+            descending = field.startswith("-")
+            field = field.lstrip("-+")
+            ordering.append(("pk" if field == queryset.model._meta.pk.name else field, descending))
+        if "pk" not in (field for field, _ in ordering):
+            ordering.append(("pk", False))
+        return ordering
+
+    @staticmethod
+    def get_keyset_filter(ordering, position) -> Q:
+        """
+        Builds the filter selecting the rows following the position in the given ordering.
+        Null values are the last ones in ascending order and the first ones in descending order.
+        """
+        keyset_filter = Q(pk__in=[])
+        preceding = Q()
+        for (field, descending), value in zip(ordering, position):
+            if value is None:
+                following = Q(**{f"{field}__isnull": False}) if descending else None
+                equal = Q(**{f"{field}__isnull": True})
+            else:
+                following = (
+                    Q(**{f"{field}__lt": value})
+                    if descending
+                    else Q(**{f"{field}__gt": value}) | Q(**{f"{field}__isnull": True})
+                )
+                equal = Q(**{field: value})
+            if following is not None:
+                keyset_filter |= preceding & following
+            preceding &= equal
+        return keyset_filter
+
+    @staticmethod
+    def get_row_value(row, field):
+        value = row
+        for attr in field.split("__"):
+            value = value.get(attr) if isinstance(value, dict) else getattr(value, attr, None)
+            if value is None:
+                break
+        # sorting by a foreign key sorts by its pk
+        return value.pk if isinstance(value, Model) else value
+
+    @staticmethod
+    def encode_cursor(position) -> str:
+        def _default(value):
+            if isinstance(value, (datetime.date, datetime.time)):
+                return value.isoformat()
+            return str(value)
+
+        payload = json.dumps(position, default=_default, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor, ordering) -> list:
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound("Invalid cursor")
+        if not isinstance(position, list) or len(position) != len(ordering):
+            raise NotFound("Invalid cursor")
+        return position
+
+    @staticmethod
+    def get_cursor_total(queryset, mode=None):
+        mode = mode or getattr(settings, "REST_API_CURSOR_TOTAL", "cached")
+        if mode not in CURSOR_TOTAL_MODES:
+            raise ParseError(f"Invalid {CURSOR_TOTAL_QUERY_PARAM}, must be one of {', '.join(CURSOR_TOTAL_MODES)}")
+        if mode == "none":
+            return None
+
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        if mode == "estimate" and connection.vendor == "postgresql":
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                    plan = cursor.fetchone()[0]
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                return int(plan[0]["Plan"]["Plan Rows"])
+            except Exception as e:
+                logger.warning(f"Could not estimate the count of the query, falling back to the exact one: {e}")
+
+        if mode == "cached":
+            key = f"{CURSOR_TOTAL_CACHE_KEY_PREFIX}:{hashlib.sha1(repr((sql, params)).encode('utf-8')).hexdigest()}"
+            total = cache.get(key)
+            if total is None:
+                total = queryset.count()
+                cache.set(key, total, getattr(settings, "REST_API_CURSOR_TOTAL_CACHE_TIMEOUT", 60))
+            return total
+
+        return queryset.count()
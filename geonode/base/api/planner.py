@@ -0,0 +1,151 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import logging
+
+from collections import defaultdict
+
+from django.conf import settings
+
+from geonode.base.models import ContactRole, Link
+from geonode.favorite.models import Favorite
+from geonode.people import Roles
+from geonode.security.models import get_user_perms_bulk
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_CONTEXT_KEY = "resources_prefetch"
+
+# link types returned by the "links" field of the resources API
+SERIALIZED_LINK_TYPES = ["OGC:WMS", "OGC:WFS", "OGC:WCS", "image", "metadata"]
+
+# values stored in ContactRole.role for the contact roles fields, see the ResourceBase contact roles properties
+CONTACT_ROLE_VALUES = {
+    role.name: {Roles.POC.name: "pointOfContact", Roles.METADATA_AUTHOR.name: "author"}.get(role.name, role.name)
+    for role in Roles.get_multivalue_ones()
+}
+
+NOT_PREFETCHED = object()
+
+
+class ResourcesPrefetch:
+    """
+    Lookups computed once for a page of resources, keyed by resource pk.
+    """
+
+    def __init__(self, pks):
+        self.pks = set(pks)
+        self.lookups = {}
+
+    def get(self, lookup: str, pk, default=None):
+        """
+        Returns the value of a lookup for a resource, or NOT_PREFETCHED if the lookup has not been
+        planned for it, in which case the caller is expected to fall back to its own query.
+        """
+        if lookup not in self.lookups or pk not in self.pks:
+            return NOT_PREFETCHED
+        return self.lookups[lookup].get(pk, default)
+
+
+def get_prefetched(context: dict, lookup: str, pk, default=None):
+    prefetch = context.get(PREFETCH_CONTEXT_KEY) if context else None
+    if prefetch is None:
+        return NOT_PREFETCHED
+    return prefetch.get(lookup, pk, default)
+
+
+class ResourceBaseSerializationPlanner:
+    """
+    Plans the lookups needed to serialize a page of resources with the "ResourceBaseSerializer".
+
+    The computed fields (contact roles, favorite, perms, links) query the database once per resource.
+    Given the fields actually requested through "include[]"/"exclude[]", the planner computes their values
+    for the whole page with one query per lookup and injects them into the serializer context,
+    where the fields look them up before falling back to their own queries.
+
+    Relation fields are not planned here, since they are already prefetched by the dynamic_rest filter backend.
+    """
+
+    def __init__(self, fields, user=None):
+        self.fields = set(fields)
+        self.user = user
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        child = getattr(serializer, "child", serializer)
+        request = serializer.context.get("request")
+        return cls(child.fields.keys(), getattr(request, "user", None))
+
+    @property
+    def contact_roles(self) -> list:
+        return [_name for _name in CONTACT_ROLE_VALUES if _name in self.fields]
+
+    def get_lookups(self) -> list:
+        lookups = []
+        if self.contact_roles:
+            lookups.append("contacts")
+        if "favorite" in self.fields and self.user and not self.user.is_anonymous:
+            lookups.append("favorite")
+        if "perms" in self.fields and self.user:
+            lookups.append("perms")
+        if "links" in self.fields:
+            lookups.append("links")
+        return lookups
+
+    def prefetch(self, resources) -> ResourcesPrefetch:
+        resources = list(resources)
+        prefetch = ResourcesPrefetch(_r.pk for _r in resources)
+        if not resources:
+            return prefetch
+        pks = list(prefetch.pks)
+
+        for lookup in self.get_lookups():
+            if lookup == "contacts":
+                roles = {CONTACT_ROLE_VALUES[_name]: _name for _name in self.contact_roles}
+                contacts = defaultdict(lambda: defaultdict(list))
+                for contact_role in (
+                    ContactRole.objects.filter(resource_id__in=pks, role__in=roles.keys())
+                    .select_related("contact")
+                    .order_by("id")
+                ):
+                    contacts[contact_role.resource_id][roles[contact_role.role]].append(contact_role.contact)
+                prefetch.lookups[lookup] = contacts
+            elif lookup == "favorite":
+                favorites = Favorite.objects.filter(object_id__in=pks, user=self.user).values_list(
+                    "object_id", flat=True
+                )
+                prefetch.lookups[lookup] = {_pk: True for _pk in favorites}
+            elif lookup == "perms":
+                prefetch.lookups[lookup] = get_user_perms_bulk(self.user, [_r.get_real_instance() for _r in resources])
+            elif lookup == "links":
+                links = defaultdict(list)
+                for link in Link.objects.filter(resource_id__in=pks, link_type__in=SERIALIZED_LINK_TYPES):
+                    links[link.resource_id].append(link)
+                prefetch.lookups[lookup] = links
+
+        logger.debug("Prefetched %r for %d resources", list(prefetch.lookups), len(pks))
+        return prefetch
+
+    def apply(self, serializer, resources):
+        """
+        Injects the lookups computed for the resources into the serializer context.
+        """
+        if not getattr(settings, "RESOURCES_API_PREFETCH_ENABLED", True):
+            return serializer
+        serializer.context[PREFETCH_CONTEXT_KEY] = self.prefetch(resources)
+        return serializer
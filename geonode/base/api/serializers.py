@@ -62,10 +62,12 @@ from geonode.documents.models import Document
 from geonode.geoapps.models import GeoApp
 from geonode.groups.models import GroupCategory, GroupProfile
 from geonode.base.api.fields import ComplexDynamicRelationField
+from geonode.base.api.planner import NOT_PREFETCHED, SERIALIZED_LINK_TYPES, get_prefetched
 from geonode.layers.utils import get_dataset_download_handlers, get_default_dataset_download_handler
 from geonode.utils import build_absolute_uri
 from geonode.security.utils import get_resources_with_perms, get_geoapp_subtypes
 from geonode.resource.models import ExecutionRequest
+from geonode.thumbs import derivatives as thumbnail_derivatives
 from django.contrib.gis.geos import Polygon
 
 logger = logging.getLogger(__name__)
@@ -271,6 +273,24 @@ class ThumbnailUrlField(DynamicComputedField):
         return build_absolute_uri(thumbnail_url)
 
 
+class ThumbnailSrcsetField(DynamicComputedField):
+    """
+    The srcset of the thumbnail, listing its sizes served by the "thumbnail" endpoint, which picks their encoding
+    from the Accept header. None for remote thumbnails, which have no derivatives.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        if not thumbnail_derivatives.is_enabled() or not thumbnail_derivatives.get_local_thumbnail_path(instance):
+            return None
+        url = build_absolute_uri(reverse("base-resources-thumbnail", kwargs={"pk": instance.pk}))
+        sizes = [f"{url}?width={width} {width}w" for width in thumbnail_derivatives.get_widths()]
+        sizes.append(f"{url} {settings.THUMBNAIL_SIZE['width']}w")
+        return ", ".join(sizes)
+
+
 class DownloadLinkField(DynamicComputedField):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -332,6 +352,9 @@ class FavoriteField(DynamicComputedField):
     def get_attribute(self, instance):
         _user = self.context.get("request")
         if _user and not _user.user.is_anonymous:
+            favorite = get_prefetched(self.context, "favorite", instance.pk, default=False)
+            if favorite is not NOT_PREFETCHED:
+                return favorite
             return Favorite.objects.filter(object_id=instance.pk, user=_user.user).exists()
         return False
 
@@ -375,6 +398,9 @@ class ContactRoleField(DynamicComputedField):
         super().__init__(**kwargs)
 
     def get_attribute(self, instance):
+        contacts = get_prefetched(self.context, "contacts", instance.pk, default={})
+        if contacts is not NOT_PREFETCHED:
+            return contacts.get(self.contact_type, [])
         return getattr(instance, self.contact_type)
 
     def to_representation(self, value):
@@ -504,6 +530,10 @@ class PermsSerializer(DynamicModelSerializer):
 
     def to_representation(self, instance):
         request = self.context.get("request", None)
+        if request and request.user:
+            perms = get_prefetched(self.context, "perms", instance, default=[])
+            if perms is not NOT_PREFETCHED:
+                return perms
         resource = ResourceBase.objects.get(pk=instance)
         return (
             (
@@ -523,9 +553,9 @@ class LinksSerializer(DynamicModelSerializer):
     def to_representation(self, instance):
         ret = []
         link_fields = ["extension", "link_type", "name", "mime", "url"]
-        links = Link.objects.filter(
-            resource_id=instance, link_type__in=["OGC:WMS", "OGC:WFS", "OGC:WCS", "image", "metadata"]
-        )
+        links = get_prefetched(self.context, "links", instance, default=[])
+        if links is NOT_PREFETCHED:
+            links = Link.objects.filter(resource_id=instance, link_type__in=SERIALIZED_LINK_TYPES)
         for lnk in links:
             formatted_link = model_to_dict(lnk, fields=link_fields)
             ret.append(formatted_link)
@@ -590,6 +620,7 @@ class ResourceBaseSerializer(DynamicModelSerializer):
     sourcetype = serializers.CharField(read_only=True)
     embed_url = EmbedUrlField(required=False)
     thumbnail_url = ThumbnailUrlField(read_only=True)
+    thumbnail_srcset = ThumbnailSrcsetField(read_only=True)
     keywords = ComplexDynamicRelationField(SimpleHierarchicalKeywordSerializer, many=True)
     tkeywords = ComplexDynamicRelationField(SimpleThesaurusKeywordSerializer, many=True)
     regions = DynamicRelationField(SimpleRegionSerializer, embed=True, many=True, read_only=True)
@@ -696,6 +727,7 @@ class ResourceBaseSerializer(DynamicModelSerializer):
             "extent",
             "favorite",
             "thumbnail_url",
+            "thumbnail_srcset",
             "links",
             "link",
             # TODO
@@ -24,7 +24,9 @@ import json
 import logging
 from typing import Iterable
 
+from django.db import connection
 from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 import gisdata
 
 from PIL import Image
@@ -482,6 +484,87 @@ class BaseApiTests(APITestCase):
         finally:
             user.delete()
 
+    def test_base_resources_prefetch_query_count(self):
+        """
+        Query-count benchmark of the Resource Base list:
+        the lookups of the computed fields must not grow with the page size.
+        """
+        admin = get_user_model().objects.get(username="admin")
+        maps = list(Map.objects.all()[:2])
+        Favorite.objects.create_favorite(maps[0], admin)
+        maps[1].poc = [admin]
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+
+        def _get(page_size):
+            url = f"{reverse('base-resources-list')}?filter{{resource_type}}=map&page_size={page_size}"
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, 200)
+            return response.data["resources"], len(ctx.captured_queries)
+
+        def _normalize(resources):
+            resources = json.loads(json.dumps(resources))
+            for _r in resources:
+                _r["perms"] = sorted(_r["perms"])
+            return resources
+
+        _, small_page_queries = _get(1)
+        resources, queries = _get(100)
+        with override_settings(RESOURCES_API_PREFETCH_ENABLED=False):
+            _, expected_small_page_queries = _get(1)
+            expected, expected_queries = _get(100)
+        logger.info(
+            f"Resources list queries for 1 and {len(resources)} maps: "
+            f"{small_page_queries} and {queries} with prefetching, "
+            f"{expected_small_page_queries} and {expected_queries} without"
+        )
+
+        self.assertGreater(len(resources), 1)
+        self.assertListEqual(_normalize(expected), _normalize(resources))
+        _favorites = {_r["pk"]: _r["favorite"] for _r in resources}
+        self.assertTrue(_favorites[str(maps[0].pk)])
+        self.assertFalse(_favorites[str(maps[1].pk)])
+        _pocs = {_r["pk"]: [_c["username"] for _c in _r["poc"]] for _r in resources}
+        self.assertListEqual(["admin"], _pocs[str(maps[1].pk)])
+
+        # the remaining per-resource queries come from the fields which are not planned
+        # (e.g. the download handlers) and must stay well below the unplanned ones
+        self.assertLess(queries, expected_queries)
+        self.assertLess(queries - small_page_queries, (expected_queries - expected_small_page_queries) / 2)
+
+    def test_base_resources_cursor_pagination(self):
+        """
+        Ensure the keyset pagination crawls the whole Resource Base list once.
+        """
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+        for sort in ("", "&sort[]=title", "&sort[]=-date&sort[]=title"):
+            url = f"{reverse('base-resources-list')}?page_size=100{sort}"
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, 200)
+            expected = [_r["pk"] for _r in response.data["resources"]]
+
+            crawled = []
+            url = f"{reverse('base-resources-list')}?page_size=3&cursor=&total=exact{sort}"
+            while url:
+                response = self.client.get(url, format="json")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["total"], len(expected))
+                self.assertLessEqual(len(response.data["resources"]), 3)
+                crawled.extend(_r["pk"] for _r in response.data["resources"])
+                url = response.data["links"]["next"]
+            # rows with the same sort values may come in any order without the pk tie-breaker
+            self.assertEqual(len(expected), len(crawled))
+            self.assertSetEqual(set(expected), set(crawled))
+
+        url = f"{reverse('base-resources-list')}?cursor=&total=none"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["total"])
+
+        url = f"{reverse('base-resources-list')}?cursor=invalid"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, 404)
+
     def test_base_resources(self):
         """
         Ensure we can access the Resource Base list.
@@ -1617,6 +1700,45 @@ class BaseApiTests(APITestCase):
         thumbnail_url = response.data["resource"]["thumbnail_url"]
         self.assertIsNone(thumbnail_url)
 
+    @override_settings(
+        THUMBNAIL_DERIVATIVES={"enabled": True, "widths": [250], "formats": ["image/webp"], "quality": 80}
+    )
+    def test_thumbnail_negotiation(self):
+        """
+        Ensure the thumbnail endpoint redirects to the derivative matching the requested width and Accept header.
+        """
+        resource = ResourceBase.objects.filter(owner__username="bobby").first()
+        ResourceBase.objects.filter(pk=resource.pk).update(
+            thumbnail_url=f"{settings.SITEURL}uploaded/thumbs/dataset-thumb.jpg",
+            thumbnail_path="thumbs/dataset-thumb.jpg",
+        )
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+
+        response = self.client.get(reverse("base-resources-detail", kwargs={"pk": resource.pk}), format="json")
+        url = build_absolute_uri(reverse("base-resources-thumbnail", kwargs={"pk": resource.pk}))
+        self.assertEqual(
+            response.data["resource"]["thumbnail_srcset"],
+            f"{url}?width=250 250w, {url} {settings.THUMBNAIL_SIZE['width']}w",
+        )
+
+        url = reverse("base-resources-thumbnail", kwargs={"pk": resource.pk})
+        with patch("geonode.thumbs.derivatives.storage_manager") as storage_mock, patch(
+            "geonode.base.api.views.storage_manager"
+        ) as views_storage_mock:
+            storage_mock.exists.return_value = True
+            views_storage_mock.url.side_effect = lambda path: f"/uploaded/{path}"
+
+            response = self.client.get(f"{url}?width=200", HTTP_ACCEPT="image/avif,image/webp,*/*;q=0.8")
+            self.assertEqual(response.status_code, 302)
+            self.assertTrue(response["Location"].endswith("/uploaded/thumbs/dataset-thumb-250w.webp"))
+            self.assertIn("Accept", response["Vary"])
+
+            response = self.client.get(url, HTTP_ACCEPT="*/*")
+            self.assertTrue(response["Location"].endswith("/uploaded/thumbs/dataset-thumb.jpg"))
+
+            response = self.client.get(f"{url}?width=large")
+            self.assertEqual(response.status_code, 400)
+
     def test_embed_urls(self):
         """
         Ensure the embed urls reflect the concrete instance ones.
@@ -1955,6 +2077,27 @@ class BaseApiTests(APITestCase):
                 )
                 self.assertEqual(response.status_code, 200)
 
+    @patch("geonode.base.api.views.regenerate_thumbnails_task.apply_async")
+    def test_regenerate_thumbnails(self, mock_apply_async):
+        """
+        Only admins can regenerate the thumbnails in bulk, the batch is run asynchronously.
+        """
+        url = reverse("base-resources-regenerate-thumbnails")
+        self.assertTrue(self.client.login(username="bobby", password="bob"))
+        response = self.client.post(url, data={"resource_type": "dataset"}, format="json")
+        self.assertEqual(response.status_code, 403)
+        mock_apply_async.assert_not_called()
+
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+        response = self.client.post(url, data={"ids": ["invalid"]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(url, data={"resource_type": "dataset", "ids": [1, "2"]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        exec_request = ExecutionRequest.objects.get(exec_id=response.json()["execution_id"])
+        self.assertEqual(exec_request.func_name, "regenerate_thumbnails")
+        self.assertDictEqual(exec_request.input_params, {"resource_type": "dataset", "ids": [1, 2]})
+        mock_apply_async.assert_called_once_with(args=(str(exec_request.exec_id),))
+
     def test_set_thumbnail_from_bbox_from_Anonymous_user_raise_permission_error(self):
         """
         Given a request with Anonymous user, should raise an authentication error.
@@ -31,7 +31,9 @@ from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.conf import settings
 from django.db.models import Subquery, QuerySet
+from django.http import HttpResponseRedirect
 from django.http.request import QueryDict
+from django.utils.cache import patch_vary_headers
 from django.contrib.auth import get_user_model
 
 from drf_spectacular.utils import extend_schema
@@ -58,6 +60,10 @@ from geonode.base.models import Configuration, ExtraMetadata, LinkedResource
 from geonode.thumbs.exceptions import ThumbnailError
 from geonode.thumbs.thumbnails import create_thumbnail
 from geonode.thumbs.utils import _decode_base64, BASE64_PATTERN
+from geonode.thumbs import derivatives as thumbnail_derivatives
+from geonode.thumbs.tasks import regenerate_thumbnails_task
+from geonode.storage.manager import storage_manager
+from geonode.utils import build_absolute_uri
 from geonode.groups.conf import settings as groups_settings
 from geonode.base.models import HierarchicalKeyword, Region, ResourceBase, TopicCategory, ThesaurusKeyword
 from geonode.base.api.filters import (
@@ -80,7 +86,8 @@ from geonode.resource.api.tasks import resouce_service_dispatcher
 from geonode.resource.manager import resource_manager
 
 
-from geonode.base.api.mixins import AdvertisedListMixin
+from geonode.base.api.mixins import AdvertisedListMixin, ResourceBasePrefetchMixin
+from geonode.base.api.planner import ResourceBaseSerializationPlanner
 from .permissions import (
     IsOwnerOrAdmin,
     IsManagerEditOrAdmin,
@@ -297,7 +304,7 @@ class ApiPresetsInitializer(APIView):
             request.GET._mutable = False
 
 
-class ResourceBaseViewSet(ApiPresetsInitializer, DynamicModelViewSet, AdvertisedListMixin):
+class ResourceBaseViewSet(ApiPresetsInitializer, ResourceBasePrefetchMixin, DynamicModelViewSet, AdvertisedListMixin):
     """
     API endpoint that allows base resources to be viewed or edited.
     """
@@ -323,6 +330,7 @@ class ResourceBaseViewSet(ApiPresetsInitializer, DynamicModelViewSet, Advertised
         resources = get_resources_with_perms(request.user).filter(**filter)
         result_page = paginator.paginate_queryset(resources, request)
         serializer = ResourceBaseSerializer(result_page, embed=True, many=True)
+        ResourceBaseSerializationPlanner.for_serializer(serializer).apply(serializer, result_page)
         return paginator.get_paginated_response({"resources": serializer.data})
 
     @extend_schema(
@@ -721,6 +729,80 @@ class ResourceBaseViewSet(ApiPresetsInitializer, DynamicModelViewSet, Advertised
             logger.error(e)
             return Response(data={"message": e.args[0], "success": False}, status=500, exception=True)
 
+    @extend_schema(
+        methods=["post"],
+        responses={200},
+        description="Instructs the Async dispatcher to regenerate the thumbnails of the Resources in bulk.",
+    )
+    @action(
+        detail=False,
+        url_path="regenerate_thumbnails",  # noqa
+        url_name="regenerate-thumbnails",
+        methods=["post"],
+        permission_classes=[IsAuthenticated],
+    )
+    def regenerate_thumbnails(self, request, *args, **kwargs):
+        """Instructs the Async dispatcher to regenerate the thumbnails of the Resources in bulk, admins only
+
+        - POST input_params: {
+            resource_type: "<str: only the resources of this type, optional>",
+            filter: "<str: only the resources whose title contains this text, optional>",
+            username: "<str: only the resources owned by this user, optional>",
+            ids: [<int: only the resources with these ids, optional>],
+            keep_existing: <bool: do not overwrite the existing thumbnails, default false>
+        }
+
+        - output_params: {
+            output: {
+                "total": <int>, "created": <int>, "skipped": <int>, "failed": {"<str: id>": "<str: error>"},
+                "elapsed": <float: seconds>, "throughput": <float: thumbnails/sec>
+            }
+        }
+
+        - output: {
+                "status": "ready",
+                "execution_id": "<str: execution ID>",
+                "status_url": "http://localhost:8000/api/v2/resource-service/execution-status/<str: execution ID>"
+            }
+
+        Sample request:
+
+        1. curl -v -X POST -u admin:admin -H "Content-Type: application/json" -d '{"resource_type": "dataset"}'
+            http://localhost:8000/api/v2/resources/regenerate_thumbnails
+        """
+        if not request.user.is_superuser:
+            return Response(status=status.HTTP_403_FORBIDDEN)
+        input_params = {
+            key: request.data.get(key)
+            for key in ("resource_type", "filter", "username", "ids", "keep_existing")
+            if request.data.get(key) is not None
+        }
+        if "ids" in input_params:
+            try:
+                input_params["ids"] = [int(_id) for _id in input_params["ids"]]
+            except (TypeError, ValueError):
+                return Response({"message": "ids must be a list of integers", "success": False}, status=400)
+        try:
+            _exec_request = ExecutionRequest.objects.create(
+                user=request.user,
+                func_name="regenerate_thumbnails",
+                input_params=input_params,
+            )
+            regenerate_thumbnails_task.apply_async(args=(str(_exec_request.exec_id),))
+            return Response(
+                {
+                    "status": _exec_request.status,
+                    "execution_id": _exec_request.exec_id,
+                    "status_url": urljoin(
+                        settings.SITEURL, reverse("rs-execution-status", kwargs={"execution_id": _exec_request.exec_id})
+                    ),
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.exception(e)
+            return Response(status=status.HTTP_400_BAD_REQUEST, exception=e)
+
     @extend_schema(
         methods=["post"], responses={200}, description="Instructs the Async dispatcher to execute a 'INGEST' operation."
     )
@@ -1299,6 +1381,38 @@ class ResourceBaseViewSet(ApiPresetsInitializer, DynamicModelViewSet, Advertised
             return Response({"thumbnail_url": resource.thumbnail_url})
         return Response("Unable to set thumbnail", status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(
+        methods=["get"],
+        responses={302},
+        description="API endpoint redirecting to the thumbnail of the Resource, in the size closest to the "
+        "optional width query param and in the most compact encoding accepted by the client.",
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[UserHasPerms(perms_dict={"default": {"GET": ["base.view_resourcebase"]}})],
+        url_path=r"thumbnail",  # noqa
+        url_name="thumbnail",
+    )
+    def thumbnail(self, request, pk, *args, **kwargs):
+        resource = self.get_object()
+        thumbnail_path = thumbnail_derivatives.get_local_thumbnail_path(resource)
+        if thumbnail_path:
+            try:
+                width = int(request.query_params.get("width") or 0)
+            except ValueError:
+                raise ValidationError("width must be an integer")
+            path = thumbnail_derivatives.select_derivative(thumbnail_path, request.headers.get("Accept"), width=width)
+            url = storage_manager.url(path)
+        elif resource.thumbnail_url:
+            url = resource.thumbnail_url
+        else:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        response = HttpResponseRedirect(build_absolute_uri(url))
+        patch_vary_headers(response, ["Accept"])
+        return response
+
     @extend_schema(
         methods=["get", "put", "delete", "post"], description="Get/Update/Delete/Add extra metadata for resource"
     )
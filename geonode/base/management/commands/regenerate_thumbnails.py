@@ -0,0 +1,115 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+from django.core.management.base import BaseCommand
+
+from geonode.thumbs.batch import get_batch_resources, regenerate_thumbnails
+
+
+class Command(BaseCommand):
+
+    help = 'Regenerates the thumbnails of the resources in bulk, resuming an interrupted run from its checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-t',
+            '--type',
+            dest='resource_type',
+            default=None,
+            help='Only regenerate the thumbnails of the resources of the given type (e.g. dataset, map)')
+
+        parser.add_argument(
+            '-f',
+            '--filter',
+            dest='filter',
+            default=None,
+            help='Only regenerate the thumbnails of the resources whose title matches the given filter')
+
+        parser.add_argument(
+            '-u',
+            '--username',
+            dest='username',
+            default=None,
+            help='Only regenerate the thumbnails of the resources owned by the specified username')
+
+        parser.add_argument(
+            '-w',
+            '--workers',
+            dest='workers',
+            type=int,
+            default=None,
+            help='Number of workers (Default settings.THUMBNAIL_BATCH_OPTIONS["workers"])')
+
+        parser.add_argument(
+            '-s',
+            '--chunk-size',
+            dest='chunk_size',
+            type=int,
+            default=None,
+            help='Max number of resources taken at once by a worker (Default settings.THUMBNAIL_BATCH_OPTIONS["chunk_size"])')
+
+        parser.add_argument(
+            '-c',
+            '--checkpoint',
+            dest='checkpoint',
+            default=None,
+            help='File recording the progress, the resources already processed by a previous run are skipped')
+
+        parser.add_argument(
+            '-r',
+            '--retry-failed',
+            action='store_true',
+            dest='retry_failed',
+            default=False,
+            help='Process again the resources failed in a previous run with the same checkpoint')
+
+        parser.add_argument(
+            '-k',
+            '--keep-existing',
+            action='store_true',
+            dest='keep_existing',
+            default=False,
+            help='Do not overwrite the existing thumbnails')
+
+    def handle(self, **options):
+        resources = get_batch_resources(
+            resource_type=options.get('resource_type'),
+            title=options.get('filter'),
+            username=options.get('username'))
+
+        def _progress(report):
+            print(
+                f'[{report.skipped + report.processed} / {report.total}] '
+                f'{report.created} created, {len(report.failed)} failed '
+                f'({report.throughput:.2f} thumbnails/sec)')
+
+        report = regenerate_thumbnails(
+            resources,
+            workers=options.get('workers'),
+            chunk_size=options.get('chunk_size'),
+            overwrite=not options.get('keep_existing'),
+            checkpoint=options.get('checkpoint'),
+            retry_failed=options.get('retry_failed'),
+            progress=_progress)
+
+        for resource_id, error in sorted(report.failed.items()):
+            print(f'[ERROR] Resource id {resource_id}: {error}')
+        print(
+            f'{report.created} thumbnails created, {len(report.failed)} failed, {report.skipped} skipped '
+            f'in {report.elapsed:.1f}s ({report.throughput:.2f} thumbnails/sec)')
@@ -74,8 +74,10 @@ from geonode.utils import (
     bbox_swap,
     get_allowed_extensions,
     is_monochromatic_image,
+    cache_monochromatic_image,
 )
 from geonode.thumbs.utils import thumb_size, remove_thumbs, get_unique_upload_path
+from geonode.thumbs import derivatives as thumbnail_derivatives
 from geonode.groups.models import GroupProfile
 from geonode.security.utils import get_visible_resources, get_geoapp_subtypes
 from geonode.security.models import PermissionLevelMixin
@@ -1541,8 +1543,11 @@ class ResourceBase(PolymorphicModel, PermissionLevelMixin, ItemBase):
         # force convertion to JPEG output file
         upload_path = f"{os.path.splitext(upload_path)[0]}.jpg"
         try:
-            # Check that the image is valid
-            if is_monochromatic_image(None, image):
+            # Check that the image is valid, unless it has been checked already by the caller
+            monochromatic = kwargs.get("monochromatic")
+            if monochromatic is None:
+                monochromatic = is_monochromatic_image(None, image)
+            if monochromatic or not image:
                 if not self.thumbnail_url and not image:
                     raise Exception("Generated thumbnail image is blank")
                 else:
@@ -1576,6 +1581,9 @@ class ResourceBase(PolymorphicModel, PermissionLevelMixin, ItemBase):
                     # If we use a remote storage, the local img is deleted
                     if tmp_location != storage_manager.path(upload_path):
                         os.remove(tmp_location)
+
+                    # Smaller sizes and compact encodings served by content negotiation
+                    thumbnail_derivatives.create_derivatives(upload_path, cover)
                 except Exception as e:
                     logger.exception(e)
 
@@ -1604,12 +1612,16 @@ class ResourceBase(PolymorphicModel, PermissionLevelMixin, ItemBase):
                 # Cleaning up the old stuff
                 if self.thumbnail_path and storage_manager.exists(self.thumbnail_path):
                     storage_manager.delete(self.thumbnail_path)
+                if self.thumbnail_path:
+                    thumbnail_derivatives.remove_derivatives(self.thumbnail_path)
                 # Store the new url and path
                 self.thumbnail_url = url
                 self.thumbnail_path = upload_path
                 obj.url = url
                 obj.save()
                 ResourceBase.objects.filter(id=self.id).update(thumbnail_url=url, thumbnail_path=upload_path)
+                # the stored thumbnail is not blank, spare its later checks
+                cache_monochromatic_image(url, False)
         except Exception as e:
             logger.error(f"Error when generating the thumbnail for resource {self.id}. ({e})")
             try:
@@ -36,7 +36,7 @@ def _log(msg, *args):
 # pickle the object when using Windows.
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
-app.autodiscover_tasks(packages=["geonode.harvesting.harvesters"])
+app.autodiscover_tasks(packages=["geonode.harvesting.harvesters", "geonode.thumbs"])
 
 """ CELERAY SAMPLE TASKS
 @app.on_after_configure.connect
@@ -30,3 +30,7 @@ class GeoNodeFacetsConfig(AppConfig):
 
     def ready(self):
         super(GeoNodeFacetsConfig, self).ready()
+
+        from .signals import connect_signals
+
+        connect_signals()
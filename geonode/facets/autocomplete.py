@@ -0,0 +1,231 @@
+#########################################################################
+#
+# Copyright (C) 2026 Open Source Geospatial Foundation - all rights reserved
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import logging
+import threading
+
+from collections import defaultdict
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_GENERATION_KEY = "facets_autocomplete_generation"
+
+# the matching topics are passed to the facet query as parameters, whose number is bound by
+# some backends (999 on SQLite): beyond that many matches the labels are matched by the database
+AUTOCOMPLETE_MAX_MATCHES = 500
+
+
+def _trigrams(text: str) -> set:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class LabelIndex:
+    """
+    In-memory index of the labels of a set of topics, used to resolve the `topic_contains` facet filter
+    without scanning the labels tables.
+
+    Queries are resolved as case-insensitive substring matches, as the icontains lookup would,
+    through trigram postings. Terms shorter than three characters, or matching too many labels,
+    cannot narrow the facet query and are left to the database.
+    """
+
+    def __init__(self, entries=()):
+        self._labels = {}
+        self._trigrams = defaultdict(set)
+        for key, label in entries:
+            self.add(key, label)
+
+    def __len__(self):
+        return len(self._labels)
+
+    @staticmethod
+    def normalize(label) -> str:
+        return (label or "").casefold()
+
+    def add(self, key, label):
+        self.remove(key)
+        label = self.normalize(label)
+        if not label:
+            return
+        self._labels[key] = label
+        for trigram in _trigrams(label):
+            self._trigrams[trigram].add(key)
+
+    def remove(self, key):
+        label = self._labels.pop(key, None)
+        if label is None:
+            return
+        for trigram in _trigrams(label):
+            postings = self._trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._trigrams[trigram]
+
+    def search(self, text: str, limit: int = AUTOCOMPLETE_MAX_MATCHES) -> list:
+        """
+        Returns the keys of the topics matching the text,
+        None if the text is too short or matches more than `limit` topics.
+        """
+        text = self.normalize(text)
+        if len(text) < 3:
+            return None
+
+        postings = sorted((self._trigrams.get(t, set()) for t in _trigrams(text)), key=len)
+        candidates = set(postings[0])
+        for _postings in postings[1:]:
+            if not candidates:
+                break
+            candidates &= _postings
+        matches = []
+        for key in candidates:
+            if text in self._labels[key]:
+                matches.append(key)
+                if limit is not None and len(matches) > limit:
+                    return None
+        return matches
+
+
+class AutocompleteRegistry:
+    """
+    Per-process registry of the keywords and thesauri labels indexes.
+
+    Indexes are built lazily at the first search and kept up to date incrementally by the signal handlers
+    in `geonode.facets.signals`. Changes applied by other processes are detected through a generation
+    counter stored in the cache, in which case the local indexes are dropped and rebuilt on demand.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._indexes = {}
+        self._generation = None
+
+    def _check_generation(self):
+        generation = cache.get(AUTOCOMPLETE_GENERATION_KEY, 0)
+        if generation != self._generation:
+            self._indexes = {}
+            self._generation = generation
+
+    def _bump_generation(self):
+        try:
+            self._generation = cache.incr(AUTOCOMPLETE_GENERATION_KEY)
+        except ValueError:
+            cache.set(AUTOCOMPLETE_GENERATION_KEY, 1, None)
+            self._generation = cache.get(AUTOCOMPLETE_GENERATION_KEY, 0)
+
+    def _get_index(self, name, loader) -> LabelIndex:
+        with self._lock:
+            self._check_generation()
+            index = self._indexes.get(name)
+            if index is None:
+                index = LabelIndex(loader())
+                self._indexes[name] = index
+                logger.debug("Loaded %d labels into the autocomplete index %r", len(index), name)
+            return index
+
+    def clear(self):
+        with self._lock:
+            self._indexes = {}
+
+    # Keywords
+
+    @staticmethod
+    def _load_keywords():
+        from geonode.base.models import HierarchicalKeyword
+
+        return HierarchicalKeyword.objects.values_list("slug", "name").iterator()
+
+    def search_keywords(self, text: str) -> list:
+        """
+        :return: the slugs of all the keywords matching the text, the visible ones are selected,
+          counted and paged by the facet query; None if the keywords names are to be matched by the database
+        """
+        index = self._get_index(("keyword",), self._load_keywords)
+        with self._lock:
+            return index.search(text)
+
+    def update_keyword(self, slug, name=None):
+        with self._lock:
+            # a stale index is dropped, rather than updated and then taken as current
+            self._check_generation()
+            index = self._indexes.get(("keyword",))
+            if index is not None:
+                if name:
+                    index.add(slug, name)
+                else:
+                    index.remove(slug)
+            self._bump_generation()
+
+    # Thesauri
+
+    @staticmethod
+    def _thesaurus_loader(identifier, lang):
+        def _load():
+            from geonode.base.models import ThesaurusKeyword, ThesaurusKeywordLabel
+
+            labels = dict(
+                ThesaurusKeyword.objects.filter(thesaurus__identifier=identifier).values_list("id", "alt_label")
+            )
+            labels.update(
+                ThesaurusKeywordLabel.objects.filter(keyword__thesaurus__identifier=identifier, lang=lang).values_list(
+                    "keyword_id", "label"
+                )
+            )
+            return labels.items()
+
+        return _load
+
+    def search_thesaurus(self, identifier: str, text: str, lang="en") -> list:
+        """
+        :return: the ids of the keywords of the thesaurus whose label, localized in `lang`
+          or the alt_label otherwise, matches the text; None if the labels are to be matched by the database
+        """
+        index = self._get_index(("thesaurus", identifier, lang), self._thesaurus_loader(identifier, lang))
+        with self._lock:
+            return index.search(text)
+
+    def update_thesaurus_keyword(self, keyword_id):
+        """
+        Refreshes the labels of a thesaurus keyword in all the loaded indexes of its thesaurus.
+        """
+        from geonode.base.models import ThesaurusKeyword, ThesaurusKeywordLabel
+
+        with self._lock:
+            self._check_generation()
+            keyword = (
+                ThesaurusKeyword.objects.filter(id=keyword_id).values("alt_label", "thesaurus__identifier").first()
+            )
+            for name, index in self._indexes.items():
+                if name[0] != "thesaurus":
+                    continue
+                if keyword is None:
+                    index.remove(keyword_id)
+                elif name[1] == keyword["thesaurus__identifier"]:
+                    label = (
+                        ThesaurusKeywordLabel.objects.filter(keyword_id=keyword_id, lang=name[2])
+                        .values_list("label", flat=True)
+                        .first()
+                    )
+                    index.add(keyword_id, label or keyword["alt_label"])
+            self._bump_generation()
+
+
+autocomplete_registry = AutocompleteRegistry()
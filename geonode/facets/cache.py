@@ -0,0 +1,135 @@
+#########################################################################
+#
+# Copyright (C) 2026 Open Source Geospatial Foundation - all rights reserved
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import json
+import logging
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_GENERATION_KEY = "facets_catalogue_generation"
+FACETS_CACHE_KEY_PREFIX = "facets_topics"
+
+
+class FacetsCacheStats:
+    """
+    In-process hit/miss counters of the facets topics cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def as_dict(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "ratio": self.hits / total if total else 0.0}
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+facets_cache_stats = FacetsCacheStats()
+
+
+def get_facets_cache():
+    return caches[getattr(settings, "FACETS_CACHE", "default")]
+
+
+def is_facets_cache_enabled():
+    return getattr(settings, "FACETS_CACHE_TIMEOUT", 0) > 0
+
+
+def get_catalogue_generation() -> int:
+    generation = get_facets_cache().get(CATALOGUE_GENERATION_KEY)
+    if generation is None:
+        generation = 1
+        get_facets_cache().add(CATALOGUE_GENERATION_KEY, generation, None)
+    return generation
+
+
+def bump_catalogue_generation():
+    """
+    Invalidates all the cached facets topics, by moving to a new generation of the catalogue.
+    """
+    _cache = get_facets_cache()
+    try:
+        _cache.incr(CATALOGUE_GENERATION_KEY)
+    except ValueError:
+        _cache.set(CATALOGUE_GENERATION_KEY, 2, None)
+
+
+def get_permission_scope(user) -> str:
+    """
+    Returns a fingerprint of the set of resources the user may see:
+    all the anonymous users share the same scope, as the superusers do,
+    while the other users depend on their own grants and on their groups ones.
+    """
+    if not user or user.is_anonymous:
+        return "anonymous"
+    if user.is_superuser:
+        return "superuser"
+    groups = sorted(user.groups.values_list("id", flat=True))
+    return f"user:{user.id}:groups:{','.join(str(_g) for _g in groups)}"
+
+
+def get_facets_cache_key(provider_name: str, params: dict, lang: str, user) -> str:
+    """
+    Builds the cache key of the topics of a facet.
+    :param provider_name: the name of the facet
+    :param params: the request params affecting the topics (filters, page, page_size, keys, topic_contains, ...)
+    :param lang: the resolved language
+    :param user: the requesting user, used to compute the permission scope
+    """
+    normalized = {
+        k: sorted(str(_v) for _v in v) if isinstance(v, (list, tuple, set)) else str(v) for k, v in params.items()
+    }
+    payload = json.dumps(
+        [provider_name, normalized, lang, get_permission_scope(user)],
+        sort_keys=True,
+    )
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"{FACETS_CACHE_KEY_PREFIX}:{get_catalogue_generation()}:{digest}"
+
+
+def get_cached_topics(key: str):
+    topics = get_facets_cache().get(key)
+    if topics is None:
+        facets_cache_stats.miss()
+    else:
+        facets_cache_stats.hit()
+    return topics
+
+
+def set_cached_topics(key: str, topics: dict):
+    get_facets_cache().set(key, topics, getattr(settings, "FACETS_CACHE_TIMEOUT", 0))
@@ -0,0 +1,105 @@
+#########################################################################
+#
+# Copyright (C) 2026 Open Source Geospatial Foundation - all rights reserved
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import logging
+from uuid import uuid4
+
+from django.db import connection, transaction, DatabaseError
+from django.db.models.expressions import RawSQL
+
+from geonode.base.models import ResourceBase
+from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class FacetsBatchEngine:
+    """
+    Computes the topics of several facets against the same prefiltered set of resources.
+
+    The (expensive) prefiltered queryset, which includes the visibility filtering, is evaluated
+    only once into a temporary table of resource ids; all the providers are then queried against it.
+    Providers implementing the `get_topics_query` hook return all of their topics with a single
+    query, the other ones are queried through the regular `get_facet_items`.
+
+    Usage:
+        with FacetsBatchEngine(prefiltered) as engine:
+            cnt, items = engine.get_facet_items(provider, start=0, end=10, lang="en", user=user)
+    """
+
+    def __init__(self, queryset):
+        self.prefiltered = queryset
+        self.queryset = queryset
+        self._table = None
+
+    def __enter__(self):
+        self.materialize()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def materialize(self):
+        """
+        Stores the ids of the prefiltered resources into a temporary table.
+        If that is not possible, the prefiltered queryset is used as it is.
+        """
+        table = f"facets_visible_{uuid4().hex[:16]}"
+        sql, params = self.prefiltered.values("id").order_by().query.sql_with_params()
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"CREATE TEMPORARY TABLE {table} AS {sql}", params)
+        except DatabaseError as e:
+            logger.warning(f"Could not materialize the facets prefiltered resources: {e}")
+            return self.queryset
+
+        self._table = table
+        self.queryset = ResourceBase.objects.filter(id__in=RawSQL(f"SELECT id FROM {table}", ()))
+        return self.queryset
+
+    def release(self):
+        if self._table:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE IF EXISTS {self._table}")
+            except DatabaseError as e:
+                logger.warning(f"Could not drop the facets temporary table {self._table}: {e}")
+            self._table = None
+        self.queryset = self.prefiltered
+
+    def get_facet_items(
+        self,
+        provider: FacetProvider,
+        start: int = 0,
+        end: int = DEFAULT_FACET_PAGE_SIZE,
+        lang="en",
+        topic_contains: str = None,
+        keys: set = {},
+        **kwargs,
+    ) -> (int, list):
+        batch = provider.get_topics_query(self.queryset, lang=lang, topic_contains=topic_contains, keys=keys, **kwargs)
+        if batch is None:
+            return provider.get_facet_items(
+                self.queryset, start=start, end=end, lang=lang, topic_contains=topic_contains, keys=keys, **kwargs
+            )
+
+        q, to_topic = batch
+        cnt = q.count()
+        logger.debug("Found %d facets for %s", cnt, provider.name)
+        return cnt, [to_topic(r) for r in q[start:end]]
@@ -100,6 +100,22 @@ class FacetProvider:
         """
         pass
 
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
+        """
+        Optional hook used by the batched facets computation (see `geonode.facets.engine.FacetsBatchEngine`).
+
+        Return a tuple:
+        - a QuerySet returning one row per topic, ordered by decreasing count
+        - a callable translating a row of such QuerySet into a topic record (see get_facet_items())
+        or None if the provider does not support it; in this case get_facet_items() will be called instead.
+        :param queryset: the prefiltered queryset (may be filtered for authorization or other filters)
+        :param lang: the preferred language for the labels
+        :param topic_contains: only returns matching topics
+        :param keys: only returns topics with given keys
+        :return: a tuple (QuerySet, callable) or None
+        """
+        return None
+
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         """
         Return the topics with the requested ids as a list
@@ -56,6 +56,22 @@ class CategoryFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for %s", self.name)
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, topic_contains=topic_contains, keys=keys)
+
+        logger.debug(" PREFILTERED QUERY  ---> %s\n\n", queryset.query)
+        logger.debug(" FINAL QUERY        ---> %s\n\n", q.query)
+
+        cnt = q.count()
+
+        logger.info("Found %d facets for %s", cnt, self.name)
+        logger.debug(" ---> %s\n\n", q.query)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end].all()]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filters = {"resourcebase__in": queryset}
 
         if topic_contains:
@@ -72,27 +88,15 @@ class CategoryFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        logger.debug(" PREFILTERED QUERY  ---> %s\n\n", queryset.query)
-        logger.debug(" ADDITIONAL FILTERS ---> %s\n\n", filters)
-        logger.debug(" FINAL QUERY        ---> %s\n\n", q.query)
-
-        cnt = q.count()
-
-        logger.info("Found %d facets for %s", cnt, self.name)
-        logger.debug(" ---> %s\n\n", q.query)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["identifier"],
                 "label": r["gn_description"],
                 "count": r["count"],
                 "fa_class": r["fa_class"],
             }
-            for r in q[start:end].all()
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = TopicCategory.objects.filter(identifier__in=keys)
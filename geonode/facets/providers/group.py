@@ -57,6 +57,21 @@ class GroupFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for %s", self.name)
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, keys=keys, user=kwargs["user"])
+
+        logger.debug(" PREFILTERED QUERY  ---> %s\n\n", queryset.query)
+        logger.debug(" FINAL QUERY        ---> %s\n\n", q.query)
+
+        cnt = q.count()
+        logger.info("Found %d facets for %s", cnt, self.name)
+        logger.debug(" ---> %s\n\n", q.query)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end].all()]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filters = dict()
         if keys:
             logger.debug("Filtering by keys %r", keys)
@@ -72,26 +87,14 @@ class GroupFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        logger.debug(" PREFILTERED QUERY  ---> %s\n\n", queryset.query)
-        logger.debug(" ADDITIONAL FILTERS ---> %s\n\n", filters)
-        logger.debug(" FINAL QUERY        ---> %s\n\n", q.query)
-
-        cnt = q.count()
-        logger.debug(f" q.count()  {q.count()}")
-        logger.info("Found %d facets for %s", cnt, self.name)
-        logger.debug(" ---> %s\n\n", q.query)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["group__id"],
                 "label": r["group__name"],
                 "count": r["count"],
             }
-            for r in q[start:end].all()
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = GroupProfile.objects.filter(group__id__in=keys)
@@ -22,6 +22,7 @@ import logging
 from django.db.models import Count
 
 from geonode.base.models import HierarchicalKeyword
+from geonode.facets.autocomplete import autocomplete_registry
 from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE, FACET_TYPE_KEYWORD
 
 logger = logging.getLogger(__name__)
@@ -56,13 +57,31 @@ class KeywordFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for %s", self.name)
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, topic_contains=topic_contains, keys=keys)
+
+        cnt = q.count()
+
+        logger.info("Found %d facets for %s", cnt, self.name)
+        logger.debug(" ---> %s\n\n", q.query)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end].all()]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filters = {"resourcebase__in": queryset}
         if topic_contains:
-            filters["name__icontains"] = topic_contains
+            slugs = autocomplete_registry.search_keywords(topic_contains)
+            if slugs is None:
+                filters["name__icontains"] = topic_contains
+            else:
+                filters["slug__in"] = slugs
 
         if keys:
             logger.debug("Filtering by keys %r", keys)
-            filters["slug__in"] = keys
+            slugs = filters.get("slug__in")
+            filters["slug__in"] = [k for k in slugs if k in keys] if slugs is not None else keys
 
         q = (
             HierarchicalKeyword.objects.filter(**filters)
@@ -71,22 +90,14 @@ class KeywordFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        cnt = q.count()
-
-        logger.info("Found %d facets for %s", cnt, self.name)
-        logger.debug(" ---> %s\n\n", q.query)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["slug"],
                 "label": r["name"],
                 "count": r["count"],
             }
-            for r in q[start:end].all()
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = HierarchicalKeyword.objects.filter(slug__in=keys).values("slug", "name")
@@ -56,6 +56,19 @@ class RegionFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for %s", self.name)
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, topic_contains=topic_contains, keys=keys)
+
+        cnt = q.count()
+
+        logger.info("Found %d facets for %s", cnt, self.name)
+        logger.debug(" ---> %s\n\n", q.query)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end].all()]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filters = {"resourcebase__in": queryset}
 
         if topic_contains:
@@ -72,22 +85,14 @@ class RegionFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        cnt = q.count()
-
-        logger.info("Found %d facets for %s", cnt, self.name)
-        logger.debug(" ---> %s\n\n", q.query)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["code"],
                 "label": r["name"],
                 "count": r["count"],
             }
-            for r in q[start:end].all()
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = Region.objects.filter(code__in=keys).values("code", "name")
@@ -19,9 +19,10 @@
 
 import logging
 
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
 
 from geonode.base.models import ThesaurusKeyword, ThesaurusKeywordLabel
+from geonode.facets.autocomplete import autocomplete_registry
 from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE, FACET_TYPE_THESAURUS
 
 logger = logging.getLogger(__name__)
@@ -66,17 +67,45 @@ class ThesaurusFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for %s", self._name)
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, topic_contains=topic_contains, keys=keys)
+
+        logger.debug(" PREFILTERED QUERY ---> %s\n\n", queryset.query)
+        logger.debug(" FINAL QUERY       ---> %s\n\n", q.query)
+
+        cnt = q.count()
+
+        logger.info("Found %d facets for %s", cnt, self._name)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end].all()]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filter = {"thesaurus__identifier": self._name, "resourcebase__in": queryset}
+        label_filter = Q()
 
         if topic_contains:
-            filter["label__icontains"] = topic_contains
+            # matches the localized label, or the alt_label when the keyword is not localized in lang
+            ids = autocomplete_registry.search_thesaurus(self._name, topic_contains, lang=lang)
+            if ids is None:
+                labels = ThesaurusKeywordLabel.objects.filter(keyword=OuterRef("id"), lang=lang)
+                label_filter = Q(Exists(labels.filter(label__icontains=topic_contains))) | (
+                    ~Q(Exists(labels)) & Q(alt_label__icontains=topic_contains)
+                )
+            else:
+                filter["id__in"] = ids
 
         if keys:
             logger.debug("Filtering by keys %r\n", keys)
-            filter["id__in"] = keys
+            if "id__in" in filter:
+                keys = {str(k) for k in keys}
+                filter["id__in"] = [k for k in filter["id__in"] if str(k) in keys]
+            else:
+                filter["id__in"] = keys
 
         q = (
-            ThesaurusKeyword.objects.filter(**filter)
+            ThesaurusKeyword.objects.filter(label_filter, **filter)
             .values("id", "alt_label", "image")
             .annotate(count=Count("resourcebase"))
             .annotate(
@@ -87,27 +116,16 @@ class ThesaurusFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        logger.debug(" PREFILTERED QUERY ---> %s\n\n", queryset.query)
-        logger.debug(" ADDITIONAL FILTERS ---> %s\n\n", filter)
-        logger.debug(" FINAL QUERY       ---> %s\n\n", q.query)
-
-        cnt = q.count()
-
-        logger.info("Found %d facets for %s", cnt, self._name)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["id"],
                 "label": r["localized_label"] or r["alt_label"],
                 "is_localized": r["localized_label"] is not None,
                 "count": r["count"],
                 "image": r["image"],
             }
-            for r in q[start:end].all()
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = (
@@ -56,6 +56,19 @@ class OwnerFacetProvider(FacetProvider):
     ) -> (int, list):
         logger.debug("Retrieving facets for OWNER")
 
+        q, to_topic = self.get_topics_query(queryset, lang=lang, topic_contains=topic_contains, keys=keys)
+
+        cnt = q.count()
+
+        logger.info("Found %d facets for %s", cnt, self.name)
+        logger.debug(" ---> %s\n\n", q.query)
+        logger.debug(" ---> %r\n\n", q.all())
+
+        topics = [to_topic(r) for r in q[start:end]]
+
+        return cnt, topics
+
+    def get_topics_query(self, queryset, lang="en", topic_contains: str = None, keys: set = {}, **kwargs):
         filters = dict()
 
         if topic_contains:
@@ -72,22 +85,14 @@ class OwnerFacetProvider(FacetProvider):
             .order_by("-count")
         )
 
-        cnt = q.count()
-
-        logger.info("Found %d facets for %s", cnt, self.name)
-        logger.debug(" ---> %s\n\n", q.query)
-        logger.debug(" ---> %r\n\n", q.all())
-
-        topics = [
-            {
+        def to_topic(r):
+            return {
                 "key": r["owner"],
                 "label": r["owner__username"],
                 "count": r["count"],
             }
-            for r in q[start:end]
-        ]
 
-        return cnt, topics
+        return q, to_topic
 
     def get_topics(self, keys: list, lang="en", **kwargs) -> list:
         q = get_user_model().objects.filter(id__in=keys).values("id", "username")
@@ -0,0 +1,77 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""signal handlers for geonode.facets"""
+
+from django.apps import apps
+from django.db.models import signals
+
+from geonode.base.models import HierarchicalKeyword, ResourceBase, ThesaurusKeyword, ThesaurusKeywordLabel
+from geonode.security.signals import resource_permissions_changed
+
+from .autocomplete import autocomplete_registry
+from .cache import bump_catalogue_generation
+
+
+def invalidate_facets_cache(**kwargs):
+    bump_catalogue_generation()
+
+
+def keyword_post_save(instance, **kwargs):
+    autocomplete_registry.update_keyword(instance.slug, instance.name)
+
+
+def keyword_post_delete(instance, **kwargs):
+    autocomplete_registry.update_keyword(instance.slug)
+
+
+def thesaurus_keyword_changed(instance, **kwargs):
+    keyword_id = instance.keyword_id if isinstance(instance, ThesaurusKeywordLabel) else instance.id
+    autocomplete_registry.update_thesaurus_keyword(keyword_id)
+
+
+def connect_signals():
+    """
+    Bumps the catalogue generation, thus invalidating the facets cache, whenever a resource is
+    saved or deleted, its keywords or regions change or its permissions are updated.
+    Also refreshes the autocomplete indexes whenever a keyword or a thesaurus label changes.
+    Receivers are bound to the concrete ResourceBase models to preserve the fast deletion of the other models.
+    """
+    for model in apps.get_models():
+        if issubclass(model, ResourceBase):
+            signals.post_save.connect(
+                invalidate_facets_cache, sender=model, dispatch_uid=f"facets_save_{model.__name__}"
+            )
+            signals.post_delete.connect(
+                invalidate_facets_cache, sender=model, dispatch_uid=f"facets_delete_{model.__name__}"
+            )
+    for through in (ResourceBase.keywords.through, ResourceBase.tkeywords.through, ResourceBase.regions.through):
+        signals.m2m_changed.connect(
+            invalidate_facets_cache, sender=through, dispatch_uid=f"facets_m2m_{through.__name__}"
+        )
+    resource_permissions_changed.connect(invalidate_facets_cache, dispatch_uid="facets_permissions")
+
+    # keep the topic_contains autocomplete indexes in sync with the keywords and thesauri labels
+    signals.post_save.connect(keyword_post_save, sender=HierarchicalKeyword, dispatch_uid="facets_keyword_save")
+    signals.post_delete.connect(keyword_post_delete, sender=HierarchicalKeyword, dispatch_uid="facets_keyword_delete")
+    for model in (ThesaurusKeyword, ThesaurusKeywordLabel):
+        signals.post_save.connect(thesaurus_keyword_changed, sender=model, dispatch_uid=f"facets_save_{model.__name__}")
+        signals.post_delete.connect(
+            thesaurus_keyword_changed, sender=model, dispatch_uid=f"facets_delete_{model.__name__}"
+        )
@@ -24,7 +24,7 @@ from uuid import uuid4
 
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 
 from geonode.base.models import (
@@ -39,13 +39,18 @@ from geonode.base.models import (
     GroupProfile,
 )
 from geonode.facets.models import facet_registry
+from geonode.facets.engine import FacetsBatchEngine
+from geonode.facets.cache import facets_cache_stats
+from geonode.facets.autocomplete import AutocompleteRegistry, LabelIndex, autocomplete_registry
 from geonode.facets.providers.baseinfo import FeaturedFacetProvider
 from geonode.facets.providers.category import CategoryFacetProvider
 from geonode.facets.providers.group import GroupFacetProvider
 from geonode.facets.providers.keyword import KeywordFacetProvider
 from geonode.facets.providers.region import RegionFacetProvider
+from geonode.facets.providers.thesaurus import ThesaurusFacetProvider
 from geonode.facets.views import ListFacetsView, GetFacetView
 from geonode.tests.base import GeoNodeBaseTestSupport
+from geonode.security.utils import get_visible_resources
 from django.contrib.auth.models import Group
 
 logger = logging.getLogger(__name__)
@@ -589,6 +594,133 @@ class TestFacets(GeoNodeBaseTestSupport):
                 self.assertIsNotNone(found, f"Topic '{item}' not found in facet {facet} -- {obj}")
                 self.assertEqual(items[item], found.get("count", None), f"Bad count for facet '{facet}:{item}")
 
+    def test_batch_engine(self):
+        prefiltered = get_visible_resources(ResourceBase.objects, self.admin)
+        with FacetsBatchEngine(prefiltered) as engine:
+            self.assertSetEqual(
+                set(prefiltered.values_list("id", flat=True)), set(engine.queryset.values_list("id", flat=True))
+            )
+            for provider in facet_registry.get_providers():
+                cnt, items = provider.get_facet_items(prefiltered, start=0, end=100, lang="en", user=self.admin)
+                batch_cnt, batch_items = engine.get_facet_items(provider, start=0, end=100, lang="en", user=self.admin)
+                self.assertEqual(cnt, batch_cnt, f"Bad total for facet {provider.name}")
+                self.assertListEqual(
+                    sorted((str(i["key"]), i.get("count")) for i in items),
+                    sorted((str(i["key"]), i.get("count")) for i in batch_items),
+                    f"Bad items for facet {provider.name}",
+                )
+                # the pages are sliced in the query, the total is still the whole one
+                page_cnt, page_items = engine.get_facet_items(provider, start=1, end=2, lang="en", user=self.admin)
+                self.assertEqual(batch_cnt, page_cnt)
+                self.assertEqual(min(1, max(0, batch_cnt - 1)), len(page_items))
+
+    @override_settings(FACETS_CACHE="resources", FACETS_CACHE_TIMEOUT=60)
+    def test_topics_cache(self):
+        facets_cache_stats.reset()
+
+        def get_facet(user, **params):
+            req = self.rf.get(reverse("get_facet", args=["category"]), data=params)
+            req.user = user
+            return GetFacetView.as_view()(req, "category")
+
+        self.assertEqual("MISS", get_facet(self.admin)["X-Facets-Cache"])
+        self.assertEqual("HIT", get_facet(self.admin)["X-Facets-Cache"])
+        # different filters, pages or permission scopes are cached separately
+        self.assertEqual("MISS", get_facet(self.admin, page=1)["X-Facets-Cache"])
+        self.assertEqual("MISS", get_facet(self.user)["X-Facets-Cache"])
+        self.assertEqual("HIT", get_facet(self.user)["X-Facets-Cache"])
+        self.assertDictEqual({"hits": 2, "misses": 3, "ratio": 0.4}, facets_cache_stats.as_dict())
+
+        # any resource change invalidates the cache
+        ResourceBase.objects.first().get_real_instance().save()
+        self.assertEqual("MISS", get_facet(self.admin)["X-Facets-Cache"])
+
+    @override_settings(FACETS_CACHE="resources", FACETS_CACHE_TIMEOUT=60)
+    def test_topics_cache_search(self):
+        def get_counts(**params):
+            req = self.rf.get(reverse("get_facet", args=["category"]), data={"search_fields": "title", **params})
+            req.user = self.admin
+            res = GetFacetView.as_view()(req, "category")
+            return {item["key"]: item["count"] for item in json.loads(res.content)["topics"]["items"]}
+
+        # requests differing only by the search are not sharing the cached topics
+        self.assertEqual(3, get_counts(search="dataset_0")["C3"])
+        self.assertEqual(1, get_counts(search="dataset_07")["C3"])
+        self.assertEqual(3, get_counts(search="dataset_0")["C3"])
+
+    def test_topic_contains(self):
+        autocomplete_registry.clear()
+        provider = KeywordFacetProvider()
+        prefiltered = get_visible_resources(ResourceBase.objects, self.admin)
+
+        # terms are matched as substrings whatever their length, as the icontains lookup,
+        # the shorter ones by the database
+        self.assertTrue({"K0", "K1", "K2", "K3"}.issubset(autocomplete_registry.search_keywords("key")))
+        self.assertIsNone(autocomplete_registry.search_keywords("wo"))
+        cnt, items = provider.get_facet_items(prefiltered, topic_contains="wo", lang="en")
+        self.assertEqual(4, cnt)
+        cnt, items = provider.get_facet_items(prefiltered, topic_contains="d3", lang="en")
+        self.assertEqual(1, cnt)
+        self.assertEqual(("K3", 4), (items[0]["key"], items[0]["count"]))
+        self.assertListEqual(["K2"], autocomplete_registry.search_keywords("WORD2"))
+        cnt, items = provider.get_facet_items(prefiltered, topic_contains="word3", lang="en")
+        self.assertEqual(1, cnt)
+        self.assertEqual(("K3", 4), (items[0]["key"], items[0]["count"]))
+
+        # the index is refreshed incrementally
+        kw = HierarchicalKeyword.objects.create(slug="K4", name="Another keyword")
+        self.assertListEqual(["K4"], autocomplete_registry.search_keywords("other"))
+        kw.delete()
+        self.assertListEqual([], autocomplete_registry.search_keywords("other"))
+
+        # thesaurus keywords are matched against the labels localized in the requested lang
+        self.assertListEqual(
+            [self.thesauri_k["0_1"].id], autocomplete_registry.search_thesaurus("t_0", "k1_it", lang="it")
+        )
+        self.assertListEqual([], autocomplete_registry.search_thesaurus("t_0", "k1_it", lang="en"))
+        label = ThesaurusKeywordLabel.objects.get(keyword=self.thesauri_k["0_1"], lang="en")
+        label.label = "Renamed"
+        label.save()
+        self.assertListEqual(
+            [self.thesauri_k["0_1"].id], autocomplete_registry.search_thesaurus("t_0", "renamed", lang="en")
+        )
+        # the same for the labels matched by the database
+        thesaurus_provider = ThesaurusFacetProvider("t_1", "Thesaurus 1", 110, {})
+        cnt, items = thesaurus_provider.get_facet_items(prefiltered, topic_contains="k1", lang="it")
+        self.assertEqual(1, cnt)
+        self.assertEqual(self.thesauri_k["1_1"].id, items[0]["key"])
+        cnt, _ = thesaurus_provider.get_facet_items(prefiltered, topic_contains="it", lang="en")
+        self.assertEqual(0, cnt)
+        autocomplete_registry.clear()
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "autocomplete"}}
+    )
+    def test_autocomplete_generation(self):
+        # two registries, as in two processes sharing the cache
+        registry, other_registry = AutocompleteRegistry(), AutocompleteRegistry()
+        self.assertListEqual([], registry.search_keywords("fresh"))
+        self.assertListEqual([], other_registry.search_keywords("fresh"))
+
+        # a change applied by another process makes both the indexes stale
+        kw = HierarchicalKeyword.objects.create(slug="K5", name="Fresh keyword")
+        registry.update_keyword(kw.slug, kw.name)
+        # a later change does not make the stale index current
+        other_registry.update_keyword("K3", "Keyword3")
+        self.assertListEqual(["K5"], other_registry.search_keywords("fresh"))
+        self.assertListEqual(["K5"], registry.search_keywords("fresh"))
+        kw.delete()
+
+    def test_label_index_large(self):
+        index = LabelIndex((i, f"label{i}") for i in range(5000))
+
+        # short or too common terms are left to the database, instead of binding thousands of keys
+        self.assertIsNone(index.search("la"))
+        self.assertIsNone(index.search("label"))
+        self.assertEqual(111, len(index.search("bel19")))
+        self.assertListEqual([4999], index.search("label4999"))
+        self.assertListEqual([], index.search("label5000"))
+
     def test_user_auth(self):
         # make sure the user authorization pre-filters the visible resources
         # TODO test
@@ -30,6 +30,8 @@ from django.conf import settings
 from geonode.base.api.views import ResourceBaseViewSet
 from geonode.base.models import ResourceBase
 from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE, facet_registry
+from geonode.facets.engine import FacetsBatchEngine
+from geonode.facets.cache import get_cached_topics, get_facets_cache_key, is_facets_cache_enabled, set_cached_topics
 from geonode.security.utils import get_visible_resources
 
 PARAM_PAGE = "page"
@@ -40,6 +42,9 @@ PARAM_INCLUDE_TOPICS = "include_topics"
 PARAM_INCLUDE_CONFIG = "include_config"
 PARAM_TOPIC_CONTAINS = "topic_contains"
 
+# params of the resources list narrowing the prefiltered resources, along with the "filter{...}" ones
+PREFILTER_PARAMS = ("search", "search_fields", "extent", "favorite")
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,14 +61,20 @@ class BaseFacetingView(APIView):
         lang: str = "en",
         topic_contains: str = None,
         keys: set = {},
+        engine: FacetsBatchEngine = None,
         **kwargs,
     ):
         start = page * page_size
         end = start + page_size
 
-        cnt, items = provider.get_facet_items(
-            queryset, start=start, end=end, lang=lang, topic_contains=topic_contains, keys=keys, **kwargs
-        )
+        if engine:
+            cnt, items = engine.get_facet_items(
+                provider, start=start, end=end, lang=lang, topic_contains=topic_contains, keys=keys, **kwargs
+            )
+        else:
+            cnt, items = provider.get_facet_items(
+                queryset, start=start, end=end, lang=lang, topic_contains=topic_contains, keys=keys, **kwargs
+            )
 
         if keys:
             keys.difference_update({str(t["key"]) for t in items})
@@ -88,7 +99,7 @@ class BaseFacetingView(APIView):
         filters = {k: vlist for k, vlist in request.query_params.lists() if k.startswith("filter{")}
         logger.warning(f"FILTERING BY  {filters}")
 
-        if filters:
+        if filters or any(param in request.query_params for param in PREFILTER_PARAMS):
             viewset = ResourceBaseViewSet(request=request, format_kwarg={}, kwargs=filters)
             viewset.initial(request)
             return get_visible_resources(queryset=viewset.filter_queryset(viewset.get_queryset()), user=request.user)
@@ -96,6 +107,38 @@ class BaseFacetingView(APIView):
             # return ResourceBase.objects
             return get_visible_resources(ResourceBase.objects, request.user)
 
+    @classmethod
+    def _get_topics_cache_key(
+        cls,
+        request,
+        provider,
+        lang: str,
+        page: int = 0,
+        page_size: int = DEFAULT_FACET_PAGE_SIZE,
+        topic_contains: str = None,
+        keys: set = {},
+    ):
+        """
+        :return: the key of the cached topics for the requested facet, or None if the cache is disabled
+        """
+        if not is_facets_cache_enabled():
+            return None
+        params = {
+            k: vlist for k, vlist in request.query_params.lists() if k.startswith("filter{") or k in PREFILTER_PARAMS
+        }
+        if "favorite" in params:
+            # the favorites are the user ones, not shared with the permission scope
+            params["favorite_user"] = getattr(request.user, "pk", None) or ""
+        params.update(
+            {
+                PARAM_PAGE: page,
+                PARAM_PAGE_SIZE: page_size,
+                PARAM_TOPIC_CONTAINS: topic_contains or "",
+                "key": sorted(str(k) for k in keys),
+            }
+        )
+        return get_facets_cache_key(provider.name, params, lang, request.user)
+
     @classmethod
     def _resolve_language(cls, request) -> (str, bool):
         """
@@ -136,26 +179,41 @@ class ListFacetsView(BaseFacetingView):
         include_config = self._resolve_boolean(request, PARAM_INCLUDE_CONFIG, False)
 
         facets = []
-        prefiltered = None
-
-        for provider in facet_registry.get_providers():
-            logger.debug("Fetching data from provider %r", provider)
-            info = provider.get_info(lang=lang)
+        engine = None
 
-            if include_config:
-                info["config"] = provider.config
-
-            if add_links:
-                link_args = {PARAM_ADD_LINKS: True}
-                if lang_requested:  # only add lang param if specified in current call
-                    link_args[PARAM_LANG] = lang
-                info["link"] = f"{reverse('get_facet', args=[info['name']])}?{urlencode(link_args)}"
-
-            if include_topics:
-                prefiltered = prefiltered or self._prefilter_topics(request)
-                info["topics"] = self._get_topics(provider, queryset=prefiltered, lang=lang, user=request.user)
-
-            facets.append(info)
+        try:
+            for provider in facet_registry.get_providers():
+                logger.debug("Fetching data from provider %r", provider)
+                info = provider.get_info(lang=lang)
+
+                if include_config:
+                    info["config"] = provider.config
+
+                if add_links:
+                    link_args = {PARAM_ADD_LINKS: True}
+                    if lang_requested:  # only add lang param if specified in current call
+                        link_args[PARAM_LANG] = lang
+                    info["link"] = f"{reverse('get_facet', args=[info['name']])}?{urlencode(link_args)}"
+
+                if include_topics:
+                    cache_key = self._get_topics_cache_key(request, provider, lang)
+                    topics = get_cached_topics(cache_key) if cache_key else None
+                    if topics is None:
+                        if engine is None:
+                            # evaluate the prefiltered resources only once for all the providers
+                            engine = FacetsBatchEngine(self._prefilter_topics(request))
+                            engine.materialize()
+                        topics = self._get_topics(
+                            provider, queryset=engine.queryset, lang=lang, user=request.user, engine=engine
+                        )
+                        if cache_key:
+                            set_cached_topics(cache_key, topics)
+                    info["topics"] = topics
+
+                facets.append(info)
+        finally:
+            if engine:
+                engine.release()
 
         logger.debug("Returning facets %r", facets)
         return JsonResponse({"facets": facets})
@@ -185,17 +243,25 @@ class GetFacetView(BaseFacetingView):
         if include_config:
             info["config"] = provider.config
 
-        qs = self._prefilter_topics(request)
-        topics = self._get_topics(
-            provider,
-            queryset=qs,
-            page=page,
-            page_size=page_size,
-            lang=lang,
-            topic_contains=topic_contains,
-            keys=keys,
-            user=request.user,
+        cache_key = self._get_topics_cache_key(
+            request, provider, lang, page=page, page_size=page_size, topic_contains=topic_contains, keys=keys
         )
+        topics = get_cached_topics(cache_key) if cache_key else None
+        cache_hit = topics is not None
+        if topics is None:
+            qs = self._prefilter_topics(request)
+            topics = self._get_topics(
+                provider,
+                queryset=qs,
+                page=page,
+                page_size=page_size,
+                lang=lang,
+                topic_contains=topic_contains,
+                keys=keys,
+                user=request.user,
+            )
+            if cache_key:
+                set_cached_topics(cache_key, topics)
 
         if add_link:
             exist_prev = page > 0
@@ -218,4 +284,7 @@ class GetFacetView(BaseFacetingView):
 
         info["topics"] = topics
 
-        return JsonResponse(info)
+        response = JsonResponse(info)
+        if cache_key:
+            response["X-Facets-Cache"] = "HIT" if cache_hit else "MISS"
+        return response
@@ -24,7 +24,7 @@ from rest_framework.authentication import SessionAuthentication, BasicAuthentica
 from oauth2_provider.contrib.rest_framework import OAuth2Authentication
 
 from geonode.base.api.filters import DynamicSearchFilter, ExtentFilter
-from geonode.base.api.mixins import AdvertisedListMixin
+from geonode.base.api.mixins import AdvertisedListMixin, ResourceBasePrefetchMixin
 from geonode.base.api.pagination import GeoNodeApiPagination
 from geonode.base.api.permissions import UserHasPerms
 from geonode.base.api.views import ApiPresetsInitializer
@@ -38,7 +38,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class GeoAppViewSet(ApiPresetsInitializer, DynamicModelViewSet, AdvertisedListMixin):
+class GeoAppViewSet(ApiPresetsInitializer, ResourceBasePrefetchMixin, DynamicModelViewSet, AdvertisedListMixin):
     """
     API endpoint that allows geoapps to be viewed or edited.
     """
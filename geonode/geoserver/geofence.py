@@ -22,6 +22,7 @@ import logging
 import requests
 from requests.auth import HTTPBasicAuth
 import traceback
+import typing
 import urllib
 
 logger = logging.getLogger(__name__)
@@ -207,6 +208,10 @@ class Batch:
         operation.update(rule.get_object())
         self.operations.append(operation)
 
+    def add_insert_operation(self, operation: dict):
+        """Add an insert operation collected by another Batch"""
+        self.operations.append(operation)
+
     def length(self) -> int:
         return len(self.operations)
 
@@ -228,6 +233,10 @@ class AutoPriorityBatch(Batch):
         rule.set_priority(self.pri.__next__())
         super().add_insert_rule(rule)
 
+    def add_insert_operation(self, operation: dict):
+        operation["Rule"]["priority"] = self.pri.__next__()
+        super().add_insert_operation(operation)
+
 
 class GeoFenceClient:
     """_summary_
@@ -454,6 +463,36 @@ class GeoFenceUtils:
             logger.debug(tb)
             return False
 
+    def get_layers_rules(self, layers: typing.Iterable, page_size: int = 1000) -> tuple:
+        """Scan all the GeoFence Rules page by page and group the ones related to the given layers
+
+        Returns a dict {(workspace_name, layer_name): [rules]} and the first available priority
+        """
+        rules_by_layer = {tuple(layer): [] for layer in layers}
+        highest_priority = 0
+        page = 0
+        while True:
+            rules = self.geofence.get_rules(page=page, entries=page_size)["rules"] or []
+            for r in rules:
+                highest_priority = max(highest_priority, int(r.get("priority") or 0))
+                key = (r.get("workspace"), r.get("layer"))
+                if r.get("layer") and key in rules_by_layer:
+                    rules_by_layer[key].append(r)
+            if len(rules) < page_size:
+                break
+            page += 1
+
+        logger.debug(f"Scanned {page + 1} pages of rules for {len(rules_by_layer)} layers")
+        return rules_by_layer, highest_priority + 1
+
+    def collect_layers_rules(self, layers: typing.Iterable, page_size: int = 1000) -> tuple:
+        """Scan all the GeoFence Rules page by page and group the ids of the ones related to the given layers
+
+        Returns a dict {(workspace_name, layer_name): [rule ids]} and the first available priority
+        """
+        rules_by_layer, first_priority = self.get_layers_rules(layers, page_size=page_size)
+        return {layer: [r["id"] for r in rules] for layer, rules in rules_by_layer.items()}, first_priority
+
     def get_first_available_priority(self):
         """Get the highest Rules priority"""
         try:
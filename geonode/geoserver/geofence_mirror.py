@@ -0,0 +1,233 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import logging
+import typing
+
+from django.conf import settings
+from django.db import transaction
+
+from geonode.geoserver.helpers import geofence, gf_utils
+from geonode.geoserver.models import GeoFenceLayerRules, GeoFenceRule
+
+logger = logging.getLogger(__name__)
+
+MIRROR_BATCH_SIZE = 1000
+
+# GeoFence JSON attribute -> GeoFenceRule field
+RULE_FIELDS = (
+    ("userName", "user_name"),
+    ("roleName", "role_name"),
+    ("service", "service"),
+    ("request", "request"),
+    ("subfield", "subfield"),
+    ("access", "access"),
+)
+
+
+def rule_signature(fields: dict) -> tuple:
+    """
+    Returns the content of a rule, as a JSON Rule object or GeoFence JSON rule, without its id and priority.
+    """
+
+    def _normalize(value):
+        return None if value in (None, "", "*") else str(value)
+
+    limits = fields.get("limits") or {}
+    limits = tuple(sorted((k, str(v)) for k, v in limits.items() if v is not None)) or None
+    return tuple(_normalize(fields.get(attr)) for attr, _ in RULE_FIELDS) + (limits,)
+
+
+def rules_diff(existing: list, desired: list) -> tuple:
+    """
+    Computes the operations turning the existing rules of a layer into the desired ones.
+
+    :param existing: the (rule id, signature) of the existing rules, ordered by priority
+    :param desired: the insert operations of the desired rules, in order
+    :return: the ids of the rules to be deleted and the insert operations to be run
+
+    Inserted rules always get a lower precedence than the existing ones, so only the longest prefix
+    of the desired rules appearing in the same order among the existing ones can be kept.
+    """
+    kept = set()
+    position = 0
+    matched = 0
+    for operation in desired:
+        signature = rule_signature(operation["Rule"])
+        while position < len(existing) and existing[position][1] != signature:
+            position += 1
+        if position == len(existing):
+            break
+        kept.add(existing[position][0])
+        position += 1
+        matched += 1
+    return [rule_id for rule_id, _ in existing if rule_id not in kept], desired[matched:]
+
+
+class GeoFenceRulesMirror:
+    """
+    Local mirror of the GeoFence rules bound to the layers, allowing to compute the rules to be deleted
+    and inserted for a layer without reading them from GeoFence.
+
+    The rules of a layer are read from GeoFence the first time they are needed, then kept up to date by
+    the synchronization. Any other change to the rules of a layer must "forget" it, so that its rules
+    are read again the next time.
+    """
+
+    def __init__(self, utils=gf_utils, client=geofence):
+        self.gf_utils = utils
+        self.geofence = client
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, "GEOFENCE_RULES_MIRROR_ENABLED", False)
+
+    @staticmethod
+    def _filter_layers(queryset, layers: list, prefix: str = ""):
+        """Yields the queryset filtered by chunks of layer names, the workspaces must be checked by the caller"""
+        names = sorted({layer for _, layer in layers})
+        for i in range(0, len(names), MIRROR_BATCH_SIZE):
+            yield queryset.filter(**{f"{prefix}layer__in": names[i : i + MIRROR_BATCH_SIZE]})
+
+    def get_rules(self, layers: typing.Iterable) -> dict:
+        """
+        Returns the mirrored rules of the layers as a dict {(workspace, layer): [(rule id, signature)]},
+        ordered by priority. The rules of the layers not mirrored yet are read from GeoFence.
+        """
+        layers = {tuple(layer) for layer in layers}
+        mirrored = set()
+        for queryset in self._filter_layers(GeoFenceLayerRules.objects.all(), layers):
+            mirrored.update(key for key in queryset.values_list("workspace", "layer") if key in layers)
+        if layers - mirrored:
+            self.refresh(layers - mirrored)
+
+        rules = {layer: [] for layer in layers}
+        for queryset in self._filter_layers(GeoFenceRule.objects.all(), layers, prefix="layer_rules__"):
+            for rule in queryset.select_related("layer_rules").order_by("priority"):
+                key = (rule.layer_rules.workspace, rule.layer_rules.layer)
+                if key in rules:
+                    rules[key].append((rule.rule_id, rule.signature))
+        return rules
+
+    def refresh(self, layers: typing.Iterable = None):
+        """
+        Reads the rules of the layers from GeoFence, or all of them when no layer is given.
+        """
+        if layers is None:
+            rules_by_layer = self._get_all_rules()
+        else:
+            layers = {tuple(layer) for layer in layers}
+            if len(layers) == 1:
+                workspace, layer = next(iter(layers))
+                gs_rules = self.geofence.get_rules(
+                    workspace=workspace, workspace_any=False, layer=layer, layer_any=False
+                )
+                rules_by_layer = {(workspace, layer): gs_rules["rules"] or []}
+            else:
+                rules_by_layer, _ = self.gf_utils.get_layers_rules(
+                    layers, page_size=getattr(settings, "GEOFENCE_RULES_PAGE_SIZE", 1000)
+                )
+
+        with transaction.atomic():
+            if layers is None:
+                GeoFenceLayerRules.objects.all().delete()
+            else:
+                self.forget(layers)
+            for (workspace, layer), gs_rules in rules_by_layer.items():
+                layer_rules = GeoFenceLayerRules.objects.create(workspace=workspace, layer=layer)
+                GeoFenceRule.objects.bulk_create(
+                    [
+                        GeoFenceRule(
+                            rule_id=r["id"],
+                            priority=r.get("priority") or 0,
+                            layer_rules=layer_rules,
+                            limits=r.get("limits") or None,
+                            **{field: r.get(attr) for attr, field in RULE_FIELDS},
+                        )
+                        for r in gs_rules
+                        if r.get("layer") == layer
+                    ],
+                    batch_size=MIRROR_BATCH_SIZE,
+                )
+        logger.debug(f"Mirrored the GeoFence rules of {len(rules_by_layer)} layers")
+
+    def _get_all_rules(self) -> dict:
+        page_size = getattr(settings, "GEOFENCE_RULES_PAGE_SIZE", 1000)
+        rules_by_layer = {}
+        page = 0
+        while True:
+            rules = self.geofence.get_rules(page=page, entries=page_size)["rules"] or []
+            for r in rules:
+                if r.get("layer"):
+                    rules_by_layer.setdefault((r.get("workspace"), r["layer"]), []).append(r)
+            if len(rules) < page_size:
+                return rules_by_layer
+            page += 1
+
+    def forget(self, layers: typing.Iterable = None):
+        """
+        Drops the mirrored rules of the layers, or all of them when no layer is given.
+        """
+        if layers is None:
+            GeoFenceLayerRules.objects.all().delete()
+            return
+        layers = {tuple(layer) for layer in layers}
+        for queryset in self._filter_layers(GeoFenceLayerRules.objects.all(), layers):
+            ids = [
+                _id
+                for _id, workspace, layer in queryset.values_list("id", "workspace", "layer")
+                if (workspace, layer) in layers
+            ]
+            GeoFenceLayerRules.objects.filter(id__in=ids).delete()
+
+    def applied(self, deleted: typing.Iterable, inserted_layers: typing.Iterable):
+        """
+        Updates the mirror after a batch has been run: inserted rules get their id from GeoFence only,
+        so the layers with inserted rules are read again.
+        """
+        deleted = list(deleted)
+        for i in range(0, len(deleted), MIRROR_BATCH_SIZE):
+            GeoFenceRule.objects.filter(rule_id__in=deleted[i : i + MIRROR_BATCH_SIZE]).delete()
+        inserted_layers = set(inserted_layers)
+        if inserted_layers:
+            self.refresh(inserted_layers)
+
+    def check(self) -> dict:
+        """
+        Compares the mirror with the GeoFence rules.
+        :return: the layers whose mirrored rules differ from the GeoFence ones, with the ids of the differing rules
+        """
+        gs_rules = self._get_all_rules()
+        drift = {}
+        mirrored = {}
+        for rule in GeoFenceRule.objects.select_related("layer_rules"):
+            mirrored.setdefault((rule.layer_rules.workspace, rule.layer_rules.layer), {})[rule.rule_id] = (
+                rule.priority,
+                rule.signature,
+            )
+        for layer in GeoFenceLayerRules.objects.values_list("workspace", "layer"):
+            current = {r["id"]: (r.get("priority") or 0, rule_signature(r)) for r in gs_rules.get(layer, [])}
+            _mirrored = mirrored.get(layer, {})
+            differing = {_id for _id in current.keys() | _mirrored.keys() if current.get(_id) != _mirrored.get(_id)}
+            if differing:
+                drift[layer] = sorted(differing)
+        return drift
+
+
+rules_mirror = GeoFenceRulesMirror()
@@ -24,16 +24,19 @@ import time
 import uuid
 import json
 import errno
+import hashlib
 import typing
 import logging
 import datetime
 import tempfile
+import threading
 import traceback
 import dataclasses
 
 from shutil import copyfile
 from itertools import cycle
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from os.path import basename, splitext, isfile
 from urllib.parse import urlparse, urlencode, urlsplit, urljoin
 from bs4 import BeautifulSoup
@@ -41,7 +44,8 @@ import xml.etree.ElementTree as ET
 
 from django.conf import settings
 from django.utils import timezone
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connections, transaction
 from django.contrib.auth import get_user_model
 from django.utils.module_loading import import_string
 from django.core.exceptions import ImproperlyConfigured
@@ -589,6 +593,89 @@ def delete_from_postgis(dataset_name, store):
             logger.error("Error closing PostGIS conn %s:%s", dataset_name, str(e))
 
 
+def _slurp_dataset(resource, owner, execute_signals):
+    """
+    Creates or updates the GeoNode dataset of a GeoServer resource.
+    Returns the dataset and whether it has been created.
+    """
+    from geonode.resource.manager import resource_manager
+
+    name = resource.name
+    the_store = resource.store
+    workspace = the_store.workspace
+    created = False
+    layer = Dataset.objects.filter(name=name, workspace=workspace.name).first()
+    try:
+        if not layer:
+            layer = resource_manager.create(
+                str(uuid.uuid4()),
+                resource_type=Dataset,
+                defaults=dict(
+                    name=name,
+                    workspace=workspace.name,
+                    store=the_store.name,
+                    subtype=get_dataset_storetype(the_store.resource_type),
+                    alternate=f"{workspace.name}:{resource.name}",
+                    title=resource.title or _("No title provided"),
+                    abstract=resource.abstract or _("No abstract provided"),
+                    owner=owner,
+                ),
+            )
+            created = True
+        # Hide the resource until finished
+        layer.set_processing_state("RUNNING")
+        bbox = resource.native_bbox
+        ll_bbox = resource.latlon_bbox
+        try:
+            layer.set_bbox_polygon([bbox[0], bbox[2], bbox[1], bbox[3]], resource.projection)
+        except GeoNodeException as e:
+            if not ll_bbox:
+                raise
+            else:
+                logger.exception(e)
+                layer.srid = "EPSG:4326"
+        layer.set_ll_bbox_polygon([ll_bbox[0], ll_bbox[2], ll_bbox[1], ll_bbox[3]])
+
+        # sync permissions in GeoFence
+        perm_spec = json.loads(_perms_info_json(layer))
+        resource_manager.set_permissions(layer.uuid, permissions=perm_spec)
+
+        # recalculate the layer statistics
+        set_attributes_from_geoserver(layer, overwrite=True)
+
+        # in some cases we need to explicitily save the resource to execute the signals
+        # (for sure when running updatelayers)
+        resource_manager.update(layer.uuid, instance=layer, notify=execute_signals)
+
+        # Creating the Thumbnail
+        resource_manager.set_thumbnail(layer.uuid, overwrite=True, check_bbox=False)
+    except Exception:
+        # Hide the resource until finished
+        if layer:
+            layer.set_processing_state("FAILED")
+        raise
+    return layer, created
+
+
+def _get_slurp_resource_key(resource):
+    return f"{resource.workspace.name}:{resource.name}"
+
+
+def _read_slurp_cursor(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f).get("cursor")
+
+
+def _write_slurp_cursor(path, position):
+    # written atomically, an interruption while saving must not lose the previous cursor
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"cursor": position}, f)
+    os.replace(tmp_path, path)
+
+
 def gs_slurp(
     ignore_errors=False,
     verbosity=1,
@@ -602,13 +689,21 @@ def gs_slurp(
     remove_deleted=False,
     permissions=None,
     execute_signals=False,
+    workers=1,
+    chunk_size=None,
+    cursor=None,
+    dry_run=False,
 ):
     """Configure the layers available in GeoServer in GeoNode.
     It returns a list of dictionaries with the name of the layer,
     the result of the operation and the errors and traceback if it failed.
-    """
-    from geonode.resource.manager import resource_manager
 
+    The layers are processed by chunks of *chunk_size* (default settings.GS_SLURP_CHUNK_SIZE),
+    concurrently if *workers* is greater than 1.
+    *cursor*: path of a file recording the progress, a new run with the same file resumes after the last
+        layer of the completed chunks. The file is removed once all the layers have been processed.
+    *dry_run*: only report the layers which would be created, updated or deleted.
+    """
     if console is None:
         console = open(os.devnull, "w")
 
@@ -696,6 +791,16 @@ def gs_slurp(
     # i.e. look for matching layers in GeoNode and also disable?
     # disabled_resources = [k for k in resources if k.enabled == "false"]
 
+    # resume after the cursor of a previous run, the resources are processed in a stable order
+    position = None
+    if cursor:
+        resources = sorted(resources, key=_get_slurp_resource_key)
+        position = _read_slurp_cursor(cursor)
+        if position:
+            resources = [k for k in resources if _get_slurp_resource_key(k) > position]
+            if verbosity > 0:
+                print(f"Resuming after {position}", file=console)
+
     number = len(resources)
     if verbosity > 0:
         msg = "Found %d layers, starting processing" % number
@@ -710,63 +815,28 @@ def gs_slurp(
         "layers": [],
         "deleted_datasets": [],
     }
+    if dry_run:
+        output["dry_run"] = True
     start = datetime.datetime.now(timezone.get_current_timezone())
-    for i, resource in enumerate(resources):
+    output_lock = threading.Lock()
+
+    def _slurp_resource(i, resource):
         name = resource.name
-        the_store = resource.store
-        workspace = the_store.workspace
         layer = None
+        if dry_run:
+            # only report the datasets which would be created or updated
+            workspace = resource.workspace
+            exists = Dataset.objects.filter(name=name, workspace=workspace.name).exists()
+            status = "to_update" if exists else "to_create"
+            with output_lock:
+                output["stats"]["updated" if exists else "created"] += 1
+                output["layers"].append({"name": name, "status": status})
+                if verbosity > 0:
+                    print(f"[{status}] Dataset {name} ({(i + 1)}/{number})", file=console)
+            return
         try:
-            created = False
-            layer = Dataset.objects.filter(name=name, workspace=workspace.name).first()
-            if not layer:
-                layer = resource_manager.create(
-                    str(uuid.uuid4()),
-                    resource_type=Dataset,
-                    defaults=dict(
-                        name=name,
-                        workspace=workspace.name,
-                        store=the_store.name,
-                        subtype=get_dataset_storetype(the_store.resource_type),
-                        alternate=f"{workspace.name}:{resource.name}",
-                        title=resource.title or _("No title provided"),
-                        abstract=resource.abstract or _("No abstract provided"),
-                        owner=owner,
-                    ),
-                )
-                created = True
-            # Hide the resource until finished
-            layer.set_processing_state("RUNNING")
-            bbox = resource.native_bbox
-            ll_bbox = resource.latlon_bbox
-            try:
-                layer.set_bbox_polygon([bbox[0], bbox[2], bbox[1], bbox[3]], resource.projection)
-            except GeoNodeException as e:
-                if not ll_bbox:
-                    raise
-                else:
-                    logger.exception(e)
-                    layer.srid = "EPSG:4326"
-            layer.set_ll_bbox_polygon([ll_bbox[0], ll_bbox[2], ll_bbox[1], ll_bbox[3]])
-
-            # sync permissions in GeoFence
-            perm_spec = json.loads(_perms_info_json(layer))
-            resource_manager.set_permissions(layer.uuid, permissions=perm_spec)
-
-            # recalculate the layer statistics
-            set_attributes_from_geoserver(layer, overwrite=True)
-
-            # in some cases we need to explicitily save the resource to execute the signals
-            # (for sure when running updatelayers)
-            resource_manager.update(layer.uuid, instance=layer, notify=execute_signals)
-
-            # Creating the Thumbnail
-            resource_manager.set_thumbnail(layer.uuid, overwrite=True, check_bbox=False)
-
+            layer, created = _slurp_dataset(resource, owner, execute_signals)
         except Exception as e:
-            # Hide the resource until finished
-            if layer:
-                layer.set_processing_state("FAILED")
             if ignore_errors:
                 status = "failed"
                 exception_type, error, traceback = sys.exc_info()
@@ -792,21 +862,72 @@ def gs_slurp(
                     layer.set_permissions(permissions)
 
                 status = "created"
-                output["stats"]["created"] += 1
             else:
                 status = "updated"
-                output["stats"]["updated"] += 1
 
         msg = f"[{status}] Dataset {name} ({(i + 1)}/{number})"
         info = {"name": name, "status": status}
         if status == "failed":
-            output["stats"]["failed"] += 1
             info["traceback"] = traceback
             info["exception_type"] = exception_type
             info["error"] = error
-        output["layers"].append(info)
-        if verbosity > 0:
-            print(msg, file=console)
+        with output_lock:
+            output["stats"][status] += 1
+            output["layers"].append(info)
+            if verbosity > 0:
+                print(msg, file=console)
+
+    def _slurp_chunk(offset, chunk):
+        try:
+            for i, resource in enumerate(chunk, start=offset):
+                if stop.is_set():
+                    return False
+                _slurp_resource(i, resource)
+            return True
+        except Exception:
+            stop.set()
+            raise
+        finally:
+            if workers > 1:
+                # close the DB connections opened by this thread
+                connections.close_all()
+
+    # the resources are processed by chunks, the cursor moves forward once all the previous chunks are done
+    chunk_size = max(1, chunk_size or getattr(settings, "GS_SLURP_CHUNK_SIZE", 50))
+    chunks = [resources[i : i + chunk_size] for i in range(0, number, chunk_size)]
+    stop = threading.Event()
+    done_chunks = set()
+    next_chunk = 0
+
+    def _chunk_done(index):
+        nonlocal next_chunk, position
+        done_chunks.add(index)
+        while next_chunk in done_chunks:
+            position = _get_slurp_resource_key(chunks[next_chunk][-1])
+            next_chunk += 1
+        if cursor and not dry_run:
+            _write_slurp_cursor(cursor, position)
+
+    if workers > 1:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gs-slurp")
+        try:
+            futures = {
+                executor.submit(_slurp_chunk, index * chunk_size, chunk): index for index, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    _chunk_done(futures[future])
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    else:
+        for index, chunk in enumerate(chunks):
+            _slurp_chunk(index * chunk_size, chunk)
+            _chunk_done(index)
+
+    # a complete run leaves no cursor behind, the next run processes all the layers again
+    if cursor and not dry_run and os.path.exists(cursor):
+        os.remove(cursor)
 
     if remove_deleted:
         q = Dataset.objects.filter()
@@ -865,15 +986,19 @@ def gs_slurp(
                 layer.workspace,
                 layer.store,
             )
-            try:
-                # delete ratings, and taggit tags:
-                layer.keywords.clear()
-
-                layer.delete()
+            if dry_run:
                 output["stats"]["deleted"] += 1
-                status = "delete_succeeded"
-            except Exception:
-                status = "delete_failed"
+                status = "to_delete"
+            else:
+                try:
+                    # delete ratings, and taggit tags:
+                    layer.keywords.clear()
+
+                    layer.delete()
+                    output["stats"]["deleted"] += 1
+                    status = "delete_succeeded"
+                except Exception:
+                    status = "delete_failed"
 
             msg = f"[{status}] Dataset {layer.name} ({(i + 1)}/{number_deleted})"
             info = {"name": layer.name, "status": status}
@@ -906,6 +1031,20 @@ def get_stores(store_type=None):
     return store_list
 
 
+# fields of the Attribute model storing its statistics
+ATTRIBUTE_STATS_FIELDS = (
+    "count",
+    "min",
+    "max",
+    "average",
+    "median",
+    "stddev",
+    "sum",
+    "unique_values",
+    "last_stats_updated",
+)
+
+
 def set_attributes(layer, attribute_map, overwrite=False, attribute_stats=None):
     """*layer*: a geonode.layers.models.Dataset instance
     *attribute_map*: a list of 2-lists specifying attribute names and types,
@@ -926,63 +1065,101 @@ def set_attributes(layer, attribute_map, overwrite=False, attribute_stats=None):
         if len(attribute) == 2:
             attribute.extend((None, None, 0))
 
-    attributes = layer.attribute_set.all()
-    # Delete existing attributes if they no longer exist in an updated layer
-    for la in attributes:
-        lafound = False
-        for attribute in attribute_map:
-            field, ftype, description, label, display_order = attribute
-            if field == la.attribute:
-                lafound = True
-                # store description and attribute_label in attribute_map
-                attribute[attribute_map_dict["description"]] = la.description
-                attribute[attribute_map_dict["label"]] = la.attribute_label
-                attribute[attribute_map_dict["display_order"]] = la.display_order
+    # Existing attributes, loaded once and grouped by name
+    existing = defaultdict(list)
+    for la in layer.attribute_set.all():
+        existing[la.attribute].append(la)
+    attribute_map_fields = {attribute[attribute_map_dict["field"]] for attribute in attribute_map}
+
+    to_delete = []
+    kept = {}
+    remaining = 0
+    for field, las in existing.items():
+        lafound = field in attribute_map_fields
+        if lafound:
+            # store description and attribute_label in attribute_map
+            la = las[-1]
+            for attribute in attribute_map:
+                if attribute[attribute_map_dict["field"]] == field:
+                    attribute[attribute_map_dict["description"]] = la.description
+                    attribute[attribute_map_dict["label"]] = la.attribute_label
+                    attribute[attribute_map_dict["display_order"]] = la.display_order
         if overwrite or not lafound:
-            logger.debug("Going to delete [%s] for [%s]", la.attribute, layer.name)
-            la.delete()
+            # Delete existing attributes if they no longer exist in an updated layer
+            logger.debug("Going to delete [%s] for [%s]", field, layer.name)
+            to_delete.extend(la.id for la in las)
+            continue
+        remaining += len(las)
+        if len(las) == 1:
+            kept[field] = las[0]
+        else:
+            # duplicated attributes are replaced by a new one
+            to_delete.extend(la.id for la in las)
 
-    # Add new layer attributes if they doesn't exist already
-    if attribute_map:
-        iter = len(Attribute.objects.filter(dataset=layer)) + 1
-        for attribute in attribute_map:
-            field, ftype, description, label, display_order = attribute
-            if field:
-                _gs_attrs = Attribute.objects.filter(dataset=layer, attribute=field)
-                if _gs_attrs.count() == 1:
-                    la = _gs_attrs.get()
-                else:
-                    if _gs_attrs.exists():
-                        _gs_attrs.delete()
-                    la = Attribute.objects.create(dataset=layer, attribute=field)
-                    la.visible = ftype.find("gml:") != 0
-                    la.attribute_type = ftype
-                    la.description = description
-                    la.attribute_label = label
-                    la.display_order = iter
-                    iter += 1
-                if not attribute_stats or layer.name not in attribute_stats or field not in attribute_stats[layer.name]:
-                    result = None
-                else:
-                    result = attribute_stats[layer.name][field]
-                if result:
-                    logger.debug("Generating layer attribute statistics")
-                    la.count = result["Count"]
-                    la.min = result["Min"]
-                    la.max = result["Max"]
-                    la.average = result["Average"]
-                    la.median = result["Median"]
-                    la.stddev = result["StandardDeviation"]
-                    la.sum = result["Sum"]
-                    la.unique_values = result["unique_values"]
-                    la.last_stats_updated = datetime.datetime.now(timezone.get_current_timezone())
-                try:
-                    la.save()
-                except Exception as e:
-                    logger.exception(e)
-    else:
+    if not attribute_map:
         logger.debug("No attributes found")
 
+    # Add new layer attributes if they doesn't exist already
+    to_create = {}
+    to_update = {}
+    iter = remaining + 1
+    for attribute in attribute_map:
+        field, ftype, description, label, display_order = attribute
+        if not field:
+            continue
+        if field in kept:
+            la = kept[field]
+            to_update[field] = la
+        elif field in to_create:
+            la = to_create[field]
+        else:
+            la = Attribute(
+                dataset=layer,
+                attribute=field,
+                visible=ftype.find("gml:") != 0,
+                attribute_type=ftype,
+                description=description,
+                attribute_label=label,
+                display_order=iter,
+            )
+            iter += 1
+            to_create[field] = la
+        if not attribute_stats or layer.name not in attribute_stats or field not in attribute_stats[layer.name]:
+            result = None
+        else:
+            result = attribute_stats[layer.name][field]
+        if result:
+            logger.debug("Generating layer attribute statistics")
+            la.count = result["Count"]
+            la.min = result["Min"]
+            la.max = result["Max"]
+            la.average = result["Average"]
+            la.median = result["Median"]
+            la.stddev = result["StandardDeviation"]
+            la.sum = result["Sum"]
+            la.unique_values = result["unique_values"]
+            la.last_stats_updated = datetime.datetime.now(timezone.get_current_timezone())
+        elif field in to_update:
+            # nothing changed
+            del to_update[field]
+
+    # Apply the changes with one query per kind
+    try:
+        with transaction.atomic():
+            if to_delete:
+                Attribute.objects.filter(id__in=to_delete).delete()
+            Attribute.objects.bulk_create(to_create.values())
+            Attribute.objects.bulk_update(to_update.values(), ATTRIBUTE_STATS_FIELDS)
+    except Exception as e:
+        # fall back to saving the attributes one by one, not to lose all of them because of an invalid one
+        logger.exception(e)
+        Attribute.objects.filter(id__in=to_delete).delete()
+        for la in list(to_create.values()) + list(to_update.values()):
+            try:
+                la.save()
+            except Exception as e:
+                logger.exception(e)
+
 
 def set_attributes_from_geoserver(layer, overwrite=False):
     """
@@ -1087,17 +1264,19 @@ def set_attributes_from_geoserver(layer, overwrite=False):
     # Get attribute statistics & package for call to really_set_attributes()
     attribute_stats = defaultdict(dict)
     # Add new layer attributes if they don't already exist
+    existing_fields = set(Attribute.objects.filter(dataset=layer).values_list("attribute", flat=True))
+    aggregable_fields = []
     for attribute in attribute_map:
         field, ftype = attribute
         if field is not None:
-            if Attribute.objects.filter(dataset=layer, attribute=field).exists():
+            if field in existing_fields:
                 continue
             elif is_dataset_attribute_aggregable(layer.subtype, field, ftype):
-                logger.debug("Generating layer attribute statistics")
-                result = get_attribute_statistics(layer.alternate or layer.typename, field)
-            else:
-                result = None
-            attribute_stats[layer.name][field] = result
+                aggregable_fields.append(field)
+            attribute_stats[layer.name][field] = None
+    if aggregable_fields:
+        logger.debug("Generating layer attribute statistics")
+        attribute_stats[layer.name].update(get_attributes_statistics(layer, aggregable_fields))
     set_attributes(layer, attribute_map, overwrite=overwrite, attribute_stats=attribute_stats)
 
 
@@ -1306,6 +1485,125 @@ def get_attribute_statistics(dataset_name, field):
         logger.exception("Error generating layer aggregate statistics")
 
 
+def get_attributes_statistics(layer, fields):
+    """
+    Generate the statistics of several attributes of a layer, as get_attribute_statistics does for one.
+
+    The statistics are computed with a single query for the layers stored in the OGC server datastore,
+    with concurrent WPS requests (settings.ATTRIBUTE_STATISTICS_MAX_WORKERS) for the others, and cached
+    until the layer data changes.
+
+    :returns: dictionary of the statistics (or None) by field
+    """
+    if not fields:
+        return {}
+    if not ogc_server_settings.WPS_ENABLED:
+        return {field: None for field in fields}
+
+    marker = get_dataset_statistics_marker(layer)
+    keys = {field: _get_attribute_statistics_cache_key(layer, field, marker) for field in fields}
+    cached = cache.get_many(list(keys.values()))
+    results = {field: cached[key] for field, key in keys.items() if key in cached}
+    missing = [field for field in fields if field not in results]
+    if not missing:
+        return results
+
+    computed = None
+    if is_datastore_dataset(layer):
+        computed = postgis_attributes_statistics(layer, missing)
+    if computed is None:
+
+        def _get_attribute_statistics(field):
+            try:
+                return get_attribute_statistics(layer.alternate or layer.typename, field)
+            finally:
+                # close the DB connections opened by this thread, if any
+                connections.close_all()
+
+        max_workers = min(getattr(settings, "ATTRIBUTE_STATISTICS_MAX_WORKERS", 4), len(missing))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="attribute-stats") as executor:
+            computed = dict(zip(missing, executor.map(_get_attribute_statistics, missing)))
+
+    cache.set_many(
+        {keys[field]: result for field, result in computed.items() if result is not None},
+        getattr(settings, "ATTRIBUTE_STATISTICS_CACHE_TIMEOUT", 86400),
+    )
+    results.update(computed)
+    return results
+
+
+def _get_attribute_statistics_cache_key(layer, field, marker):
+    key = f"{layer.alternate or layer.typename}|{field}|{marker}"
+    return f"attribute_statistics:{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+
+# schema of the tables of the datastore, the GeoServer default as the stores are created without one
+DATASTORE_SCHEMA = "public"
+
+
+def is_datastore_dataset(layer):
+    """Whether the layer data is stored in a table of the OGC server datastore, reachable by GeoNode"""
+    datastore = ogc_server_settings.DATASTORE
+    if not datastore or datastore not in settings.DATABASES:
+        return False
+    # the GeoServer store of the datastore is named after its database
+    store_name = ogc_server_settings.datastore_db.get("NAME")
+    return bool(store_name) and layer.store == store_name
+
+
+def get_dataset_statistics_marker(layer):
+    """
+    Returns a marker of the last modification of the layer data: its last update in GeoNode and,
+    for the layers stored in the datastore, the counters of the rows modifications of their table.
+    """
+    marker = layer.last_updated.isoformat() if layer.last_updated else ""
+    if is_datastore_dataset(layer):
+        try:
+            with connections[ogc_server_settings.DATASTORE].cursor() as cursor:
+                cursor.execute(
+                    "SELECT n_tup_ins, n_tup_upd, n_tup_del FROM pg_stat_user_tables "
+                    "WHERE schemaname = %s AND relname = %s",
+                    [DATASTORE_SCHEMA, layer.name],
+                )
+                row = cursor.fetchone()
+            if row:
+                marker = f"{marker}|{'-'.join(str(value) for value in row)}"
+        except Exception as e:
+            logger.debug(f"Could not read the modifications of the table {layer.name}: {e}")
+    return marker
+
+
+def postgis_attributes_statistics(layer, fields):
+    """
+    Derive the aggregate statistics of the attributes of a layer stored in the datastore, with a single query.
+    The values are formatted as the WPS ones.
+
+    :returns: dictionary of the statistics by field, None if the query failed
+    """
+    aggregates = ("count({})", "min({})", "max({})", "avg({})", "percentile_cont(0.5) WITHIN GROUP (ORDER BY {})")
+    aggregates += ("stddev_pop({})", "sum({})")
+    connection = connections[ogc_server_settings.DATASTORE]
+    quote_name = connection.ops.quote_name
+    columns = [aggregate.format(quote_name(field)) for field in fields for aggregate in aggregates]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {quote_name(DATASTORE_SCHEMA)}.{quote_name(layer.name)}")
+            row = cursor.fetchone()
+    except Exception as e:
+        logger.debug(f"Could not derive the statistics of {layer.name} from the datastore: {e}")
+        return None
+
+    results = {}
+    for index, field in enumerate(fields):
+        count, *values = row[index * len(aggregates) : (index + 1) * len(aggregates)]
+        result = {"Count": count or 0}
+        for name, value in zip(["Min", "Max", "Average", "Median", "StandardDeviation", "Sum"], values):
+            result[name] = str(value) if value is not None else "NA"
+        result["unique_values"] = "NA"
+        results[field] = result
+    return results
+
+
 def get_wcs_record(instance, retry=True):
     wcs = WebCoverageService(f"{ogc_server_settings.LOCATION}wcs", "1.0.0")
     key = f"{instance.workspace}:{instance.name}"
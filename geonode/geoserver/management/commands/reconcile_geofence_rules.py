@@ -0,0 +1,82 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+from django.core.management.base import BaseCommand
+
+from geonode.layers.models import Dataset
+from geonode.utils import get_dataset_workspace
+from geonode.geoserver.geofence import Batch
+from geonode.geoserver.geofence_mirror import rules_diff, rules_mirror
+from geonode.geoserver.security import _collect_dataset_perms_rules, sync_resources_with_guardian
+
+
+class Command(BaseCommand):
+    """
+    Detects the drift between the local mirror of the GeoFence rules, the actual GeoFence rules
+    and the permissions of the datasets, and repairs it.
+    """
+
+    help = 'Reconcile the GeoFence rules with the local mirror and the permissions of the datasets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-f',
+            '--filter',
+            dest="filter",
+            default=None,
+            help="Only check the datasets that match the given filter.")
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            dest="fix",
+            default=False,
+            help="Sync the GeoFence rules of the datasets not matching their permissions.")
+
+    def handle(self, **options):
+        drift = rules_mirror.check()
+        for (workspace, layer), rule_ids in drift.items():
+            print(f"Mirror drift for {workspace}:{layer}: rules {rule_ids}")
+        print(f"{len(drift)} layers with a mirror drift, reloading the mirror")
+        rules_mirror.refresh()
+
+        datasets = Dataset.objects.all().order_by('name')
+        if options.get('filter'):
+            datasets = datasets.filter(name__icontains=options.get('filter'))
+        layers = {dataset.id: (get_dataset_workspace(dataset), dataset.name) for dataset in datasets}
+        mirrored_rules = rules_mirror.get_rules(layers.values())
+
+        drifted = []
+        for dataset in datasets:
+            try:
+                desired = Batch()
+                _collect_dataset_perms_rules(dataset, desired)
+                deleted, inserted = rules_diff(mirrored_rules[layers[dataset.id]], desired.operations)
+            except Exception as e:
+                print(f"Could not check the rules of {dataset.alternate}: {e}")
+                continue
+            if deleted or inserted:
+                print(f"Permissions drift for {dataset.alternate}: {len(deleted)} rules to delete, {len(inserted)} to insert")
+                drifted.append(dataset)
+        print(f"{len(drifted)} datasets with GeoFence rules not matching their permissions")
+
+        if drifted and options.get('fix'):
+            for dataset in drifted:
+                dataset.set_dirty_state()
+            sync_resources_with_guardian()
+            print(f"Synched the GeoFence rules of {len(drifted)} datasets")
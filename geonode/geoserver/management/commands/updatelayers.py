@@ -84,6 +84,30 @@ class Command(BaseCommand):
             dest="permissions",
             default=None,
             help="Permissions to apply to each layer")
+        parser.add_argument(
+            '--workers',
+            dest='workers',
+            type=int,
+            default=1,
+            help='Number of layers processed concurrently (Default 1)')
+        parser.add_argument(
+            '--chunk-size',
+            dest='chunk_size',
+            type=int,
+            default=None,
+            help='Number of layers of the chunks the progress is recorded by (Default settings.GS_SLURP_CHUNK_SIZE)')
+        parser.add_argument(
+            '--cursor',
+            dest='cursor',
+            default=None,
+            help='File recording the progress, a new run with the same file resumes where the previous one stopped. '
+            'The file is removed once all the layers have been processed')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            default=False,
+            help='Only report the layers which would be created, updated or deleted.')
 
     def handle(self, **options):
         ignore_errors = options.get('ignore_errors')
@@ -118,7 +142,18 @@ class Command(BaseCommand):
             skip_geonode_registered=skip_geonode_registered,
             remove_deleted=remove_deleted,
             permissions=permissions,
-            execute_signals=True)
+            execute_signals=True,
+            workers=options.get('workers'),
+            chunk_size=options.get('chunk_size'),
+            cursor=options.get('cursor'),
+            dry_run=options.get('dry_run'))
+
+        if options.get('dry_run'):
+            print(f"\n{output['stats']['created']} layers to create")
+            print(f"{output['stats']['updated']} layers to update")
+            if remove_deleted:
+                print(f"{output['stats']['deleted']} layers to delete")
+            return
 
         if verbosity > 1:
             print("\nDetailed report of failures:")
@@ -47,6 +47,7 @@ from geonode.security.permissions import (
 from geonode.resource.manager import ResourceManager, ResourceManagerInterface
 from geonode.geoserver.signals import geofence_rule_assign
 from .geofence import AutoPriorityBatch
+from .geofence_mirror import rules_mirror
 from .tasks import geoserver_set_style, geoserver_delete_map, geoserver_create_style, geoserver_cascading_delete
 from .helpers import (
     SpatialFilesLayerType,
@@ -422,6 +423,7 @@ class GeoServerResourceManager(ResourceManagerInterface):
                     if not getattr(settings, "DELAYED_SECURITY_SIGNALS", False):
                         workspace = get_dataset_workspace(instance)
                         removed = gf_utils.delete_layer_rules(workspace, instance.name)
+                        rules_mirror.forget([(workspace, instance.name)])
                         if removed:
                             invalidate_geofence_cache()
                     else:
@@ -456,97 +458,16 @@ class GeoServerResourceManager(ResourceManagerInterface):
                             batch = AutoPriorityBatch(
                                 gf_utils.get_first_available_priority(), f"Set permission for resource {_resource}"
                             )
-
-                            workspace = get_dataset_workspace(_resource)
-
-                            if not created:
-                                gf_utils.collect_delete_layer_rules(workspace, _resource.name, batch)
-
-                            exist_geolimits = None
-                            _owner = owner or _resource.owner
-
-                            if permissions is not None and len(permissions):
-                                # Owner
-                                perms = (
-                                    OWNER_PERMISSIONS.copy()
-                                    + DATASET_ADMIN_PERMISSIONS.copy()
-                                    + DOWNLOAD_PERMISSIONS.copy()
-                                )
-                                create_geofence_rules(_resource, perms, _owner, None, batch)
-                                exist_geolimits = exist_geolimits or has_geolimits(_resource, _owner, None)
-
-                                deferred_anon_perms = []
-
-                                # All the other users
-                                if "users" in permissions and len(permissions["users"]) > 0:
-                                    for user, user_perms in permissions["users"].items():
-                                        _user = get_user_model().objects.get(username=user)
-                                        if _user != _owner:
-                                            if user == "AnonymousUser":
-                                                _user = None
-                                                deferred_anon_perms.append(user_perms)
-                                            else:
-                                                create_geofence_rules(_resource, user_perms, _user, None, batch)
-                                            exist_geolimits = exist_geolimits or has_geolimits(_resource, _user, None)
-
-                                # All the other groups
-                                if "groups" in permissions and len(permissions["groups"]) > 0:
-                                    for group, perms in permissions["groups"].items():
-                                        _group = Group.objects.get(name=group)
-                                        if _group and _group.name and _group.name == "anonymous":
-                                            _group = None
-                                            deferred_anon_perms.append(perms)
-                                        else:
-                                            create_geofence_rules(_resource, perms, None, _group, batch)
-                                        exist_geolimits = exist_geolimits or has_geolimits(_resource, None, _group)
-
-                                for perm in deferred_anon_perms:
-                                    create_geofence_rules(_resource, perm, None, None, batch)
-
-                            else:
-                                # Owner & Managers
-                                perms = (
-                                    OWNER_PERMISSIONS.copy()
-                                    + DATASET_ADMIN_PERMISSIONS.copy()
-                                    + DOWNLOAD_PERMISSIONS.copy()
-                                )
-                                create_geofence_rules(_resource, perms, _owner, None, batch)
-                                exist_geolimits = exist_geolimits or has_geolimits(_resource, _owner, None)
-
-                                _resource_groups, _group_managers = _resource.get_group_managers(group=_resource.group)
-                                for _group_manager in _group_managers:
-                                    create_geofence_rules(_resource, perms, _group_manager, None, batch)
-                                    exist_geolimits = exist_geolimits or has_geolimits(_resource, _group_manager, None)
-
-                                for user_group in _resource_groups:
-                                    if not skip_registered_members_common_group(user_group):
-                                        create_geofence_rules(_resource, perms, None, user_group, batch)
-                                        exist_geolimits = exist_geolimits or has_geolimits(_resource, None, user_group)
-
-                                # Anonymous
-                                if settings.DEFAULT_ANONYMOUS_VIEW_PERMISSION:
-                                    create_geofence_rules(_resource, VIEW_PERMISSIONS, None, None, batch)
-                                    exist_geolimits = exist_geolimits or has_geolimits(_resource, None, None)
-
-                                if settings.DEFAULT_ANONYMOUS_DOWNLOAD_PERMISSION:
-                                    create_geofence_rules(_resource, DOWNLOAD_PERMISSIONS, None, None, batch)
-                                    exist_geolimits = exist_geolimits or has_geolimits(_resource, None, None)
-
-                            if exist_geolimits is not None:
-                                filters, formats = _get_gwc_filters_and_formats(exist_geolimits)
-                                try:
-                                    _dataset_workspace = get_dataset_workspace(_resource)
-                                    toggle_dataset_cache(
-                                        f"{_dataset_workspace}:{_resource.name}", filters=filters, formats=formats
-                                    )
-                                except Dataset.DoesNotExist:
-                                    pass
+                            self._collect_geofence_rules(
+                                _resource, batch, owner=owner, permissions=permissions, created=created
+                            )
 
                             try:
                                 logger.info(
                                     f"Pushing {batch.length()} " f"changes into GeoFence for resource {_resource.name}"
                                 )
                                 executed = geofence.run_batch(batch)
+                                rules_mirror.forget([(get_dataset_workspace(_resource), _resource.name)])
                                 if executed:
                                     geofence.invalidate_cache()
                             except Exception as e:
@@ -564,6 +485,146 @@ class GeoServerResourceManager(ResourceManagerInterface):
 
         return True
 
+    def set_permissions_bulk(
+        self,
+        resources: typing.Iterable,
+        /,
+        owner: settings.AUTH_USER_MODEL = None,
+        permissions: dict = {},
+        perm_specs: dict = None,
+        created: bool = False,
+        approval_status_changed: bool = False,
+        group_status_changed: bool = False,
+    ) -> bool:
+        """Pushes the GeoFence rules of all the datasets with one batch and one cache invalidation."""
+        _datasets = [_resource.get_real_instance() for _resource in resources]
+        _datasets = [_dataset for _dataset in _datasets if isinstance(_dataset, Dataset)]
+        perm_specs = perm_specs or {}
+
+        try:
+            if _datasets and (
+                settings.OGC_SERVER["default"].get("GEOFENCE_SECURITY_ENABLED", False)
+                or getattr(settings, "GEOFENCE_SECURITY_ENABLED", False)
+            ):
+                if not getattr(settings, "DELAYED_SECURITY_SIGNALS", False):
+                    batch = AutoPriorityBatch(
+                        gf_utils.get_first_available_priority(), f"Set permission for {len(_datasets)} resources"
+                    )
+                    for _dataset in _datasets:
+                        self._collect_geofence_rules(
+                            _dataset,
+                            batch,
+                            owner=owner,
+                            permissions=perm_specs.get(_dataset.id, permissions),
+                            created=created,
+                        )
+
+                    try:
+                        logger.info(f"Pushing {batch.length()} changes into GeoFence for {len(_datasets)} resources")
+                        executed = geofence.run_batch(batch)
+                        rules_mirror.forget((get_dataset_workspace(_dataset), _dataset.name) for _dataset in _datasets)
+                        if executed:
+                            geofence.invalidate_cache()
+                    except Exception as e:
+                        logger.warning(f"Could not sync GeoFence for {len(_datasets)} resources: {e}. Retrying async.")
+                        for _dataset in _datasets:
+                            _dataset.set_dirty_state()
+                else:
+                    for _dataset in _datasets:
+                        _dataset.set_dirty_state()
+        except Exception as e:
+            logger.exception(e)
+            return False
+
+        for _dataset in _datasets:
+            geofence_rule_assign.send_robust(sender=_dataset, instance=_dataset)
+
+        return True
+
+    def _collect_geofence_rules(
+        self,
+        _resource: Dataset,
+        batch: AutoPriorityBatch,
+        owner: settings.AUTH_USER_MODEL = None,
+        permissions: dict = {},
+        created: bool = False,
+    ):
+        """Collects into the batch the operations replacing the GeoFence rules of a dataset."""
+        workspace = get_dataset_workspace(_resource)
+
+        if not created:
+            gf_utils.collect_delete_layer_rules(workspace, _resource.name, batch)
+
+        exist_geolimits = None
+        _owner = owner or _resource.owner
+
+        if permissions is not None and len(permissions):
+            # Owner
+            perms = OWNER_PERMISSIONS.copy() + DATASET_ADMIN_PERMISSIONS.copy() + DOWNLOAD_PERMISSIONS.copy()
+            create_geofence_rules(_resource, perms, _owner, None, batch)
+            exist_geolimits = exist_geolimits or has_geolimits(_resource, _owner, None)
+
+            deferred_anon_perms = []
+
+            # All the other users
+            if "users" in permissions and len(permissions["users"]) > 0:
+                for user, user_perms in permissions["users"].items():
+                    _user = get_user_model().objects.get(username=user)
+                    if _user != _owner:
+                        if user == "AnonymousUser":
+                            _user = None
+                            deferred_anon_perms.append(user_perms)
+                        else:
+                            create_geofence_rules(_resource, user_perms, _user, None, batch)
+                        exist_geolimits = exist_geolimits or has_geolimits(_resource, _user, None)
+
+            # All the other groups
+            if "groups" in permissions and len(permissions["groups"]) > 0:
+                for group, perms in permissions["groups"].items():
+                    _group = Group.objects.get(name=group)
+                    if _group and _group.name and _group.name == "anonymous":
+                        _group = None
+                        deferred_anon_perms.append(perms)
+                    else:
+                        create_geofence_rules(_resource, perms, None, _group, batch)
+                    exist_geolimits = exist_geolimits or has_geolimits(_resource, None, _group)
+
+            for perm in deferred_anon_perms:
+                create_geofence_rules(_resource, perm, None, None, batch)
+
+        else:
+            # Owner & Managers
+            perms = OWNER_PERMISSIONS.copy() + DATASET_ADMIN_PERMISSIONS.copy() + DOWNLOAD_PERMISSIONS.copy()
+            create_geofence_rules(_resource, perms, _owner, None, batch)
+            exist_geolimits = exist_geolimits or has_geolimits(_resource, _owner, None)
+
+            _resource_groups, _group_managers = _resource.get_group_managers(group=_resource.group)
+            for _group_manager in _group_managers:
+                create_geofence_rules(_resource, perms, _group_manager, None, batch)
+                exist_geolimits = exist_geolimits or has_geolimits(_resource, _group_manager, None)
+
+            for user_group in _resource_groups:
+                if not skip_registered_members_common_group(user_group):
+                    create_geofence_rules(_resource, perms, None, user_group, batch)
+                    exist_geolimits = exist_geolimits or has_geolimits(_resource, None, user_group)
+
+            # Anonymous
+            if settings.DEFAULT_ANONYMOUS_VIEW_PERMISSION:
+                create_geofence_rules(_resource, VIEW_PERMISSIONS, None, None, batch)
+                exist_geolimits = exist_geolimits or has_geolimits(_resource, None, None)
+
+            if settings.DEFAULT_ANONYMOUS_DOWNLOAD_PERMISSION:
+                create_geofence_rules(_resource, DOWNLOAD_PERMISSIONS, None, None, batch)
+                exist_geolimits = exist_geolimits or has_geolimits(_resource, None, None)
+
+        if exist_geolimits is not None:
+            filters, formats = _get_gwc_filters_and_formats(exist_geolimits)
+            try:
+                _dataset_workspace = get_dataset_workspace(_resource)
+                toggle_dataset_cache(f"{_dataset_workspace}:{_resource.name}", filters=filters, formats=formats)
+            except Dataset.DoesNotExist:
+                pass
+
     def set_thumbnail(
         self, uuid: str, /, instance: ResourceBase = None, overwrite: bool = True, check_bbox: bool = True
     ) -> bool:
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.9 on 2026-10-18 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="GeoFenceLayerRules",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("workspace", models.CharField(blank=True, max_length=255, null=True)),
+                ("layer", models.CharField(max_length=255)),
+                ("last_sync", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("workspace", "layer")},
+            },
+        ),
+        migrations.CreateModel(
+            name="GeoFenceRule",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("rule_id", models.BigIntegerField(unique=True)),
+                ("priority", models.BigIntegerField(db_index=True)),
+                ("user_name", models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ("role_name", models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ("service", models.CharField(blank=True, max_length=255, null=True)),
+                ("request", models.CharField(blank=True, max_length=255, null=True)),
+                ("subfield", models.CharField(blank=True, max_length=255, null=True)),
+                ("access", models.CharField(max_length=16)),
+                ("limits", models.JSONField(blank=True, null=True)),
+                (
+                    "layer_rules",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rules",
+                        to="geoserver.geofencelayerrules",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("priority",),
+            },
+        ),
+    ]
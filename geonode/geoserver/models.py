@@ -16,3 +16,51 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+
+from django.db import models
+
+
+class GeoFenceLayerRules(models.Model):
+    """
+    A layer whose GeoFence rules are mirrored locally.
+    Rules of layers without an entry are unknown and must be read from GeoFence.
+    """
+
+    workspace = models.CharField(max_length=255, null=True, blank=True)
+    layer = models.CharField(max_length=255)
+    last_sync = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("workspace", "layer")
+
+    def __str__(self):
+        return f"{self.workspace}:{self.layer}"
+
+
+class GeoFenceRule(models.Model):
+    """
+    Local mirror of a GeoFence rule bound to a layer.
+    """
+
+    rule_id = models.BigIntegerField(unique=True)
+    priority = models.BigIntegerField(db_index=True)
+    layer_rules = models.ForeignKey(GeoFenceLayerRules, related_name="rules", on_delete=models.CASCADE)
+    user_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    role_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    service = models.CharField(max_length=255, null=True, blank=True)
+    request = models.CharField(max_length=255, null=True, blank=True)
+    subfield = models.CharField(max_length=255, null=True, blank=True)
+    access = models.CharField(max_length=16)
+    limits = models.JSONField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("priority",)
+
+    def __str__(self):
+        return f"{self.rule_id} [{self.priority}] {self.layer_rules} {self.access}"
+
+    @property
+    def signature(self) -> tuple:
+        from geonode.geoserver.geofence_mirror import RULE_FIELDS, rule_signature
+
+        return rule_signature(dict(limits=self.limits, **{attr: getattr(self, field) for attr, field in RULE_FIELDS}))
@@ -47,7 +47,10 @@ def delete_all_geofence_rules():
     if settings.OGC_SERVER["default"]["GEOFENCE_SECURITY_ENABLED"] or getattr(
         settings, "GEOFENCE_SECURITY_ENABLED", False
     ):
+        from geonode.geoserver.geofence_mirror import rules_mirror
+
         gf_utils.delete_all_rules()
+        rules_mirror.forget()
 
 
 def delete_geofence_rules_for_layer(instance):
@@ -64,8 +67,11 @@ def delete_geofence_rules_for_layer(instance):
             if resource.dataset and hasattr(resource.dataset, "name")
             else resource.dataset.alternate
         )
+        from geonode.geoserver.geofence_mirror import rules_mirror
+
         logger.debug(f"Removing rules for layer {workspace_name}:{layer_name}")
         gf_utils.delete_layer_rules(workspace_name, layer_name)
+        rules_mirror.forget([(workspace_name, layer_name)])
 
 
 def invalidate_geofence_cache():
@@ -237,6 +243,8 @@ def allow_layer_to_all(instance):
       geoserver
 
     """
+    from geonode.geoserver.geofence_mirror import rules_mirror
+
     resource = instance.get_self_resource()
     logger.debug(f"Inside allow_layer_to_all for instance {instance}")
     workspace = get_dataset_workspace(resource.dataset)
@@ -247,6 +255,7 @@ def allow_layer_to_all(instance):
     try:
         priority = gf_utils.get_first_available_priority()
         geofence.insert_rule(Rule(Rule.ALLOW, priority=priority, workspace=workspace, layer=dataset_name))
+        rules_mirror.forget([(workspace, dataset_name)])
     except Exception as e:
         tb = traceback.format_exc()
         logger.debug(tb)
@@ -329,8 +338,16 @@ def create_geofence_rules(layer, perms, user=None, group=None, batch: Batch = No
 def sync_resources_with_guardian(resource=None, force=False):
     """
     Sync resources with Guardian and clear their dirty state
+
+    The rules of all the datasets are synched together: the existing rules are read with one paged scan,
+    the priorities are allocated once and the operations are sent with as few batches as allowed by
+    `GEOFENCE_SYNC_BATCH_SIZE`, keeping the operations of each dataset within the same batch.
+
+    When `GEOFENCE_RULES_MIRROR_ENABLED` is set, the existing rules are taken from the local mirror
+    and only the rules which actually changed are deleted and inserted.
     """
     from geonode.layers.models import Dataset
+    from geonode.geoserver.geofence_mirror import rules_diff, rules_mirror
 
     if resource:
         datasets = Dataset.objects.filter(id=resource.id)
@@ -342,44 +359,134 @@ def sync_resources_with_guardian(resource=None, force=False):
     if datasets and datasets.exists():
         logger.debug(" --------------------------- synching with guardian!")
 
-        rules_committed = False
+        datasets = list(datasets)
+        layers = {dataset.id: (get_dataset_workspace(dataset), dataset.name) for dataset in datasets}
+
+        first_priority = None
+        # for a single dataset, or when the scan fails, the rules of each dataset are read with a filtered query
+        rules_by_layer = None
+        if rules_mirror.enabled:
+            mirrored_rules = rules_mirror.get_rules(layers.values())
+        elif len(datasets) > 1:
+            try:
+                rules_by_layer, first_priority = gf_utils.collect_layers_rules(
+                    layers.values(), page_size=getattr(settings, "GEOFENCE_RULES_PAGE_SIZE", 1000)
+                )
+            except Exception as e:
+                logger.exception(e)
+                logger.warning(f"!WARNING! - Failure Reading the Security Rules of {len(datasets)} Resources")
 
+        # the rules to be deleted and inserted for each dataset
+        changes = []
         for dataset in datasets:
             try:
-                batch = AutoPriorityBatch(gf_utils.get_first_available_priority(), f"Sync resources {dataset}")
-
-                gf_utils.collect_delete_layer_rules(get_dataset_workspace(dataset), dataset.name, batch)
-
-                perm_spec = dataset.get_all_level_info()
-                # All the other users
-                if "users" in perm_spec:
-                    for user, perms in perm_spec["users"].items():
-                        user = get_user_model().objects.get(username=user)
-                        # Set the GeoFence User Rules
-                        geofence_user = str(user)
-                        if "AnonymousUser" in geofence_user or str(get_anonymous_user()) in geofence_user:
-                            geofence_user = None
-                        create_geofence_rules(dataset, perms, user=geofence_user, batch=batch)
-                # All the other groups
-                if "groups" in perm_spec:
-                    for group, perms in perm_spec["groups"].items():
-                        group = Group.objects.get(name=group)
-                        if group and group.name and group.name == "anonymous":
-                            group = None
-                        # Set the GeoFence Group Rules
-                        create_geofence_rules(dataset, perms, group=group, batch=batch)
-
-                logger.info(f"Going to synch permissions in GeoFence for resource {dataset}")
-                rules_committed = geofence.run_batch(batch)
-                dataset.clear_dirty_state()
+                desired = Batch()
+                _collect_dataset_perms_rules(dataset, desired)
+                if rules_mirror.enabled:
+                    deleted, inserted = rules_diff(mirrored_rules[layers[dataset.id]], desired.operations)
+                elif rules_by_layer is None:
+                    existing = gf_utils.collect_delete_layer_rules(*layers[dataset.id])
+                    deleted = [op["@id"] for op in existing.operations] if existing else []
+                    inserted = desired.operations
+                else:
+                    deleted, inserted = rules_by_layer.get(layers[dataset.id], []), desired.operations
+                changes.append((dataset, deleted, inserted))
             except Exception as e:
                 logger.exception(e)
                 logger.warning(f"!WARNING! - Failure Synching-up Security Rules for Resource [{dataset}]")
 
+        if first_priority is None and any(inserted for _, _, inserted in changes):
+            first_priority = gf_utils.get_first_available_priority()
+
+        # all the operations, with the (start, end) range of each dataset
+        batch = AutoPriorityBatch(first_priority or 0, "Sync resources")
+        ranges = []
+        for dataset, deleted, inserted in changes:
+            start = batch.length()
+            for rule_id in deleted:
+                batch.add_delete_rule(rule_id)
+            for operation in inserted:
+                batch.add_insert_operation(operation)
+            ranges.append((dataset, start, batch.length()))
+
+        rules_committed = False
+        # the rules deleted and the layers with rules inserted by the executed batches,
+        # the mirror reads the inserted rules back from GeoFence once all the batches have been run
+        applied_deleted, applied_layers = [], set()
+        max_operations = getattr(settings, "GEOFENCE_SYNC_BATCH_SIZE", 5000)
+        for chunk in _split_operations(ranges, max_operations):
+            _batch = Batch(f"Sync {len(chunk)} resources")
+            for dataset, start, end in chunk:
+                _batch.operations.extend(batch.operations[start:end])
+            try:
+                logger.info(f"Going to synch permissions in GeoFence for {len(chunk)} resources")
+                executed = geofence.run_batch(_batch)
+                rules_committed = executed or rules_committed
+                if not rules_mirror.enabled:
+                    rules_mirror.forget(layers[dataset.id] for dataset, _, _ in chunk)
+                elif executed:
+                    applied_deleted.extend(op["@id"] for op in _batch.operations if op["@type"] == "delete")
+                    applied_layers.update(
+                        layers[dataset.id]
+                        for dataset, start, end in chunk
+                        if any(op["@type"] == "insert" for op in batch.operations[start:end])
+                    )
+                for dataset, _, _ in chunk:
+                    dataset.clear_dirty_state()
+            except Exception as e:
+                logger.exception(e)
+                logger.warning(f"!WARNING! - Failure Synching-up Security Rules for {len(chunk)} Resources")
+                rules_mirror.forget(layers[dataset.id] for dataset, _, _ in chunk)
+
+        if applied_deleted or applied_layers:
+            try:
+                rules_mirror.applied(applied_deleted, applied_layers)
+            except Exception as e:
+                logger.exception(e)
+                logger.warning(f"!WARNING! - Failure Mirroring the GeoFence Rules of {len(applied_layers)} Layers")
+                rules_mirror.forget(applied_layers)
+
         if rules_committed:
             invalidate_geofence_cache()
 
 
+def _collect_dataset_perms_rules(dataset, batch):
+    perm_spec = dataset.get_all_level_info()
+    # All the other users
+    if "users" in perm_spec:
+        for user, perms in perm_spec["users"].items():
+            user = get_user_model().objects.get(username=user)
+            # Set the GeoFence User Rules
+            geofence_user = str(user)
+            if "AnonymousUser" in geofence_user or str(get_anonymous_user()) in geofence_user:
+                geofence_user = None
+            create_geofence_rules(dataset, perms, user=geofence_user, batch=batch)
+    # All the other groups
+    if "groups" in perm_spec:
+        for group, perms in perm_spec["groups"].items():
+            group = Group.objects.get(name=group)
+            if group and group.name and group.name == "anonymous":
+                group = None
+            # Set the GeoFence Group Rules
+            create_geofence_rules(dataset, perms, group=group, batch=batch)
+
+
+def _split_operations(ranges, max_operations):
+    """
+    Groups the (dataset, start, end) operation ranges into chunks of at most `max_operations` operations.
+    A dataset with more operations than that gets a chunk on its own.
+    """
+    chunk, length = [], 0
+    for dataset, start, end in ranges:
+        if chunk and length + end - start > max_operations:
+            yield chunk
+            chunk, length = [], 0
+        chunk.append((dataset, start, end))
+        length += end - start
+    if chunk:
+        yield chunk
+
+
 def get_geolimits(layer, username, groupname):
     users_geolimits = None
     groups_geolimits = None
@@ -16,13 +16,19 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import os
 import re
+import json
 import time
 import logging
+import tempfile
 
+from datetime import timedelta
 from urllib.parse import urljoin
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 
 from geonode import geoserver
@@ -38,6 +44,8 @@ from geonode.geoserver.helpers import (
     extract_name_from_sld,
     get_dataset_capabilities_url,
     get_layer_ows_url,
+    get_attributes_statistics,
+    gs_slurp,
 )
 from geonode.geoserver.ows import _wcs_link, _wfs_link, _wms_link
 
@@ -275,3 +283,123 @@ xlink:href="{settings.GEOSERVER_LOCATION}ows?service=WMS&amp;request=GetLegendGr
         expected_url = f"{ows_url}geonode/CA/ows"
         capabilities_url = get_layer_ows_url(dataset)
         self.assertEqual(capabilities_url, expected_url, capabilities_url)
+
+    @on_ogc_backend(geoserver.BACKEND_PACKAGE)
+    def test_get_attributes_statistics(self):
+        from geonode.layers.models import Dataset
+
+        cache.clear()
+        dataset = Dataset.objects.get(alternate="geonode:CA")
+        fields = [f"field_{i}" for i in range(10)]
+        with patch("geonode.geoserver.helpers.ogc_server_settings") as ogc_server_settings_mock, patch(
+            "geonode.geoserver.helpers.get_attribute_statistics", side_effect=lambda name, field: {"Max": field}
+        ) as statistics_mock:
+            ogc_server_settings_mock.WPS_ENABLED = True
+            ogc_server_settings_mock.DATASTORE = ""
+            statistics = get_attributes_statistics(dataset, fields)
+            self.assertEqual(statistics, {field: {"Max": field} for field in fields})
+            self.assertEqual(statistics_mock.call_count, len(fields))
+
+            # the statistics are cached until the dataset changes
+            self.assertEqual(get_attributes_statistics(dataset, fields[:2] + ["other"])["other"], {"Max": "other"})
+            self.assertEqual(statistics_mock.call_count, len(fields) + 1)
+            dataset.last_updated += timedelta(hours=1)
+            get_attributes_statistics(dataset, fields[:2])
+            self.assertEqual(statistics_mock.call_count, len(fields) + 3)
+
+            ogc_server_settings_mock.WPS_ENABLED = False
+            self.assertEqual(get_attributes_statistics(dataset, ["new"]), {"new": None})
+
+    @on_ogc_backend(geoserver.BACKEND_PACKAGE)
+    def test_get_attributes_statistics_from_datastore(self):
+        from django.db import connection
+        from geonode.layers.models import Dataset
+
+        if connection.vendor != "postgresql":
+            self.skipTest("The datastore statistics require PostgreSQL")
+        cache.clear()
+        dataset = Dataset.objects.get(alternate="geonode:CA")
+        dataset.store = "geonode_data"
+        table = f"public.{connection.ops.quote_name(dataset.name)}"
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(f"CREATE TABLE {table} (value integer)")
+            cursor.execute(f"INSERT INTO {table} (value) VALUES (1), (2), (3), (10)")
+        try:
+            with patch("geonode.geoserver.helpers.ogc_server_settings") as ogc_server_settings_mock, patch(
+                "geonode.geoserver.helpers.get_attribute_statistics"
+            ) as statistics_mock:
+                ogc_server_settings_mock.WPS_ENABLED = True
+                # the default database plays the datastore, its store is named after the database
+                ogc_server_settings_mock.DATASTORE = "default"
+                ogc_server_settings_mock.datastore_db = {"NAME": "geonode_data"}
+                statistics = get_attributes_statistics(dataset, ["value"])["value"]
+                statistics_mock.assert_not_called()
+                self.assertEqual(statistics["Count"], 4)
+                self.assertEqual(
+                    (float(statistics["Min"]), float(statistics["Max"]), float(statistics["Median"])), (1, 10, 2.5)
+                )
+                self.assertEqual(float(statistics["Sum"]), 16)
+                self.assertEqual(statistics["unique_values"], "NA")
+
+                # the layers of the other stores are not read from the datastore
+                cache.clear()
+                dataset.store = "other"
+                statistics_mock.return_value = {"Max": "wps"}
+                self.assertEqual(get_attributes_statistics(dataset, ["value"]), {"value": {"Max": "wps"}})
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+    @on_ogc_backend(geoserver.BACKEND_PACKAGE)
+    def test_gs_slurp_chunks_and_cursor(self):
+        resources = []
+        for i in range(7):
+            resource = MagicMock(enabled="true", advertised="true")
+            resource.name = f"layer_{i}"
+            resource.workspace.name = "geonode"
+            resources.append(resource)
+        processed = []
+        failing = ["layer_4"]
+
+        def _slurp_dataset(resource, owner, execute_signals):
+            if resource.name in failing:
+                failing.remove(resource.name)
+                raise Exception("GeoServer is down")
+            processed.append(resource.name)
+            return MagicMock(), False
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "geonode.geoserver.helpers.gs_catalog"
+        ) as catalog_mock, patch("geonode.geoserver.helpers._slurp_dataset", side_effect=_slurp_dataset):
+            catalog_mock.get_resources.return_value = list(reversed(resources))
+            cursor = os.path.join(tmpdir, "cursor.json")
+
+            with self.assertRaises(Exception):
+                gs_slurp(chunk_size=2, cursor=cursor)
+            # the chunks before the failed one are recorded
+            with open(cursor) as f:
+                self.assertEqual(json.load(f)["cursor"], "geonode:layer_3")
+
+            # a dry run doesn't process the layers nor move the cursor
+            output = gs_slurp(cursor=cursor, dry_run=True)
+            self.assertEqual([info["name"] for info in output["layers"]], ["layer_4", "layer_5", "layer_6"])
+            self.assertEqual({info["status"] for info in output["layers"]}, {"to_create"})
+
+            processed.clear()
+            output = gs_slurp(workers=2, chunk_size=2, cursor=cursor)
+            self.assertCountEqual(processed, ["layer_4", "layer_5", "layer_6"])
+            self.assertEqual(output["stats"]["updated"], 3)
+            # the run is complete, the cursor is cleared
+            self.assertFalse(os.path.exists(cursor))
+
+            # a later run with the same cursor processes all the layers, including the new ones
+            resource = MagicMock(enabled="true", advertised="true")
+            resource.name = "layer_0a"
+            resource.workspace.name = "geonode"
+            catalog_mock.get_resources.return_value = resources + [resource]
+            processed.clear()
+            output = gs_slurp(chunk_size=2, cursor=cursor)
+            self.assertEqual(len(processed), 8)
+            self.assertIn("layer_0a", processed)
+            self.assertFalse(os.path.exists(cursor))
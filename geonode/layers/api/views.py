@@ -29,7 +29,7 @@ from oauth2_provider.contrib.rest_framework import OAuth2Authentication
 from rest_framework.response import Response
 
 from geonode.base.api.filters import DynamicSearchFilter, ExtentFilter
-from geonode.base.api.mixins import AdvertisedListMixin
+from geonode.base.api.mixins import AdvertisedListMixin, ResourceBasePrefetchMixin
 from geonode.base.api.pagination import GeoNodeApiPagination
 from geonode.base.api.permissions import UserHasPerms
 from geonode.base.api.views import ApiPresetsInitializer
@@ -54,7 +54,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class DatasetViewSet(ApiPresetsInitializer, DynamicModelViewSet, AdvertisedListMixin):
+class DatasetViewSet(ApiPresetsInitializer, ResourceBasePrefetchMixin, DynamicModelViewSet, AdvertisedListMixin):
     """
     API endpoint that allows layers to be viewed or edited.
     """
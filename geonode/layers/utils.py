@@ -429,6 +429,8 @@ def set_datasets_permissions(
 
     not_found = []
     final_perms_payload = {}
+    resources = []
+    perm_specs = {}
 
     for rpk in resources_as_pk:
         resource = Dataset.objects.filter(pk=rpk)
@@ -495,8 +497,12 @@ def set_datasets_permissions(
                 ):
                     final_perms_payload["groups"].pop("anonymous")
 
-            # calling the resource manager to set the permissions
-            resource_manager.set_permissions(resource.uuid, instance=resource, permissions=final_perms_payload)
+            resources.append(resource)
+            perm_specs[resource.id] = final_perms_payload
+
+    # calling the resource manager to set the permissions of all the resources at once
+    if resources:
+        resource_manager.set_permissions_bulk(resources, perm_specs=perm_specs)
 
 
 def get_uuid_handler():
@@ -31,7 +31,7 @@ from rest_framework.response import Response
 
 from geonode.base import register_event
 from geonode.base.api.filters import DynamicSearchFilter, ExtentFilter
-from geonode.base.api.mixins import AdvertisedListMixin
+from geonode.base.api.mixins import AdvertisedListMixin, ResourceBasePrefetchMixin
 from geonode.base.api.pagination import GeoNodeApiPagination
 from geonode.base.api.permissions import UserHasPerms
 from geonode.base.api.views import ApiPresetsInitializer
@@ -49,7 +49,7 @@ from geonode.utils import resolve_object
 logger = logging.getLogger(__name__)
 
 
-class MapViewSet(ApiPresetsInitializer, DynamicModelViewSet, AdvertisedListMixin):
+class MapViewSet(ApiPresetsInitializer, ResourceBasePrefetchMixin, DynamicModelViewSet, AdvertisedListMixin):
     """
     API endpoint that allows maps to be viewed or edited.
     """
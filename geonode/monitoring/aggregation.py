@@ -20,21 +20,26 @@
 from datetime import datetime, timedelta, time
 from decimal import Decimal
 import logging
+from itertools import islice
 
 import pytz
 
 from django.conf import settings
-from django.db.models import Sum, F
+from django.db import connections, transaction
+from django.db.models import Count, Exists, IntegerField, Max, Min, OuterRef, Sum, F
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
 
-from geonode.monitoring.utils import generate_periods
+from geonode.monitoring.utils import generate_periods, align_period_start, align_period_end
 from geonode.monitoring.models import (
     Metric,
     MetricValue,
+    MetricValueRollup,
     ServiceTypeMetric,
     MonitoredResource,
     MetricLabel,
     EventType,
+    ExceptionEvent,
 )
 
 
@@ -169,6 +174,223 @@ def extract_special_event_types(requests):
     return out
 
 
+# metrics computed from the columns of the requests, on top of request.count, request.path and response.error.*
+REQUESTS_METRICS_COLUMNS = (
+    ("request.ip", "client_ip"),
+    ("request.users", "user_identifier"),
+    ("request.country", "client_country"),
+    ("request.city", "client_city"),
+    ("request.region", "client_region"),
+    ("request.ua", "user_agent"),
+    ("request.ua.family", "user_agent_family"),
+    ("response.time", "response_time"),
+    ("response.size", "response_size"),
+    ("response.status", "response_status"),
+    ("request.method", "request_method"),
+)
+
+# max number of labels kept for the count and value metrics
+REQUESTS_METRICS_MAX_LABELS = 100
+
+
+def get_event_types_scopes():
+    """
+    Returns a dict mapping each event type id (and None) to the ids of the event types
+    its requests are accounted for: "all", the event type itself, and either "OWS:ALL" or "other"
+    """
+    event_types = list(EventType.objects.all())
+    special = {et.name: et.id for et in event_types}
+    all_id, ows_id, other_id = (
+        special.get(name) for name in (EventType.EVENT_ALL, EventType.EVENT_OWS, EventType.EVENT_OTHER)
+    )
+    scopes = {None: [all_id]}
+    for et in event_types:
+        scopes[et.id] = [all_id]
+        if et.id not in (all_id, ows_id, other_id):
+            scopes[et.id].append(et.id)
+        if et.name.startswith("OWS:"):
+            if et.id != ows_id:
+                scopes[et.id].append(ows_id)
+        elif et.id != other_id:
+            scopes[et.id].append(other_id)
+    return scopes, (ows_id, other_id)
+
+
+def rollup_requests(service, requests, valid_from, valid_to):
+    """
+    Computes the metrics of a batch of requests, returns them as MetricValue instances to be written at once.
+
+    Metrics are computed for each (resource, event type) scope, where the resource is either None (all the
+    requests) or one of the resources of the requests, and the event type is "all", one of the event types
+    of the requests, "OWS:ALL" or "other".
+    Instead of querying each scope, the requests are grouped once by resource and event type, and once more
+    by each labelled column, then the groups are summed up into their scopes: the number of queries does not
+    depend on the number of resources and event types.
+    """
+    service_metrics = {
+        stm.metric.name: stm
+        for stm in ServiceTypeMetric.objects.filter(service_type=service.service_type).select_related("metric")
+    }
+    columns = [
+        (service_metrics[name].metric, column) for name, column in REQUESTS_METRICS_COLUMNS if name in service_metrics
+    ]
+    event_types_scopes, special_event_types = get_event_types_scopes()
+    requests = requests.order_by()
+    errors = ExceptionEvent.objects.filter(request__in=requests).order_by()
+
+    def get_rows(queryset, resource_field, event_type_field, *fields, **aggregates):
+        """
+        Groups the queryset, with and without the resources, yielding the scopes of each row
+        """
+        for _resource_field in (None, resource_field):
+            group_by = [f for f in (_resource_field, event_type_field) if f] + list(fields)
+            for row in queryset.values(*group_by).annotate(**aggregates):
+                resource = row[_resource_field] if _resource_field else None
+                if _resource_field and resource is None:
+                    continue
+                for event_type in event_types_scopes.get(row[event_type_field], event_types_scopes[None]):
+                    yield (resource, event_type), row
+
+    # requests count, rate and numeric metrics
+    totals = {}
+    aggregates = {"requests": Count("id")}
+    for metric, column in columns:
+        if metric.is_rate:
+            aggregates.update({f"{column}__sum": Sum(column), f"{column}__count": Count(column)})
+        elif metric.is_value_numeric:
+            aggregates.update({f"{column}__max": Max(column), f"{column}__count": Count(column)})
+    for scope, row in get_rows(requests, "resources", "event_type", **aggregates):
+        total = totals.setdefault(scope, {})
+        for key, value in row.items():
+            if key in aggregates and value is not None:
+                if key.endswith("__max"):
+                    total[key] = max(total.get(key, value), value)
+                else:
+                    total[key] = total.get(key, 0) + value
+    # the special event types are always reported, even without requests
+    for resource in {resource for resource, _ in totals}:
+        for event_type in special_event_types:
+            totals.setdefault((resource, event_type), {})
+
+    # labelled metrics: {metric name: {scope: {label: [value, samples]}}}
+    labelled = {}
+
+    def add_labelled(metric_name, scope, label, value, samples):
+        values = labelled.setdefault(metric_name, {}).setdefault(scope, {}).setdefault(label, [0, 0])
+        values[0] += value or 0
+        values[1] += samples or 0
+
+    for scope, row in get_rows(requests, "resources", "event_type", "request_path", requests_count=Count("id")):
+        add_labelled("request.path", scope, row["request_path"], row["requests_count"], row["requests_count"])
+    for metric, column in columns:
+        if not (metric.is_count or metric.is_value):
+            continue
+        fields = [column]
+        if metric.is_value and column == "user_identifier":
+            # users are labelled along with their name
+            fields.append("user_username")
+        aggregates = {"samples": Count(column)}
+        if metric.is_count:
+            aggregates["value"] = Sum(column)
+        usernames = {}
+        for scope, row in get_rows(requests, "resources", "event_type", *fields, **aggregates):
+            label = row[column]
+            if metric.is_count:
+                add_labelled(metric.name, scope, label, row["value"], row["samples"])
+            elif label is not None:
+                add_labelled(metric.name, scope, label, row["samples"], row["samples"])
+                if "user_username" in row:
+                    usernames[label] = row["user_username"]
+        if usernames:
+            labelled[metric.name] = {
+                scope: {(label, usernames[label]): values for label, values in scope_values.items()}
+                for scope, scope_values in labelled.get(metric.name, {}).items()
+            }
+        for scope, scope_values in labelled.get(metric.name, {}).items():
+            labelled[metric.name][scope] = dict(
+                sorted(scope_values.items(), key=lambda item: item[1][0], reverse=True)[:REQUESTS_METRICS_MAX_LABELS]
+            )
+
+    # errors, the requests are counted once whatever the number of their exceptions
+    # the errors count is not bound to a resource nor to an event type, the dashboard reads it as is
+    errors_count = errors.aggregate(errors_count=Count("request", distinct=True))["errors_count"]
+    if errors_count:
+        add_labelled("response.error.count", (None, None), "count", errors_count, requests.count())
+    for scope, row in get_rows(
+        errors, "request__resources", "request__event_type", "error_type", errors_count=Count("request", distinct=True)
+    ):
+        add_labelled("response.error.types", scope, row["error_type"], row["errors_count"], row["errors_count"])
+
+    rows = []
+
+    def add_row(metric_name, scope, label, value, samples):
+        if metric_name in service_metrics:
+            rows.append((service_metrics[metric_name], scope, label, value, samples))
+
+    for scope, total in totals.items():
+        count = total.get("requests", 0)
+        add_row("request.count", scope, "Count", count, count)
+        for metric, column in columns:
+            if metric.is_rate:
+                samples = total.get(f"{column}__count", 0)
+                value = total[f"{column}__sum"] / samples if samples else None
+                add_row(metric.name, scope, Metric.TYPE_RATE, value, count)
+            elif metric.is_value_numeric:
+                value = total.get(f"{column}__max")
+                add_row(metric.name, scope, Metric.TYPE_VALUE_NUMERIC, value, total.get(f"{column}__count"))
+    for metric_name, scopes in labelled.items():
+        for scope, scope_values in scopes.items():
+            for label, (value, samples) in scope_values.items():
+                add_row(metric_name, scope, label, value, samples)
+
+    # all the labels are fetched, or created, at once
+    labels = get_or_create_metric_labels(label for _, _, label, _, _ in rows)
+    metric_values = {}
+    for service_metric, (resource, event_type), label, value, samples in rows:
+        label = labels[get_metric_label_name(label)]
+        metric_values[(service_metric.id, resource, event_type, label.id)] = MetricValue(
+            valid_from=valid_from,
+            valid_to=valid_to,
+            service=service,
+            service_metric=service_metric,
+            resource_id=resource,
+            event_type_id=event_type,
+            label=label,
+            value=value or 0,
+            value_raw=value or 0,
+            value_num=value if isinstance(value, (float, Decimal, int)) else None,
+            samples_count=samples or 0,
+        )
+    return list(metric_values.values())
+
+
+def get_metric_label_name(label):
+    if isinstance(label, tuple):
+        label = label[0]
+    return str(label or "count")
+
+
+def get_or_create_metric_labels(labels):
+    """
+    Returns a dict of the MetricLabels by name, creating the missing ones. Labels are either
+    names or (name, user) tuples, as for MetricValue.add
+    """
+    users = {}
+    for label in labels:
+        users.setdefault(get_metric_label_name(label), label[1] if isinstance(label, tuple) else None)
+    out = {}
+    for label in MetricLabel.objects.filter(name__in=users).order_by("id"):
+        out.setdefault(label.name, label)
+    for name, label in out.items():
+        if users[name] and not label.user:
+            label.user = users[name]
+            label.save(update_fields=["user"])
+    missing = [MetricLabel(name=name, user=user) for name, user in users.items() if name not in out]
+    for label in MetricLabel.objects.bulk_create(missing):
+        out[label.name] = label
+    return out
+
+
 def calculate_rate(metric_name, metric_label, current_value, valid_to):
     """
     Find previous network metric value and caclulate rate between them
@@ -210,7 +432,7 @@ def adjust_now_to_noon(now):
     return pytz.utc.localize(datetime.combine(now.date(), time(0, 0, 0)))
 
 
-def aggregate_past_periods(metric_data_q=None, periods=None, cleanup=True, now=None, max_since=None):
+def aggregate_past_periods(metric_data_q=None, periods=None, cleanup=True, now=None, max_since=None, chunk_size=None):
     """
     Aggregate past metric data into longer periods
     @param metric_data_q Query for metric data to use as input
@@ -223,6 +445,12 @@ def aggregate_past_periods(metric_data_q=None, periods=None, cleanup=True, now=N
                (default: current now)
     @param max_since look for data no older than max_since
                      (default: 1 year)
+    @param chunk_size number of periods checked at once for data to aggregate
+                      (default: settings.MONITORING_DATA_AGGREGATION_CHUNK_SIZE)
+
+    Each period is aggregated in its own transaction, and the chunks of periods
+    with nothing left to aggregate are skipped, so that an interrupted run
+    can be started again without redoing the work already done.
     """
     utc = pytz.utc
     if now is None:
@@ -231,6 +459,8 @@ def aggregate_past_periods(metric_data_q=None, periods=None, cleanup=True, now=N
         metric_data_q = MetricValue.objects.all()
     if periods is None:
         periods = settings.MONITORING_DATA_AGGREGATION
+    if chunk_size is None:
+        chunk_size = settings.MONITORING_DATA_AGGREGATION_CHUNK_SIZE
     max_since = max_since or now - timedelta(days=356)
     previous_cutoff = None
     counter = 0
@@ -258,87 +488,290 @@ def aggregate_past_periods(metric_data_q=None, periods=None, cleanup=True, now=N
         )
 
         periods = generate_periods(since, aggregation_period, end=until)
+        # data already aggregated spans exactly one period
+        pending_data_q = metric_data_q.exclude(valid_to=F("valid_from") + aggregation_period, data={})
 
         # for each target period we select mertic values within it
         # and extract service, resource, event type and label combinations
         # then, for each distinctive set, calculate per-metric aggregate values
-        for period_start, period_end in periods:
-            log.debug("period %s - %s (%s s)", period_start, period_end, period_end - period_start)
-            ret = aggregate_period(period_start, period_end, metric_data_q, cleanup)
-            counter += ret
+        while True:
+            chunk = list(islice(periods, chunk_size))
+            if not chunk:
+                break
+            if not pending_data_q.filter(valid_from__gte=chunk[0][0], valid_to__lte=chunk[-1][1]).exists():
+                continue
+            for period_start, period_end in chunk:
+                log.debug("period %s - %s (%s s)", period_start, period_end, period_end - period_start)
+                with transaction.atomic(using=metric_data_q.db):
+                    ret = aggregate_period(period_start, period_end, metric_data_q, cleanup)
+                counter += ret
         previous_cutoff = until
     return counter
 
 
+def get_aggregate_functions():
+    """
+    Returns a list of (metric types, aggregate function) pairs, one for each distinct aggregate function
+    """
+    out = []
+    for metric_type, function in Metric.AGGREGATE_DJANGO_MAP.items():
+        for metric_types, _function in out:
+            if _function == function:
+                metric_types.append(metric_type)
+                break
+        else:
+            out.append(([metric_type], function))
+    return out
+
+
 def aggregate_period(period_start, period_end, metric_data_q, cleanup=True):
-    counter = 0
-    to_remove_data = {"remove_at": period_start.strftime("%Y%m%d%H%M%S")}
+    """
+    Aggregates the metric values within the period into one value for each service, metric,
+    resource, event type and label, returns the number of aggregated values.
+
+    The aggregated values are computed and written by the database, with one INSERT ... SELECT ... GROUP BY
+    for each aggregate function, and the source values are then deleted at once.
+    The values already aggregated for the period, if any, are replaced.
+    """
     source_metric_data = metric_data_q.filter(valid_from__gte=period_start, valid_to__lte=period_end).exclude(
         valid_from=period_start, valid_to=period_end, data={}
     )
-    r = source_metric_data.values_list(
-        "service_id",
-        "service_metric_id",
-        "resource_id",
-        "event_type_id",
-        "label_id",
-    ).distinct("service_id", "service_metric_id", "resource_id", "event_type_id", "label_id")
-    source_metric_data.update(data=to_remove_data)
-
-    for service_id, metric_id, resource_id, event_type_id, label_id in r:
-        m = Metric.objects.filter(service_type__id=metric_id).get()
-        f = m.get_aggregate_field()
-        per_metric_q = source_metric_data.filter(
-            service_metric_id=metric_id,
-            service_id=service_id,
-            resource_id=resource_id,
-            event_type_id=event_type_id,
-            label_id=label_id,
-        )
+    groups_keys = ("service_id", "service_metric_id", "resource_id", "event_type_id", "label_id")
+
+    # previously aggregated values of the groups found again in the source
+    def _nullable_id(expression):
+        return Coalesce(expression, 0, output_field=IntegerField())
+
+    source_groups = source_metric_data.annotate(
+        _resource_id=_nullable_id("resource_id"), _event_type_id=_nullable_id("event_type_id")
+    ).filter(
+        service_id=OuterRef("service_id"),
+        service_metric_id=OuterRef("service_metric_id"),
+        label_id=OuterRef("label_id"),
+        _resource_id=_nullable_id(OuterRef("resource_id")),
+        _event_type_id=_nullable_id(OuterRef("event_type_id")),
+    )
+    metric_data_q.filter(valid_from=period_start, valid_to=period_end, data={}).filter(Exists(source_groups)).delete()
 
-        try:
-            value_q = per_metric_q.aggregate(fvalue=f, fsamples_count=Sum(F("samples_count")))
-        except TypeError as err:
-            raise ValueError(f, m, err)
-        value = value_q["fvalue"]
-        samples_count = value_q["fsamples_count"]
-        if cleanup:
-            per_metric_q.delete()
-        log.debug("Metric %s: %s - %s (value: %s, samples: %s)", m, period_start, period_end, value, samples_count)
-        if not metric_data_q.filter(
-            service_metric_id=metric_id,
-            service_id=service_id,
-            resource_id=resource_id,
-            event_type_id=event_type_id,
-            valid_from=period_start,
-            valid_to=period_end,
-            label_id=label_id,
-        ).exists():
-            MetricValue.objects.create(
-                service_metric_id=metric_id,
-                service_id=service_id,
-                resource_id=resource_id,
-                event_type_id=event_type_id,
-                value=value,
-                value_num=value,
-                value_raw=value,
-                valid_from=period_start,
-                valid_to=period_end,
-                label_id=label_id,
-                samples_count=samples_count,
+    counter = 0
+    connection = connections[metric_data_q.db]
+    opts = MetricValue._meta
+    columns = ", ".join(
+        connection.ops.quote_name(opts.get_field(name).column)
+        for name in (
+            "service",
+            "service_metric",
+            "resource",
+            "event_type",
+            "label",
+            "value",
+            "value_num",
+            "value_raw",
+            "samples_count",
+            "valid_from",
+            "valid_to",
+            "data",
+        )
+    )
+    params = [
+        opts.get_field(name).get_db_prep_save(value, connection)
+        for name, value in (("valid_from", period_start), ("valid_to", period_end), ("data", {}))
+    ]
+    for metric_types, function in get_aggregate_functions():
+        aggregated = (
+            source_metric_data.filter(service_metric__metric__type__in=metric_types)
+            .order_by()
+            .values(*groups_keys)
+            .annotate(fvalue=function, fsamples_count=Sum(F("samples_count")))
+        )
+        select_sql, select_params = aggregated.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(opts.db_table)} ({columns}) "
+                f"SELECT {', '.join(groups_keys)}, COALESCE(fvalue, 0), fvalue, fvalue, COALESCE(fsamples_count, 0), "
+                f"%s, %s, %s FROM ({select_sql}) aggregated",
+                params + list(select_params),
             )
-        else:
-            metric_data_q.filter(
-                service_metric_id=metric_id,
-                service_id=service_id,
-                resource_id=resource_id,
-                event_type_id=event_type_id,
-                valid_from=period_start,
-                valid_to=period_end,
-                label_id=label_id,
-            ).update(value=value, value_num=value, value_raw=value, data=None, samples_count=samples_count)
-        counter += 1
+            counter += cursor.rowcount
+    log.debug("Metrics %s - %s: %s values aggregated", period_start, period_end, counter)
 
     if cleanup:
-        source_metric_data.filter(data=to_remove_data).delete()
+        source_metric_data.delete()
+    return counter
+
+
+ROLLUPS_INTERVALS = {
+    MetricValueRollup.GRANULARITY_DAY: timedelta(days=1),
+    MetricValueRollup.GRANULARITY_HOUR: timedelta(hours=1),
+}
+
+ROLLUP_SQL = """
+insert into monitoring_metricvaluerollup (
+    granularity, bucket, valid_from, valid_to, service_id, service_metric_id, resource_id, event_type_id, label_id,
+    value_num, value_sum, value_min, value_max, samples_count, metric_count
+)
+select %(granularity)s, mv.bucket, mv.span_from, mv.span_to,
+    mv.service_id, mv.service_metric_id, mv.resource_id, mv.event_type_id, mv.label_id,
+    {value_num}, sum(mv.value_sum), min(mv.value_min), max(mv.value_max), coalesce(sum(mv.samples_count), 0),
+    sum(mv.metric_count)
+from (
+    select v.*, b.bucket,
+        case when v.valid_to <= b.bucket + %(interval)s then b.bucket else v.valid_from end as span_from,
+        case when v.valid_to <= b.bucket + %(interval)s then b.bucket + %(interval)s else v.valid_to end as span_to
+    from ({source}) v
+    cross join lateral (
+        select date_trunc(%(granularity)s, v.valid_from at time zone 'UTC') at time zone 'UTC' as bucket
+    ) b
+) mv
+join monitoring_servicetypemetric mt on (mt.id = mv.service_metric_id)
+join monitoring_metric m on (m.id = mt.metric_id)
+group by mv.bucket, mv.span_from, mv.span_to, mv.service_id, mv.service_metric_id, mv.resource_id,
+    mv.event_type_id, mv.label_id, m.type
+"""
+
+METRIC_VALUES_COLUMNS = (
+    "valid_from, valid_to, service_id, service_metric_id, resource_id, event_type_id, label_id, "
+    "value_num, samples_count"
+)
+
+METRIC_VALUES_SOURCE_SQL = (
+    f"select {METRIC_VALUES_COLUMNS}, value_num as value_sum, value_num as value_min, value_num as value_max, "
+    "1 as metric_count from monitoring_metricvalue"
+)
+
+METRIC_VALUES_ROLLUP_SOURCE_SQL = (
+    f"select {METRIC_VALUES_COLUMNS}, value_sum, value_min, value_max, metric_count from monitoring_metricvaluerollup"
+)
+
+METRIC_VALUES_PERIOD_SQL = (
+    "((valid_from >= TIMESTAMP %(valid_from)s AT TIME ZONE 'UTC' "
+    "and valid_to < TIMESTAMP %(valid_to)s AT TIME ZONE 'UTC') "
+    "or (valid_from > TIMESTAMP %(valid_from)s AT TIME ZONE 'UTC' "
+    "and valid_to <= TIMESTAMP %(valid_to)s AT TIME ZONE 'UTC'))"
+)
+
+
+def get_rollups_intervals():
+    """
+    Returns a list of (granularity, interval) of the enabled rollups, the coarsest first
+    """
+    if connections[MetricValueRollup.objects.db].vendor != "postgresql":
+        return []
+    granularities = getattr(settings, "MONITORING_DATA_ROLLUPS", ())
+    return sorted(
+        [
+            (granularity, interval)
+            for granularity, interval in ROLLUPS_INTERVALS.items()
+            if granularity in granularities
+        ],
+        key=lambda rollup: rollup[1],
+        reverse=True,
+    )
+
+
+def refresh_rollups(valid_from, valid_to, service=None):
+    """
+    Computes again the rollups of the buckets overlapping the [valid_from, valid_to) period,
+    optionally only for the given service.
+    The finest rollup is computed from the metric values, each coarser one
+    from the buckets of the finer rollup just refreshed.
+    Returns the number of rollup rows written.
+    """
+    counter = 0
+    connection = connections[MetricValueRollup.objects.db]
+    value_num = " ".join(f"when '{metric_type}' then {f}" for metric_type, f in Metric.AGGREGATE_MAP.items())
+    source_granularity = None
+    for granularity, interval in reversed(get_rollups_intervals()):
+        since = align_period_start(valid_from, interval)
+        until = align_period_end(valid_to, interval)
+        rollups = MetricValueRollup.objects.filter(granularity=granularity, bucket__gte=since, bucket__lt=until)
+        params = {"granularity": granularity, "interval": interval, "since": since, "until": until}
+        if source_granularity:
+            params["source_granularity"] = source_granularity
+            source = (
+                f"{METRIC_VALUES_ROLLUP_SOURCE_SQL} where granularity = %(source_granularity)s "
+                "and bucket >= %(since)s and bucket < %(until)s"
+            )
+        else:
+            source = f"{METRIC_VALUES_SOURCE_SQL} where valid_from >= %(since)s and valid_from < %(until)s"
+        if service:
+            rollups = rollups.filter(service=service)
+            source = f"{source} and service_id = %(service_id)s"
+            params["service_id"] = service.id
+        with transaction.atomic(using=MetricValueRollup.objects.db):
+            rollups.delete()
+            with connection.cursor() as cursor:
+                cursor.execute(ROLLUP_SQL.format(value_num=f"(case m.type {value_num} end)", source=source), params)
+                counter += cursor.rowcount
+        log.debug("Metrics %s - %s: %s %s rollups written", since, until, counter, granularity)
+        source_granularity = granularity
     return counter
+
+
+def get_rollup_for_period(valid_from, valid_to, service=None, service_type=None, label=None):
+    """
+    Returns the (granularity, interval, start, end) of the coarsest rollup with whole buckets
+    between start and end within the period, and rolled up since start for each of the
+    requested services and label, None if there is none.
+    """
+    for granularity, interval in get_rollups_intervals():
+        start = align_period_end(valid_from, interval)
+        end = align_period_start(valid_to, interval)
+        if start >= end:
+            continue
+        rollups = MetricValueRollup.objects.filter(granularity=granularity)
+        if service:
+            rollups = rollups.filter(service=service)
+        elif service_type:
+            rollups = rollups.filter(service__service_type=service_type)
+        if label:
+            rollups = rollups.filter(label=label)
+        # the rollups of each service may start at a different bucket
+        first_buckets = [row["first"] for row in rollups.values("service").annotate(first=Min("bucket"))]
+        if first_buckets and max(first_buckets) <= start:
+            return granularity, interval, start, end
+    return None
+
+
+def get_metric_values_source(valid_from, valid_to, params, service=None, service_type=None, label=None):
+    """
+    Returns the query of the metric values of the %(metric_name)s metric within the period,
+    with the columns of both the raw values and the rollups.
+    The whole buckets within the period are read from the coarsest rollup available,
+    the raw values only for the remaining edges of the period.
+    The rollup is used only when rolled up since its first bucket for the requested services and label.
+    Without period, all the raw values are returned.
+    """
+    metric_sql = (
+        "service_metric_id in (select mt.id from monitoring_servicetypemetric mt "
+        "join monitoring_metric m on (m.id = mt.metric_id) where m.name = %(metric_name)s)"
+    )
+    if valid_from is None or valid_to is None:
+        return f"{METRIC_VALUES_SOURCE_SQL} where {metric_sql}"
+
+    # bounds on the partition column, implied by the period
+    bounds_sql = (
+        "valid_from >= TIMESTAMP %(valid_from)s AT TIME ZONE 'UTC' "
+        "and valid_from <= TIMESTAMP %(valid_to)s AT TIME ZONE 'UTC'"
+    )
+    rollup = get_rollup_for_period(valid_from, valid_to, service=service, service_type=service_type, label=label)
+    if not rollup:
+        return f"{METRIC_VALUES_SOURCE_SQL} where {metric_sql} and {METRIC_VALUES_PERIOD_SQL} and {bounds_sql}"
+
+    granularity, interval, start, end = rollup
+    params.update(
+        {"rollup_granularity": granularity, "rollup_interval": interval, "rollup_from": start, "rollup_to": end}
+    )
+    return " union all ".join(
+        [
+            (
+                f"{METRIC_VALUES_ROLLUP_SOURCE_SQL} where granularity = %(rollup_granularity)s "
+                f"and bucket >= %(rollup_from)s and bucket < %(rollup_to)s and {metric_sql} "
+                f"and (valid_to <= bucket + %(rollup_interval)s or {METRIC_VALUES_PERIOD_SQL})"
+            ),
+            (
+                f"{METRIC_VALUES_SOURCE_SQL} where {metric_sql} and {METRIC_VALUES_PERIOD_SQL} and {bounds_sql} "
+                "and (valid_from < %(rollup_from)s or valid_from >= %(rollup_to)s)"
+            ),
+        ]
+    )
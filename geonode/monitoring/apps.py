@@ -83,3 +83,7 @@ class MonitoringAppConfig(NotificationsAppConfigBase, AppConfig):
                 "task": "geonode.monitoring.tasks.collect_metrics",
                 "schedule": 300.0,
             }
+            settings.CELERY_BEAT_SCHEDULE["maintain_monitoring_partitions"] = {
+                "task": "geonode.monitoring.tasks.maintain_partitions",
+                "schedule": 86400.0,
+            }
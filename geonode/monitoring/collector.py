@@ -39,6 +39,7 @@ from geonode.monitoring.apps import MonitoringAppConfig as AppConf
 from geonode.monitoring.models import (
     Metric,
     MetricValue,
+    MetricValueRollup,
     RequestEvent,
     MonitoredResource,
     ExceptionEvent,
@@ -48,6 +49,7 @@ from geonode.monitoring.models import (
 )
 
 from geonode.monitoring.utils import generate_periods, align_period_start, align_period_end
+from geonode.monitoring.partitions import drop_old_partitions
 from geonode.monitoring.aggregation import (
     aggregate_past_periods,
     calculate_rate,
@@ -59,6 +61,9 @@ from geonode.monitoring.aggregation import (
     get_resources_for_metric,
     get_labels_for_metric,
     get_metric_names,
+    rollup_requests,
+    refresh_rollups,
+    get_metric_values_source,
 )
 from geonode.base.models import ResourceBase
 from geonode.utils import parse_datetime
@@ -455,6 +460,9 @@ class CollectorAPI:
         """
         return extract_special_event_types(requests)
 
+    def rollup_requests(self, service, requests, valid_from, valid_to):
+        return rollup_requests(service, requests, valid_from, valid_to)
+
     def set_metric_values(self, metric_name, column_name, requests, service, **metric_values):
         metric = Metric.get_for(metric_name, service=service)
 
@@ -524,11 +532,14 @@ class CollectorAPI:
 
     def process(self, service, data, valid_from, valid_to, *args, **kwargs):
         if service.is_hostgeonode:
-            return self.process_host_geonode(service, data, valid_from, valid_to, *args, **kwargs)
+            processed = self.process_host_geonode(service, data, valid_from, valid_to, *args, **kwargs)
         elif service.is_hostgeoserver:
-            return self.process_host_geoserver(service, data, valid_from, valid_to, *args, **kwargs)
+            processed = self.process_host_geoserver(service, data, valid_from, valid_to, *args, **kwargs)
         else:
-            return self.process_requests(service, data, valid_from, valid_to, *args, **kwargs)
+            processed = self.process_requests(service, data, valid_from, valid_to, *args, **kwargs)
+        # keep the rollups of the processed period up to date, values are written by aligned periods
+        self.refresh_rollups(align_period_start(valid_from, service.check_interval), valid_to, service=service)
+        return processed
 
     def process_requests(self, service, requests, valid_from, valid_to):
         """
@@ -572,112 +583,15 @@ class CollectorAPI:
         """
         Processes requests information into metric values
         """
-        log.debug("Processing batch of %s requests from %s to %s", requests.count(), valid_from, valid_to)
-        if not requests.count():
+        count = requests.count()
+        log.debug("Processing batch of %s requests from %s to %s", count, valid_from, valid_to)
+        if not count:
             return
-        event_all = EventType.objects.get(name=EventType.EVENT_ALL)
-        metric_defaults = {
-            "valid_from": valid_from,
-            "valid_to": valid_to,
-            "event_type": event_all,
-            "resource": None,
-            "service": service,
-        }
         MetricValue.objects.filter(valid_from__gte=valid_from, valid_to__lte=valid_to, service=service).delete()
         requests = requests.filter(service=service)
-        resources = self.extract_resources(requests)
-
-        def push_metric_values(srequests, **mdefaults):
-            count = srequests.count()
-            count_mdefaults = mdefaults.copy()
-            count_mdefaults["value"] = count
-            count_mdefaults["label"] = "Count"
-            count_mdefaults["value_num"] = count
-            count_mdefaults["value_raw"] = count
-            count_mdefaults["samples_count"] = count
-
-            log.debug(MetricValue.add("request.count", **count_mdefaults))
-
-            paths = srequests.distinct("request_path").values_list("request_path", flat=True)
-            for path in paths:
-                count = srequests.filter(request_path=path).count()
-                count_mdefaults["value"] = count
-                count_mdefaults["label"] = path
-                count_mdefaults["value_num"] = count
-                count_mdefaults["value_raw"] = count
-                count_mdefaults["samples_count"] = count
-
-                log.debug(MetricValue.add("request.path", **count_mdefaults))
-
-            for mname, cname in (
-                (
-                    "request.ip",
-                    "client_ip",
-                ),
-                (
-                    "request.users",
-                    "user_identifier",
-                ),
-                ("request.country", "client_country"),
-                (
-                    "request.city",
-                    "client_city",
-                ),
-                ("request.region", "client_region"),
-                (
-                    "request.ua",
-                    "user_agent",
-                ),
-                (
-                    "request.ua.family",
-                    "user_agent_family",
-                ),
-                (
-                    "response.time",
-                    "response_time",
-                ),
-                (
-                    "response.size",
-                    "response_size",
-                ),
-                (
-                    "response.status",
-                    "response_status",
-                ),
-                (
-                    "request.method",
-                    "request_method",
-                ),
-            ):
-                # calculate overall stats
-                self.set_metric_values(mname, cname, srequests, **mdefaults)
-
-            self.set_error_values(srequests, valid_from, valid_to, service=service, resource=None)
-
-        push_metric_values(requests, **metric_defaults)
-
-        # for each resource we should calculate another set of stats
-        for resource, _requests in [
-            (
-                None,
-                requests,
-            )
-        ] + resources:
-            metric_defaults["resource"] = resource
-            metric_defaults["event_type"] = event_all
-            push_metric_values(_requests, **metric_defaults)
-
-            # for each event type we need separate metrics set
-            event_types = self.extract_event_types(_requests)
-            for event_type in event_types:
-                event_type_requests = _requests.filter(event_type=event_type)
-                metric_defaults["event_type"] = event_type
-                push_metric_values(event_type_requests, **metric_defaults)
-
-            # combined event types: ows and non-ows
-            for evt, rq in self.extract_special_event_types(_requests):
-                metric_defaults["event_type"] = evt
-                push_metric_values(rq, **metric_defaults)
+        metric_values = self.rollup_requests(service, requests, valid_from, valid_to)
+        MetricValue.objects.bulk_create(metric_values)
+        log.debug("Written %s metric values from %s to %s", len(metric_values), valid_from, valid_to)
 
     def get_metrics_for(
         self,
@@ -800,10 +714,10 @@ class CollectorAPI:
                     "mr.name",
                     "mr.resource_id",
                     "count(distinct(ml.name)) as val",
-                    "count(1) as metric_count",
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
                 "where": ["and mv.resource_id is not NULL"],
@@ -819,10 +733,10 @@ class CollectorAPI:
                     "mr.name",
                     "mr.resource_id",
                     "count(distinct(ml.user)) as val",
-                    "count(1) as metric_count",
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
                 "where": ["and mv.resource_id is not NULL"],
@@ -835,10 +749,10 @@ class CollectorAPI:
                 "select_only": [
                     (
                         "count(distinct(mr.id)) as val, "
-                        "count(1) as metric_count, "
+                        "coalesce(sum(mv.metric_count), 0) as metric_count, "
                         "sum(samples_count) as samples_count, "
-                        "sum(mv.value_num), min(mv.value_num), "
-                        "max(mv.value_num)"
+                        "sum(mv.value_sum), min(mv.value_min), "
+                        "max(mv.value_max)"
                     )
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
@@ -850,11 +764,11 @@ class CollectorAPI:
             "event_type": {
                 "select_only": [
                     "ev.name as event_type",
-                    "sum(mv.value_num) as val",
-                    "count(1) as metric_count",
+                    "sum(mv.value_sum) as val",
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [
                     "join monitoring_eventtype ev on (ev.id = mv.event_type_id)",
@@ -870,10 +784,10 @@ class CollectorAPI:
                 "select_only": [
                     "ev.name as event_type",
                     "count(distinct(ml.name)) as val",
-                    "count(1) as metric_count",
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [
                     "join monitoring_eventtype ev on (ev.id = mv.event_type_id)",
@@ -889,10 +803,10 @@ class CollectorAPI:
                 "select_only": [
                     "ev.name as event_type",
                     "count(distinct(ml.user)) as val",
-                    "count(1) as metric_count",
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [
                     "join monitoring_eventtype ev on (ev.id = mv.event_type_id)",
@@ -908,8 +822,8 @@ class CollectorAPI:
                 "select_only": [
                     (
                         "count(distinct(ml.user)) as val, "
-                        "count(1) as metric_count, sum(samples_count) as samples_count, "
-                        "sum(mv.value_num), min(mv.value_num), max(mv.value_num)"
+                        "coalesce(sum(mv.metric_count), 0) as metric_count, sum(samples_count) as samples_count, "
+                        "sum(mv.value_sum), min(mv.value_min), max(mv.value_max)"
                     )
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
@@ -922,10 +836,11 @@ class CollectorAPI:
             # number of labels for each user
             "user_on_label": {
                 "select_only": [
-                    "ml.user as user, count(distinct(ml.name)) as val, " "count(1) as metric_count",
+                    "ml.user as user, count(distinct(ml.name)) as val, "
+                    "coalesce(sum(mv.metric_count), 0) as metric_count",
                     "sum(samples_count) as samples_count",
-                    "sum(mv.value_num), min(mv.value_num)",
-                    "max(mv.value_num)",
+                    "sum(mv.value_sum), min(mv.value_min)",
+                    "max(mv.value_max)",
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
                 "where": ["and ml.user is not NULL"],
@@ -938,8 +853,8 @@ class CollectorAPI:
                 "select_only": [
                     (
                         "count(distinct(ml.name)) as val, "
-                        "count(1) as metric_count, sum(samples_count) as samples_count, "
-                        "sum(mv.value_num), min(mv.value_num), max(mv.value_num)"
+                        "coalesce(sum(mv.metric_count), 0) as metric_count, sum(samples_count) as samples_count, "
+                        "sum(mv.value_sum), min(mv.value_min), max(mv.value_max)"
                     )
                 ],
                 "from": [("join monitoring_monitoredresource mr " "on (mv.resource_id = mr.id)")],
@@ -950,22 +865,25 @@ class CollectorAPI:
             },
         }
 
+        # whole buckets of the period are read from the rollups, the uptime is not bound to the period
+        if metric_name == "uptime":
+            source = get_metric_values_source(None, None, params)
+        else:
+            source = get_metric_values_source(
+                valid_from.replace(tzinfo=utc),
+                valid_to.replace(tzinfo=utc),
+                params,
+                service=service,
+                service_type=service_type,
+                label=label,
+            )
         q_from = [
-            "from monitoring_metricvalue mv",
+            f"from ({source}) mv",
             "join monitoring_servicetypemetric mt on (mv.service_metric_id = mt.id)",
             "join monitoring_metric m on (m.id = mt.metric_id)",
             "join monitoring_metriclabel ml on (mv.label_id = ml.id) ",
         ]
-        q_where = [
-            "where",
-            " ((mv.valid_from >= TIMESTAMP %(valid_from)s AT TIME ZONE 'UTC' ",
-            "and mv.valid_to < TIMESTAMP %(valid_to)s AT TIME ZONE 'UTC') ",
-            "or (mv.valid_from > TIMESTAMP %(valid_from)s AT TIME ZONE 'UTC' ",
-            "and mv.valid_to <= TIMESTAMP %(valid_to)s AT TIME ZONE 'UTC')) ",
-            "and m.name = %(metric_name)s",
-        ]
-        if metric_name == "uptime":
-            q_where = ["where", "m.name = %(metric_name)s"]
+        q_where = ["where", "m.name = %(metric_name)s"]
         q_group = ["ml.name"]
 
         params.update(
@@ -981,8 +899,8 @@ class CollectorAPI:
         q_select = [
             (
                 f"select ml.name as label, {agg_f} as val, "
-                "count(1) as metric_count, sum(samples_count) as samples_count, "
-                "sum(mv.value_num), min(mv.value_num), max(mv.value_num)"
+                "coalesce(sum(mv.metric_count), 0) as metric_count, sum(samples_count) as samples_count, "
+                "sum(mv.value_sum), min(mv.value_min), max(mv.value_max)"
             )
         ]
         if service and service_type:
@@ -1115,6 +1033,12 @@ class CollectorAPI:
         """
         return aggregate_past_periods(metric_data_q, periods, **kwargs)
 
+    def refresh_rollups(self, valid_from, valid_to, service=None):
+        """
+        Computes again the metric values rollups of the period
+        """
+        return refresh_rollups(valid_from, valid_to, service=service)
+
     def clear_old_data(self):
         utc = pytz.utc
         threshold = settings.MONITORING_DATA_TTL
@@ -1123,9 +1047,12 @@ class CollectorAPI:
                 "MONITORING_DATA_TTL should be an instance of " f"datatime.timedelta, not {threshold.__class__}"
             )
         cutoff = datetime.utcnow().replace(tzinfo=utc) - threshold
+        # whole partitions are dropped first, if any, leaving only a few rows to delete
+        drop_old_partitions(cutoff)
         ExceptionEvent.objects.filter(created__lte=cutoff).delete()
         RequestEvent.objects.filter(created__lte=cutoff).delete()
         MetricValue.objects.filter(valid_to__lte=cutoff).delete()
+        MetricValueRollup.objects.filter(valid_to__lte=cutoff).delete()
 
     def compose_notifications(self, ndata, when=None):
         utc = pytz.utc
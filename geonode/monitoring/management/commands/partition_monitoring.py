@@ -0,0 +1,56 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import gettext_noop as _
+
+from geonode.monitoring import partitions
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Store the monitoring requests events and metric values in time-range partitions (PostgreSQL only)
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('-c', '--convert', dest='convert', action='store_true', default=False,
+                            help=_("Convert the monitoring tables not partitioned yet, they are locked "
+                                   "while their rows are copied"))
+        parser.add_argument('-l', '--list', dest='list_partitions', action='store_true', default=False,
+                            help=_("Show list of partitions"))
+
+    def handle(self, *args, **options):
+        if not partitions.is_supported():
+            raise CommandError("Partitioned monitoring tables require PostgreSQL")
+        for model, column in partitions.PARTITIONED_MODELS:
+            table = model._meta.db_table
+            if not partitions.is_partitioned(model):
+                if not options['convert']:
+                    self.stdout.write(f"{table} is not partitioned, use --convert to partition it")
+                    continue
+                self.stdout.write(f"Partitioning {table} by {column}")
+                partitions.partition_table(model, column)
+            if options['list_partitions']:
+                for name, start, end in partitions.get_partitions(model):
+                    self.stdout.write(f"  {name}: {start} - {end}")
+        for table, created in partitions.maintain_partitions().items():
+            self.stdout.write(f"{table}: {len(created)} partitions created ahead of time")
@@ -0,0 +1,62 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import logging
+from datetime import datetime, timedelta
+
+import pytz
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Min
+from django.utils.translation import gettext_noop as _
+
+from geonode.utils import parse_datetime
+from geonode.monitoring.models import MetricValue
+from geonode.monitoring.collector import CollectorAPI
+from geonode.monitoring.utils import generate_periods
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Roll up the metric values by hour and day, one day at a time (PostgreSQL only)
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('-s', '--since', dest='since', default=None, type=parse_datetime,
+                            help=_("Roll up data since specific UTC timestamp (YYYY-MM-DD HH:MM:SS format). "
+                                   "If not provided, the oldest metric value will be used."))
+        parser.add_argument('-u', '--until', dest='until', default=None, type=parse_datetime,
+                            help=_("Roll up data until specific UTC timestamp (YYYY-MM-DD HH:MM:SS format). "
+                                   "If not provided, now will be used."))
+
+    def handle(self, *args, **options):
+        # Exit early if MONITORING_ENABLED=False
+        if not settings.MONITORING_ENABLED:
+            return
+        utc = pytz.utc
+        since = options['since'] or MetricValue.objects.aggregate(since=Min('valid_from'))['since']
+        if not since:
+            return
+        until = options['until'] or datetime.utcnow()
+        c = CollectorAPI()
+        counter = 0
+        for pstart, pend in generate_periods(since.replace(tzinfo=utc), timedelta(days=1), until.replace(tzinfo=utc)):
+            counter += c.refresh_rollups(pstart, pend)
+        self.stdout.write(f"{counter} rollups written")
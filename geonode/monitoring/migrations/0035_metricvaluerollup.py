@@ -0,0 +1,87 @@
+# Generated by Django 4.2.9 on 2026-10-18 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("monitoring", "0034_alter_notificationcheck_metrics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MetricValueRollup",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "granularity",
+                    models.CharField(choices=[("hour", "Hour"), ("day", "Day")], max_length=16),
+                ),
+                ("bucket", models.DateTimeField()),
+                ("valid_from", models.DateTimeField()),
+                ("valid_to", models.DateTimeField()),
+                (
+                    "value_num",
+                    models.DecimalField(blank=True, decimal_places=4, default=None, max_digits=20, null=True),
+                ),
+                (
+                    "value_sum",
+                    models.DecimalField(blank=True, decimal_places=4, default=None, max_digits=20, null=True),
+                ),
+                (
+                    "value_min",
+                    models.DecimalField(blank=True, decimal_places=4, default=None, max_digits=20, null=True),
+                ),
+                (
+                    "value_max",
+                    models.DecimalField(blank=True, decimal_places=4, default=None, max_digits=20, null=True),
+                ),
+                ("samples_count", models.PositiveBigIntegerField(default=0)),
+                ("metric_count", models.PositiveIntegerField(default=0)),
+                (
+                    "event_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="monitoring.eventtype",
+                    ),
+                ),
+                (
+                    "label",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="monitoring.metriclabel"
+                    ),
+                ),
+                (
+                    "resource",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="monitoring.monitoredresource",
+                    ),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="monitoring.service"
+                    ),
+                ),
+                (
+                    "service_metric",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="monitoring.servicetypemetric",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["granularity", "bucket"], name="monitoring_rollup_bucket_idx")],
+            },
+        ),
+    ]
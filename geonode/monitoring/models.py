@@ -556,29 +556,31 @@ class RequestEvent(models.Model):
         return out
 
     @classmethod
-    def _get_geonode_resources(cls, request):
+    def _get_events_resources(cls, events, cache=None):
         """
-        Return serialized resources affected by request
+        Return resources affected by the given events, `cache` (optional) keeps
+        the ones already resolved by previous calls
         """
-        rqmeta = getattr(request, "_monitoring", {})
-        events = rqmeta["events"]
+        cache = {} if cache is None else cache
         resources = []
         # for type_name in 'layer map document style'.split():
         #     res = rqmeta['resources'].get(type_name) or []
         #     resources.extend(cls._get_resources(type_name, res))
 
         for evt_type, res_type, res_name, res_id in events:
-            resources.extend(cls._get_or_create_resources(res_name, res_type, res_id))
+            key = (res_name, res_type, res_id)
+            if key not in cache:
+                cache[key] = cls._get_or_create_resources(res_name, res_type, res_id)
+            resources.extend(cache[key])
 
         return resources
 
     @classmethod
-    def _get_event_type(cls, request, default_event_type="view"):
+    def _get_events_type(cls, events, default_event_type="view"):
         """
-        Returns event type based on events
+        Returns event type based on the given events
         """
-        rqmeta = getattr(request, "_monitoring", {})
-        events = {e[0] for e in rqmeta["events"]}
+        events = {e[0] for e in events}
         event_name = default_event_type
         if len(events) == 1:
             event_name = events.pop()
@@ -644,6 +646,10 @@ class RequestEvent(models.Model):
 
     @classmethod
     def _get_user_data_gn(cls, request):
+        """
+        Returns the user data of the request, the raw user agent and client ip only:
+        their family and location are resolved by `bulk_from_geonode`
+        """
         out = {}
         # check consent
         if not cls._get_user_consent(request):
@@ -655,14 +661,11 @@ class RequestEvent(models.Model):
         if rqmeta.get("user_username"):
             out["user_username"] = rqmeta.get("user_username")
 
-        ua = request.META.get("HTTP_USER_AGENT") or ""
-        ua_data = cls._get_user_agent(ua)
-        out.update(ua_data)
+        out["user_agent"] = request.META.get("HTTP_USER_AGENT") or ""
 
         request_ip, is_routable = get_client_ip(request)
         if request_ip and is_routable:
-            location_data = cls._get_user_location(request_ip)
-            out.update(location_data)
+            out["client_ip"] = request_ip
         return out
 
     @classmethod
@@ -684,7 +687,14 @@ class RequestEvent(models.Model):
         return out
 
     @classmethod
-    def from_geonode(cls, service, request, response):
+    def get_geonode_event_data(cls, request, response):
+        """
+        Returns a snapshot of the request and the response made of plain values only,
+        to be written later, out of the request thread, by `bulk_from_geonode`.
+
+        Everything requiring a lookup (event type, resources, user agent family,
+        client location) is resolved at writing time.
+        """
         from geonode.utils import parse_datetime
 
         received = datetime.utcnow().replace(tzinfo=pytz.utc)
@@ -695,17 +705,13 @@ class RequestEvent(models.Model):
         _ended = rqmeta.get("finished", datetime.utcnow().replace(tzinfo=pytz.utc))
         duration = (_ended - created).microseconds / 1000.0
 
-        sensitive_data = cls._get_user_data_gn(request)
-        event_type = cls._get_event_type(request)
-
         data = {
             "received": received,
             "created": created,
             "host": request.get_host(),
-            "service": service,
             "user_identifier": None,
             "user_username": None,
-            "event_type": event_type,
+            "events": list(rqmeta.get("events") or []),
             "request_path": request.get_full_path(),
             "request_method": request.method,
             "response_status": response.status_code,
@@ -714,15 +720,47 @@ class RequestEvent(models.Model):
             "response_time": duration,
         }
 
-        data.update(sensitive_data)
+        data.update(cls._get_user_data_gn(request))
+        return data
+
+    @classmethod
+    def bulk_from_geonode(cls, service, events_data):
+        """
+        Writes the RequestEvents, and their resources, for a list of snapshots
+        returned by `get_geonode_event_data`, with one insert for the events and
+        one for their links to the resources.
+        """
+        events, events_resources = [], []
+        resources_cache, locations_cache = {}, {}
+        for data in events_data:
+            data = dict(data)
+            events_list = data.pop("events", [])
+            user_agent = data.pop("user_agent", None)
+            client_ip = data.pop("client_ip", None)
+            if user_agent is not None:
+                data.update(cls._get_user_agent(user_agent))
+            if client_ip:
+                if client_ip not in locations_cache:
+                    locations_cache[client_ip] = cls._get_user_location(client_ip)
+                data.update(locations_cache[client_ip])
+            events.append(cls(service=service, event_type=cls._get_events_type(events_list), **data))
+            events_resources.append(cls._get_events_resources(events_list, cache=resources_cache))
+
+        events = cls.objects.bulk_create(events)
+        through = cls.resources.through
+        through.objects.bulk_create(
+            [
+                through(requestevent=event, monitoredresource=resource)
+                for event, resources in zip(events, events_resources)
+                for resource in {r.pk: r for r in resources}.values()
+            ]
+        )
+        return events
 
+    @classmethod
+    def from_geonode(cls, service, request, response):
         try:
-            inst = cls.objects.create(**data)
-            resources = cls._get_geonode_resources(request)
-            if resources:
-                inst.resources.add(*resources)
-                inst.save()
-            return inst
+            return cls.bulk_from_geonode(service, [cls.get_geonode_event_data(request, response)])[0]
         except Exception:
             return None
 
@@ -1068,6 +1106,47 @@ class MetricValue(models.Model):
         return q
 
 
+class MetricValueRollup(models.Model):
+    """
+    Metric values rolled up by hour or day, for each service, metric, resource, event type and label.
+    The values fitting in the bucket are summed up over its whole span, the longer ones keep their own.
+    """
+
+    GRANULARITY_HOUR = "hour"
+    GRANULARITY_DAY = "day"
+
+    GRANULARITIES = (
+        (GRANULARITY_HOUR, _("Hour")),
+        (GRANULARITY_DAY, _("Day")),
+    )
+
+    granularity = models.CharField(max_length=16, null=False, blank=False, choices=GRANULARITIES)
+    bucket = models.DateTimeField(null=False)
+    valid_from = models.DateTimeField(null=False)
+    valid_to = models.DateTimeField(null=False)
+    service_metric = models.ForeignKey(ServiceTypeMetric, related_name="+", on_delete=models.CASCADE)
+    service = models.ForeignKey(Service, related_name="+", on_delete=models.CASCADE)
+    event_type = models.ForeignKey(EventType, null=True, blank=True, related_name="+", on_delete=models.CASCADE)
+    resource = models.ForeignKey(MonitoredResource, null=True, blank=True, related_name="+", on_delete=models.CASCADE)
+    label = models.ForeignKey(MetricLabel, related_name="+", on_delete=models.CASCADE)
+    # value aggregated according to the metric type, as the raw values would be
+    value_num = models.DecimalField(max_digits=20, decimal_places=4, null=True, default=None, blank=True)
+    value_sum = models.DecimalField(max_digits=20, decimal_places=4, null=True, default=None, blank=True)
+    value_min = models.DecimalField(max_digits=20, decimal_places=4, null=True, default=None, blank=True)
+    value_max = models.DecimalField(max_digits=20, decimal_places=4, null=True, default=None, blank=True)
+    samples_count = models.PositiveBigIntegerField(null=False, default=0, blank=False)
+    # number of raw values rolled up
+    metric_count = models.PositiveIntegerField(null=False, default=0, blank=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["granularity", "bucket"], name="monitoring_rollup_bucket_idx"),
+        ]
+
+    def __str__(self):
+        return f"Metric Value Rollup: {self.granularity} {self.bucket} ({self.service_metric}, {self.label})"
+
+
 class NotificationCheck(models.Model):
     GRACE_PERIOD_1M = timedelta(seconds=60)
     GRACE_PERIOD_5M = timedelta(seconds=5 * 60)
@@ -0,0 +1,264 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import re
+import logging
+
+from datetime import datetime, timedelta
+
+import pytz
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from geonode.monitoring.models import ExceptionEvent, MetricValue, RequestEvent
+
+log = logging.getLogger(__name__)
+
+# monitoring models which can be stored in time-range partitions, along with their partition column
+PARTITIONED_MODELS = (
+    (RequestEvent, "created"),
+    (MetricValue, "valid_from"),
+)
+
+PARTITIONS_INTERVALS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+
+def is_supported():
+    return connection.vendor == "postgresql"
+
+
+def get_interval():
+    try:
+        return PARTITIONS_INTERVALS[settings.MONITORING_PARTITIONS_INTERVAL]
+    except KeyError:
+        raise ValueError(
+            f"MONITORING_PARTITIONS_INTERVAL should be one of {', '.join(PARTITIONS_INTERVALS)}, "
+            f"not {settings.MONITORING_PARTITIONS_INTERVAL}"
+        )
+
+
+def get_partition_start(moment, interval):
+    """
+    Returns the start of the partition containing the moment: midnight UTC, on monday for weekly partitions
+    """
+    if moment.tzinfo:
+        moment = moment.astimezone(pytz.utc)
+    start = datetime.combine(moment.date(), datetime.min.time()).replace(tzinfo=pytz.utc)
+    if interval >= PARTITIONS_INTERVALS["week"]:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def get_partition_name(table, start, end):
+    return f"{table}_p{start:%Y%m%d}_{end:%Y%m%d}"
+
+
+def is_partitioned(model):
+    if not is_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [model._meta.db_table])
+        return cursor.fetchone() is not None
+
+
+def get_partitions(model):
+    """
+    Returns the list of (name, start, end) of the time-range partitions of the model, the oldest first
+    """
+    table = model._meta.db_table
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{8}})_(\d{{8}})$")
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass",
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            start, end = (datetime.strptime(value, "%Y%m%d").replace(tzinfo=pytz.utc) for value in match.groups())
+            partitions.append((name, start, end))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def _create_partition(cursor, table, column, start, end, parent=None):
+    """
+    Creates the partition, moving there the rows of the default partition in its range
+    """
+    qn = connection.ops.quote_name
+    name = get_partition_name(table, start, end)
+    default = qn(f"{table}_default")
+    cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(parent or table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {default} WHERE {qn(column)} >= %s AND {qn(column)} < %s RETURNING *) "
+        f"INSERT INTO {qn(name)} SELECT * FROM moved",
+        [start, end],
+    )
+    cursor.execute(
+        f"ALTER TABLE {qn(parent or table)} ATTACH PARTITION {qn(name)} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    return name
+
+
+def create_partitions(model, column, until, since=None, parent=None):
+    """
+    Creates the missing partitions of the model from since (default: now) until the given moment,
+    returns the names of the created ones.
+    """
+    interval = get_interval()
+    table = model._meta.db_table
+    existing = [] if parent else get_partitions(model)
+    start = get_partition_start(since or datetime.utcnow().replace(tzinfo=pytz.utc), interval)
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        while start < until:
+            end = start + interval
+            overlapping = [_end for _, _start, _end in existing if _start < end and _end > start]
+            if overlapping:
+                start = max(overlapping)
+                continue
+            created.append(_create_partition(cursor, table, column, start, end, parent=parent))
+            start = end
+    return created
+
+
+def maintain_partitions(now=None):
+    """
+    Creates ahead of time the partitions of the partitioned monitoring tables
+    """
+    if not is_supported():
+        return {}
+    now = now or datetime.utcnow().replace(tzinfo=pytz.utc)
+    until = now + get_interval() * settings.MONITORING_PARTITIONS_AHEAD
+    created = {}
+    for model, column in PARTITIONED_MODELS:
+        if is_partitioned(model):
+            created[model._meta.db_table] = create_partitions(model, column, until, since=now)
+    return created
+
+
+def drop_old_partitions(cutoff):
+    """
+    Drops the partitions of the partitioned monitoring tables holding data older than the cutoff only,
+    returns the names of the dropped ones.
+    """
+    if not is_supported():
+        return []
+    qn = connection.ops.quote_name
+    # metric values are partitioned by their start, which can be up to the longest aggregation period before their end
+    margin = max(
+        (aggregation for _, aggregation in getattr(settings, "MONITORING_DATA_AGGREGATION", ())), default=timedelta(0)
+    )
+    through = RequestEvent.resources.through._meta
+    dropped = []
+    for model, column in PARTITIONED_MODELS:
+        if not is_partitioned(model):
+            continue
+        for name, start, end in get_partitions(model):
+            if end > (cutoff - margin if model is MetricValue else cutoff):
+                break
+            with transaction.atomic(), connection.cursor() as cursor:
+                if model is RequestEvent:
+                    # there are no foreign keys to a partitioned table, the related rows are deleted here
+                    for related_table, related_column in (
+                        (through.db_table, through.get_field("requestevent").column),
+                        (ExceptionEvent._meta.db_table, ExceptionEvent._meta.get_field("request").column),
+                    ):
+                        cursor.execute(
+                            f"DELETE FROM {qn(related_table)} WHERE {qn(related_column)} IN (SELECT id FROM {qn(name)})"
+                        )
+                cursor.execute(f"DROP TABLE {qn(name)}")
+            dropped.append(name)
+    if dropped:
+        log.info(f"Dropped monitoring partitions: {', '.join(dropped)}")
+    return dropped
+
+
+def partition_table(model, column, now=None):
+    """
+    Converts the table of the model into a table partitioned by time ranges of the column, with one partition
+    for each interval from the oldest row until the partitions created ahead of time, plus a default one.
+
+    The table is locked while its rows are copied. Foreign keys referencing the table are dropped, as a
+    partitioned table can not have a unique key on the id alone.
+    """
+    qn = connection.ops.quote_name
+    table = model._meta.db_table
+    partitioned = f"{table}_partitioned"
+    sequence = f"{table}_partitioned_id_seq"
+    now = now or datetime.utcnow().replace(tzinfo=pytz.utc)
+    until = now + get_interval() * settings.MONITORING_PARTITIONS_AHEAD
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid), i.indisunique, "
+            "ARRAY(SELECT a.attname FROM pg_attribute a WHERE a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)) "
+            "FROM pg_index i WHERE i.indrelid = %s::regclass AND NOT i.indisprimary",
+            [table],
+        )
+        indexes = []
+        for definition, unique, columns in cursor.fetchall():
+            if unique and column not in columns:
+                log.warning(f"Unique index not kept on the partitioned {table}: {definition}")
+                continue
+            indexes.append(definition)
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+            "WHERE confrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        referencing_keys = cursor.fetchall()
+        cursor.execute(f"SELECT MIN({qn(column)}), MAX(id) FROM {qn(table)}")
+        since, max_id = cursor.fetchone()
+
+        cursor.execute(
+            f"CREATE TABLE {qn(partitioned)} (LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({qn(column)})"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(partitioned)} ADD CONSTRAINT {qn(f'{table}_p_pkey')} PRIMARY KEY (id, {qn(column)})"
+        )
+        cursor.execute(f"CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(partitioned)}.id")
+        cursor.execute("SELECT setval(%s, %s, %s)", [sequence, max_id or 1, max_id is not None])
+        cursor.execute(f"ALTER TABLE {qn(partitioned)} ALTER COLUMN id SET DEFAULT nextval('{sequence}'::regclass)")
+        cursor.execute(f"CREATE TABLE {qn(f'{table}_default')} PARTITION OF {qn(partitioned)} DEFAULT")
+        create_partitions(model, column, until, since=since or now, parent=partitioned)
+        cursor.execute(f"INSERT INTO {qn(partitioned)} SELECT * FROM {qn(table)}")
+
+        for referencing_table, name in referencing_keys:
+            cursor.execute(f"ALTER TABLE {qn(referencing_table)} DROP CONSTRAINT {qn(name)}")
+        cursor.execute(f"DROP TABLE {qn(table)}")
+        cursor.execute(f"ALTER TABLE {qn(partitioned)} RENAME TO {qn(table)}")
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME CONSTRAINT {qn(f'{table}_p_pkey')} TO {qn(f'{table}_pkey')}")
+        cursor.execute(f"ALTER SEQUENCE {qn(sequence)} RENAME TO {qn(f'{table}_id_seq')}")
+        for definition in indexes:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+    log.info(f"{table} partitioned by {column}")
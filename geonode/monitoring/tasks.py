@@ -41,3 +41,22 @@ def collect_metrics(self):
     if settings.MONITORING_ENABLED:
         return call_command("collect_metrics", "-n", "-t", "xml")
     return True
+
+
+@shared_task(
+    bind=True,
+    name="geonode.monitoring.tasks.maintain_partitions",
+    queue="geoserver.events",
+    expires=3600,
+    time_limit=600,
+    acks_late=False,
+)
+def maintain_partitions(self):
+    """
+    Create ahead of time the partitions of the partitioned monitoring tables
+    """
+    if settings.MONITORING_ENABLED:
+        from geonode.monitoring.partitions import maintain_partitions
+
+        return maintain_partitions()
+    return True
@@ -22,6 +22,7 @@ from geonode.tests.base import GeoNodeLiveTestSupport
 from datetime import datetime, timedelta
 
 import os
+import sys
 import time
 import json
 import pytz
@@ -33,9 +34,14 @@ from decimal import Decimal  # noqa
 from importlib import import_module
 from owslib.etree import etree as dlxml
 
+from unittest import mock
+
 from django.core import mail
 from django.conf import settings
-from django.db import connections
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory
+from django.db import connections, transaction
+from django.db.models import Max, Min, Sum
 from django.urls import reverse
 from django.test.utils import override_settings
 from django.core.management import call_command
@@ -50,6 +56,7 @@ from geonode.monitoring.models import (
     ExceptionEvent,
     MetricNotificationCheck,
     MetricValue,
+    MetricValueRollup,
     NotificationCheck,
     Metric,
     EventType,
@@ -60,7 +67,9 @@ from geonode.monitoring.models import (
 from geonode.monitoring.models import do_autoconfigure
 from geonode.compat import ensure_string
 from geonode.monitoring.collector import CollectorAPI
-from geonode.monitoring.utils import generate_periods, align_period_start
+from geonode.monitoring import partitions
+from geonode.monitoring.aggregation import aggregate_period, get_rollup_for_period, get_rollups_intervals
+from geonode.monitoring.utils import generate_periods, align_period_start, MonitoringHandler, RequestEventsIngestion
 from geonode.base.models import ResourceBase
 from geonode.layers.models import Dataset
 from geonode.monitoring.models import *  # noqa
@@ -284,6 +293,58 @@ class RequestsTestCase(MonitoringTestBase):
         if eq:
             self.assertEqual("django.http.response.Http404", eq.error_type)
 
+    @mock.patch.object(RequestEventsIngestion, "start")
+    def test_gn_request_ingestion(self, start):
+        """
+        Test that geonode requests are queued and written in batches
+        """
+        _l = create_single_dataset("san_andres_y_providencia_poi")
+
+        ingestion = RequestEventsIngestion(self.service, queue_size=2, batch_size=10)
+        handler = MonitoringHandler(self.service, ingestion=ingestion)
+        now = datetime.utcnow().replace(tzinfo=pytz.utc)
+        try:
+            raise Http404("nonex")
+        except Http404:
+            exc_info = sys.exc_info()
+
+        requests = []
+        for idx in range(3):
+            request = RequestFactory().get(reverse("dataset_embed", args=(_l.alternate,)), HTTP_USER_AGENT=self.ua)
+            request._monitoring = {
+                "started": now,
+                "finished": now + timedelta(milliseconds=10),
+                "resources": {},
+                "events": [("view", "dataset", _l.alternate, _l.id)],
+            }
+            requests.append(request)
+        # the first request is logged twice, on the exception and on the response
+        for request, _exc_info in [(requests[0], exc_info)] + [(request, None) for request in requests]:
+            handler.emit(
+                logging.makeLogRecord({"request": request, "response": HttpResponse("ok"), "exc_info": _exc_info})
+            )
+
+        # nothing is written in the request thread, the last event does not fit in the queue
+        self.assertFalse(RequestEvent.objects.filter(created=now).exists())
+        self.assertEqual(
+            ingestion.stats, {"enqueued": 2, "overflowed": 1, "dropped": 1, "written": 0, "failed": 0, "queued": 2}
+        )
+
+        # the pending events are written at the shutdown
+        ingestion.shutdown()
+        events = RequestEvent.objects.filter(created=now)
+        self.assertEqual(events.count(), 2)
+        for event in events:
+            self.assertEqual(list(event.resources.values_list("name", "type")), [(_l.alternate, "dataset")])
+            self.assertEqual(event.request_method, "GET")
+            self.assertEqual(event.response_time, 10)
+        errors = ExceptionEvent.objects.filter(request__in=events)
+        self.assertEqual(errors.count(), 1)
+        self.assertEqual(errors.get().error_type, "django.http.response.Http404")
+        self.assertEqual(errors.get().error_message, "nonex")
+        self.assertEqual(ingestion.stats["written"], 2)
+        start.assert_called()
+
     def test_service_handlers(self):
         """
         Test if we can calculate metrics
@@ -320,6 +381,327 @@ class RequestsTestCase(MonitoringTestBase):
             )
             self.assertIsNotNone(metrics)
 
+    def test_rollup_requests(self):
+        """
+        Test that requests metrics are computed for each resource and event type
+        """
+        valid_from = datetime.utcnow().replace(tzinfo=pytz.utc, second=0, microsecond=0) - timedelta(minutes=10)
+        valid_to = valid_from + timedelta(minutes=1)
+        view, wms = EventType.get(EventType.EVENT_VIEW), EventType.get("OWS:WMS")
+        dataset, _ = MonitoredResource.objects.get_or_create(name="rollup_dataset", type=MonitoredResource.TYPE_LAYER)
+        for idx, (event_type, path, response_time) in enumerate(
+            [(view, "/a", 10), (view, "/b", 20), (wms, "/a", 30), (wms, "/a", 40)]
+        ):
+            rq = RequestEvent.objects.create(
+                created=valid_from + timedelta(seconds=idx),
+                received=valid_from + timedelta(seconds=idx),
+                service=self.service,
+                event_type=event_type,
+                request_path=path,
+                request_method="GET",
+                response_status=200 if idx else 500,
+                response_time=response_time,
+                client_ip="127.0.0.1",
+                user_identifier="rollup_user_id" if event_type == wms else None,
+                user_username="rollup_user" if event_type == wms else None,
+            )
+            if event_type == wms:
+                rq.resources.add(dataset)
+            if not idx:
+                ExceptionEvent.add_error(self.service, "django.http.response.Http404", "", request=rq)
+
+        requests = RequestEvent.objects.filter(created__gte=valid_from, created__lt=valid_to)
+        CollectorAPI().process_requests_batch(self.service, requests, valid_from, valid_to)
+
+        def get_values(metric, resource=None, event_type=EventType.EVENT_ALL):
+            values = MetricValue.objects.filter(
+                valid_from=valid_from, service_metric__metric__name=metric, resource=resource
+            )
+            if event_type:
+                values = values.filter(event_type__name=event_type)
+            else:
+                values = values.filter(event_type=None)
+            return dict(values.values_list("label__name", "value_num"))
+
+        self.assertEqual(get_values("request.count"), {"Count": 4})
+        self.assertEqual(get_values("request.count", event_type=EventType.EVENT_OWS), {"Count": 2})
+        self.assertEqual(get_values("request.count", event_type=EventType.EVENT_OTHER), {"Count": 2})
+        self.assertEqual(get_values("request.count", resource=dataset), {"Count": 2})
+        self.assertEqual(get_values("request.count", resource=dataset, event_type=EventType.EVENT_OTHER), {"Count": 0})
+        self.assertEqual(get_values("request.path"), {"/a": 3, "/b": 1})
+        self.assertEqual(get_values("request.path", event_type=EventType.EVENT_VIEW), {"/a": 1, "/b": 1})
+        self.assertEqual(get_values("response.time"), {Metric.TYPE_RATE: 25})
+        self.assertEqual(get_values("response.time", resource=dataset), {Metric.TYPE_RATE: 35})
+        self.assertEqual(get_values("response.status"), {"200": 3, "500": 1})
+        self.assertEqual(get_values("request.ip", resource=dataset, event_type="OWS:WMS"), {"127.0.0.1": 2})
+        # the errors count is written once, without resource nor event type
+        self.assertEqual(get_values("response.error.count", event_type=None), {"count": 1})
+        self.assertEqual(
+            MetricValue.objects.filter(valid_from=valid_from, service_metric__metric__name="response.error.count")
+            .values_list("samples_count", flat=True)
+            .get(),
+            4,
+        )
+        self.assertEqual(get_values("response.error.types"), {"django.http.response.Http404": 1})
+        errors_data = CollectorAPI().get_metrics_data(
+            "response.error.count",
+            valid_from - timedelta(minutes=1),
+            valid_to + timedelta(minutes=1),
+            interval=timedelta(minutes=1),
+            service=self.service,
+        )
+        self.assertEqual(sum(row["val"] for row in errors_data), 1)
+        # users are labelled along with their name
+        self.assertEqual(get_values("request.users", resource=dataset, event_type="OWS:WMS"), {"rollup_user_id": 2})
+        self.assertEqual(MetricLabel.objects.get(name="rollup_user_id").user, "rollup_user")
+
+    def test_aggregate_period(self):
+        """
+        Test that metric values are aggregated in bulk into longer periods
+        """
+        period_start = datetime.utcnow().replace(tzinfo=pytz.utc, minute=0, second=0, microsecond=0) - timedelta(days=2)
+        period_end = period_start + timedelta(hours=1)
+        for idx, (count, response_time) in enumerate([(1, 10), (3, 30)]):
+            valid_from = period_start + timedelta(minutes=idx)
+            defaults = {
+                "valid_from": valid_from,
+                "valid_to": valid_from + timedelta(minutes=1),
+                "service": self.service,
+                "event_type": EventType.EVENT_ALL,
+            }
+            MetricValue.add(
+                "request.count",
+                label="Count",
+                value=count,
+                value_raw=count,
+                value_num=count,
+                samples_count=count,
+                **defaults,
+            )
+            MetricValue.add(
+                "response.time",
+                label=Metric.TYPE_RATE,
+                value=response_time,
+                value_raw=response_time,
+                value_num=response_time,
+                samples_count=count,
+                **defaults,
+            )
+        metric_data_q = MetricValue.objects.filter(service=self.service)
+
+        for _ in range(2):
+            aggregate_period(period_start, period_end, metric_data_q)
+            self.assertEqual(metric_data_q.filter(valid_from__gte=period_start, valid_to__lte=period_end).count(), 2)
+            values = dict(
+                metric_data_q.filter(valid_from=period_start, valid_to=period_end).values_list(
+                    "service_metric__metric__name", "value_num"
+                )
+            )
+            self.assertEqual(set(values), {"request.count", "response.time"})
+            self.assertEqual(values["request.count"], 4)
+
+    def test_rollups(self):
+        """
+        Test that metric values are rolled up by hour and that the metrics data are the same with the rollups
+        """
+        capi = CollectorAPI()
+        period_start = datetime.utcnow().replace(tzinfo=pytz.utc, minute=0, second=0, microsecond=0) - timedelta(
+            hours=3
+        )
+        period_end = period_start + timedelta(hours=2)
+        for idx, (count, response_time) in enumerate([(1, 10), (3, 30), (2, 20)]):
+            valid_from = period_start + timedelta(minutes=idx * 50)
+            defaults = {
+                "valid_from": valid_from,
+                "valid_to": valid_from + timedelta(minutes=1),
+                "service": self.service,
+                "event_type": EventType.EVENT_ALL,
+            }
+            MetricValue.add(
+                "request.count",
+                label="Count",
+                value=count,
+                value_raw=count,
+                value_num=count,
+                samples_count=count,
+                **defaults,
+            )
+            MetricValue.add(
+                "response.time",
+                label=Metric.TYPE_RATE,
+                value=response_time,
+                value_raw=response_time,
+                value_num=response_time,
+                samples_count=count,
+                **defaults,
+            )
+
+        written = capi.refresh_rollups(period_start, period_end, service=self.service)
+        if get_rollups_intervals():
+            rollups = MetricValueRollup.objects.filter(
+                service=self.service, granularity=MetricValueRollup.GRANULARITY_HOUR
+            ).order_by("bucket")
+            self.assertEqual(
+                list(
+                    rollups.filter(service_metric__metric__name="request.count").values_list(
+                        "bucket", "value_num", "metric_count"
+                    )
+                ),
+                [(period_start, 4, 2), (period_start + timedelta(hours=1), 2, 1)],
+            )
+            self.assertEqual(
+                list(rollups.filter(service_metric__metric__name="response.time").values_list("value_num", flat=True)),
+                [25, 20],
+            )
+            # the day buckets are rolled up from the hour buckets
+            self.assertEqual(
+                MetricValueRollup.objects.filter(
+                    service=self.service,
+                    granularity=MetricValueRollup.GRANULARITY_DAY,
+                    service_metric__metric__name="request.count",
+                ).aggregate(
+                    value_num=Sum("value_num"),
+                    value_min=Min("value_min"),
+                    value_max=Max("value_max"),
+                    samples_count=Sum("samples_count"),
+                    metric_count=Sum("metric_count"),
+                ),
+                {"value_num": 6, "value_min": 1, "value_max": 3, "samples_count": 6, "metric_count": 3},
+            )
+            # another service rolled up only since the second hour
+            other_service = Service.objects.create(name="rollups-other", host=self.host, service_type=self.service_type)
+            MetricValue.add(
+                "request.count",
+                valid_from=period_start + timedelta(hours=1),
+                valid_to=period_start + timedelta(hours=1, minutes=1),
+                service=other_service,
+                event_type=EventType.EVENT_ALL,
+                label="Count",
+                value=1,
+                value_raw=1,
+                value_num=1,
+            )
+            capi.refresh_rollups(period_start, period_end, service=other_service)
+            self.assertEqual(
+                get_rollup_for_period(period_start, period_end, service=self.service),
+                (MetricValueRollup.GRANULARITY_HOUR, timedelta(hours=1), period_start, period_end),
+            )
+            self.assertIsNone(get_rollup_for_period(period_start, period_end))
+            self.assertIsNone(get_rollup_for_period(period_start, period_end, service=other_service))
+        else:
+            self.assertEqual(written, 0)
+
+        for metric_name in ("request.count", "response.time"):
+            for valid_from, valid_to in (
+                (period_start, period_end),
+                (period_start + timedelta(minutes=30), period_end),
+                (period_start + timedelta(minutes=30), period_end - timedelta(minutes=30)),
+            ):
+                data = capi.get_metrics_data(
+                    metric_name, valid_from, valid_to, interval=timedelta(hours=1), service=self.service
+                )
+                with override_settings(MONITORING_DATA_ROLLUPS=[]):
+                    raw_data = capi.get_metrics_data(
+                        metric_name, valid_from, valid_to, interval=timedelta(hours=1), service=self.service
+                    )
+                self.assertEqual(data, raw_data)
+
+    @override_settings(
+        MONITORING_PARTITIONS_INTERVAL="day", MONITORING_PARTITIONS_AHEAD=2, MONITORING_DATA_AGGREGATION=()
+    )
+    def test_partitions(self):
+        """
+        Test that the monitoring tables are converted into time-range partitions, maintained and dropped
+        """
+        if not partitions.is_supported():
+            self.skipTest("Partitioned monitoring tables require PostgreSQL")
+        now = datetime.utcnow().replace(tzinfo=pytz.utc, microsecond=0)
+        day = timedelta(days=1)
+        connection = connections["default"]
+
+        def add_metric_value(valid_from):
+            return MetricValue.add(
+                "request.count",
+                valid_from=valid_from,
+                valid_to=valid_from + timedelta(minutes=1),
+                service=self.service,
+                label="Count",
+                value=1,
+                value_raw=1,
+                value_num=1,
+                samples_count=1,
+                event_type=EventType.EVENT_ALL,
+            )
+
+        def add_request(created):
+            rq = RequestEvent.objects.create(
+                created=created,
+                received=created,
+                service=self.service,
+                request_path="/partitions",
+                request_method="GET",
+                response_status=500,
+                response_time=1,
+            )
+            ExceptionEvent.add_error(self.service, "django.http.response.Http404", "", request=rq)
+            return rq
+
+        def get_partition(model, pk):
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT tableoid::regclass::text FROM {model._meta.db_table} WHERE id = %s", [pk])
+                row = cursor.fetchone()
+            return row[0] if row else None
+
+        # the DDL is rolled back at the end, the tables are left as they were for the other tests
+        with transaction.atomic():
+            old_value = add_metric_value(now - 10 * day)
+            old_request = add_request(now - 10 * day)
+
+            for model, column in partitions.PARTITIONED_MODELS:
+                partitions.partition_table(model, column, now=now)
+                self.assertTrue(partitions.is_partitioned(model))
+                table_partitions = partitions.get_partitions(model)
+                # one partition a day since the oldest row, up to the ones created ahead of time
+                self.assertEqual(table_partitions[0][1], partitions.get_partition_start(now - 10 * day, day))
+                self.assertEqual(table_partitions[-1][2], partitions.get_partition_start(now, day) + 3 * day)
+                self.assertEqual(len(table_partitions), 13)
+
+            # the rows are copied into their partition
+            self.assertEqual(
+                get_partition(MetricValue, old_value.id),
+                partitions.get_partition_name(
+                    "monitoring_metricvalue",
+                    partitions.get_partition_start(now - 10 * day, day),
+                    partitions.get_partition_start(now - 9 * day, day),
+                ),
+            )
+            self.assertEqual(ExceptionEvent.objects.filter(request_id=old_request.id).count(), 1)
+
+            # the maintenance creates the partitions ahead of time, once
+            created = partitions.maintain_partitions(now + day)
+            self.assertEqual(len(created["monitoring_metricvalue"]), 1)
+            self.assertEqual(len(created["monitoring_requestevent"]), 1)
+            self.assertEqual(partitions.maintain_partitions(now + day)["monitoring_metricvalue"], [])
+            start = partitions.get_partition_start(now + 3 * day, day)
+            self.assertEqual(
+                get_partition(MetricValue, add_metric_value(now + 3 * day).id),
+                partitions.get_partition_name("monitoring_metricvalue", start, start + day),
+            )
+            # the rows out of the partitions go to the default one
+            self.assertEqual(
+                get_partition(MetricValue, add_metric_value(now + 30 * day).id), "monitoring_metricvalue_default"
+            )
+
+            # the expired partitions are dropped, along with the rows related to the requests
+            dropped = partitions.drop_old_partitions(now - 5 * day)
+            self.assertEqual(len(dropped), 10)
+            self.assertFalse(MetricValue.objects.filter(id=old_value.id).exists())
+            self.assertFalse(RequestEvent.objects.filter(id=old_request.id).exists())
+            self.assertFalse(ExceptionEvent.objects.filter(request_id=old_request.id).exists())
+            self.assertEqual(len(partitions.get_partitions(MetricValue)), 9)
+
+            transaction.set_rollback(True)
+
     def test_collect_metrics_command(self):
         """
         Test that collect metrics command is executed sequentially
@@ -395,6 +777,26 @@ class MonitoringUtilsTestCase(MonitoringTestBase):
         periods = list(generate_periods(start_for_two_and_half, interval, pnow))
         self.assertEqual(len(periods), 3)
 
+    def test_partitions_bounds(self):
+        """
+        Test the bounds of the time-range partitions
+        """
+        utc = pytz.utc
+        # wednesday
+        moment = datetime(year=2026, month=10, day=14, hour=12, minute=22, second=50, tzinfo=utc)
+        day = partitions.PARTITIONS_INTERVALS["day"]
+        week = partitions.PARTITIONS_INTERVALS["week"]
+
+        self.assertEqual(partitions.get_partition_start(moment, day), datetime(2026, 10, 14, tzinfo=utc))
+        self.assertEqual(partitions.get_partition_start(moment, week), datetime(2026, 10, 12, tzinfo=utc))
+        self.assertEqual(
+            partitions.get_partition_name("monitoring_metricvalue", moment, moment + week),
+            "monitoring_metricvalue_p20261014_20261021",
+        )
+        if not partitions.is_supported():
+            self.assertFalse(partitions.is_partitioned(MetricValue))
+            self.assertEqual(partitions.drop_old_partitions(moment), [])
+
 
 @override_settings(USE_TZ=True)
 class MonitoringChecksTestCase(MonitoringTestBase):
@@ -18,7 +18,9 @@
 #########################################################################
 import os
 import pytz
+import atexit
 import queue
+import time
 import logging
 import xmljson
 import requests
@@ -35,6 +37,7 @@ from datetime import datetime, timedelta
 from owslib.etree import etree as dlxml
 
 from django.conf import settings
+from django.db import close_old_connections
 from django.db.models.fields.related import RelatedField
 
 from geonode.tasks.tasks import AcquireLock
@@ -46,52 +49,180 @@ log = logging.getLogger(__name__)
 
 
 class MonitoringHandler(logging.Handler):
-    def __init__(self, service, *args, **kwargs):
+    """
+    Turns the logged requests into snapshots which are written by a
+    `RequestEventsIngestion` outside of the request thread.
+    """
+
+    def __init__(self, service, *args, ingestion=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.service = service
+        self.ingestion = ingestion or RequestEventsIngestion(service)
 
     def emit(self, record):
-        from geonode.monitoring.models import RequestEvent, ExceptionEvent
+        from geonode.monitoring.models import RequestEvent
 
         exc_info = record.exc_info
         req = record.request
         resp = record.response
-        if not req._monitoring.get("processed"):
-            try:
-                re = RequestEvent.from_geonode(self.service, req, resp)
-                req._monitoring["processed"] = re
-            except Exception:
-                req._monitoring["processed"] = None
-        re = req._monitoring.get("processed")
+        if req._monitoring.get("processed"):
+            return
+        req._monitoring["processed"] = True
+        try:
+            data = RequestEvent.get_geonode_event_data(req, resp)
+        except Exception as e:
+            log.debug(f"Could not collect the monitoring data of the request: {e}")
+            return
 
-        if re and exc_info:
-            tb = traceback.format_exception(*exc_info)
-            ExceptionEvent.add_error(self.service, exc_info[1], tb, request=re)
+        error = None
+        if exc_info:
+            # the exception is not queued, as it keeps the whole request alive through its traceback
+            _cls = exc_info[1].__class__
+            error = {
+                "error_type": f"{_cls.__module__}.{_cls.__name__}",
+                "stack_trace": "".join(traceback.format_exception(*exc_info)),
+                "message": str(exc_info[1]),
+            }
+        self.ingestion.add(data, error=error)
 
 
-class RequestToMonitoringThread(threading.Thread):
-    q = queue.Queue()
+class RequestEventsIngestion:
+    """
+    Writes the GeoNode requests events in batches, from a daemon thread draining a bounded queue.
 
-    def __init__(self, service, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.service = service
+    When the queue is full, `add` waits up to `MONITORING_INGESTION_QUEUE_TIMEOUT` seconds for
+    the worker to catch up, then drops the event: `overflowed` counts the events which found
+    the queue full and `dropped` the ones which have been discarded.
+    The pending events are written at the process exit.
+    """
+
+    COUNTERS = ("enqueued", "overflowed", "dropped", "written", "failed")
 
-    def add(self, req, resp):
-        item = (
-            req,
-            resp,
+    # queued by `shutdown` to stop the worker once it has written the previous items
+    STOP = object()
+
+    def __init__(self, service, queue_size=None, batch_size=None, flush_interval=None, queue_timeout=None):
+        self.service = service
+        self.queue = queue.Queue(maxsize=queue_size or settings.MONITORING_INGESTION_QUEUE_SIZE)
+        self.batch_size = batch_size or settings.MONITORING_INGESTION_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval if flush_interval is not None else settings.MONITORING_INGESTION_FLUSH_INTERVAL
         )
-        RequestToMonitoringThread.q.put(item)
+        self.queue_timeout = queue_timeout if queue_timeout is not None else settings.MONITORING_INGESTION_QUEUE_TIMEOUT
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self._lock = threading.Lock()
+        self._worker = None
+        self._atexit = False
+
+    @property
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, queued=self.queue.qsize())
+
+    def _count(self, counter, value=1):
+        with self._lock:
+            self.counters[counter] += value
+            return self.counters[counter]
+
+    def start(self):
+        with self._lock:
+            # the worker does not survive a fork, so it is (re)started by the process which needs it
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self.run, name="monitoring-ingestion", daemon=True)
+                self._worker.start()
+            if not self._atexit:
+                # the daemon worker is killed at the exit, the pending events are written before
+                atexit.register(self.shutdown)
+                self._atexit = True
+
+    def add(self, data, error=None):
+        """
+        Queues the snapshot of a request, and its error if any, returns False if it has been dropped.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self.start()
+        item = (data, error)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self._count("overflowed")
+            try:
+                self.queue.put(item, timeout=self.queue_timeout)
+            except queue.Full:
+                dropped = self._count("dropped")
+                if dropped == 1 or dropped % 1000 == 0:
+                    log.warning(f"Monitoring ingestion queue is full, {dropped} requests events dropped so far")
+                return False
+        self._count("enqueued")
+        return True
+
+    def get_batch(self):
+        """
+        Waits for an item, then collects the following ones until the batch is full
+        or `flush_interval` seconds have elapsed.
+        """
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not self.STOP:
+            try:
+                batch.append(self.queue.get(timeout=max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        return batch
 
     def run(self):
-        from geonode.monitoring.models import RequestEvent
+        while True:
+            batch = self.get_batch()
+            stop = batch[-1] is self.STOP
+            if stop:
+                batch.pop()
+            if batch:
+                close_old_connections()
+                self.write(batch)
+            if stop:
+                return
+
+    def shutdown(self, timeout=10):
+        """
+        Lets the worker write the batch it is collecting, then writes the items still in the queue.
+        """
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            try:
+                self.queue.put(self.STOP, timeout=timeout)
+                worker.join(timeout)
+            except queue.Full:
+                log.warning("Monitoring ingestion worker is not draining the queue at the shutdown")
+        self.flush()
 
-        q = RequestToMonitoringThread.q
+    def flush(self):
+        """
+        Writes, in the calling thread, the items still in the queue.
+        """
+        batch = []
         while True:
-            if not q.empty():
-                item = q.get()
-                req, resp = item
-                RequestEvent.from_geonode(self.service, req, resp)
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self.STOP:
+                batch.append(item)
+        for i in range(0, len(batch), self.batch_size):
+            self.write(batch[i : i + self.batch_size])
+
+    def write(self, batch):
+        from geonode.monitoring.models import RequestEvent, ExceptionEvent
+
+        try:
+            events = RequestEvent.bulk_from_geonode(self.service, [data for data, _ in batch])
+            for event, (_, error) in zip(events, batch):
+                if error:
+                    ExceptionEvent.add_error(self.service, request=event, **error)
+        except Exception as e:
+            log.warning(f"Could not write {len(batch)} requests events: {e}")
+            self._count("failed", len(batch))
+        else:
+            self._count("written", len(events))
 
 
 class GeoServerMonitorClient:
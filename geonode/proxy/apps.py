@@ -22,3 +22,8 @@ from django.apps import AppConfig
 class GeoNodeProxyAppConfig(AppConfig):
     name = "geonode.proxy"
     verbose_name = "GeoNode Proxy"
+
+    def ready(self):
+        super().ready()
+        # Let's make sure the signals are connected to the App
+        from . import signals  # noqa
@@ -0,0 +1,33 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""signal handlers for geonode.proxy"""
+
+from django.dispatch import receiver
+from django.db.models import signals
+
+from geonode.services.models import Service
+
+from .utils import invalidate_proxy_allowed_hosts
+
+
+@receiver(signals.post_save, sender=Service)
+@receiver(signals.post_delete, sender=Service)
+def invalidate_proxy_allowed_hosts_on_service_change(instance, **kwargs):
+    invalidate_proxy_allowed_hosts()
@@ -32,6 +32,7 @@ from urllib.parse import urljoin
 from django.conf import settings
 from geonode.proxy.templatetags.proxy_lib_tags import original_link_available
 from django.test.client import RequestFactory
+from django.http.request import validate_host
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import patch
 
@@ -50,6 +51,7 @@ from geonode import geoserver
 from geonode.base.models import Link
 from geonode.layers.models import Dataset
 from geonode.decorators import on_ogc_backend
+from geonode.proxy.utils import ProxyAllowedHostsIndex, get_proxy_allowed_hosts_index
 from geonode.tests.base import GeoNodeBaseTestSupport
 from geonode.base.populate_test_data import create_models, create_single_dataset
 
@@ -235,6 +237,72 @@ class ProxyTest(GeoNodeBaseTestSupport):
         response = self.client.get(f"{self.proxy_url}?url={url}")
         self.assertEqual(response.status_code, 200)
 
+    @override_settings(DEBUG=False, PROXY_ALLOWED_HOSTS=(".example.org",), PROXY_STREAMING_ENABLED=True)
+    def test_proxy_streaming(self):
+        """In streaming mode the remote content is forwarded in chunks and hop-by-hop headers are dropped."""
+        import geonode.proxy.views
+
+        _chunks = [b"<wfs:FeatureCollection>", b"<gml:featureMember/>" * 10, b"</wfs:FeatureCollection>"]
+        upstream = MagicMock()
+        upstream.status_code = 200
+        upstream.headers = {
+            "Content-Type": "text/xml",
+            "Content-Length": "1234",
+            "Content-Encoding": "gzip",
+            "Connection": "keep-alive",
+            "Content-Disposition": 'attachment; filename="features.xml"',
+        }
+        upstream.iter_content.return_value = iter(_chunks)
+
+        request_mock = MagicMock()
+        request_mock.return_value = (upstream, upstream.raw)
+        geonode.proxy.views.http_client.request = request_mock
+
+        response = self.client.post(
+            f"{self.proxy_url}?url=http://example.org/wfs",
+            data=b"<wfs:GetFeature/>",
+            content_type="text/xml",
+        )
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), b"".join(_chunks))
+        self.assertEqual(response.headers["Content-Disposition"], 'attachment; filename="features.xml"')
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(request_mock.call_args[1]["data"], b"<wfs:GetFeature/>")
+        self.assertTrue(request_mock.call_args[1]["stream"])
+        upstream.close.assert_called_once()
+
+
+class ProxyAllowedHostsIndexTest(GeoNodeBaseTestSupport):
+    def test_exact_and_wildcard_hosts(self):
+        index = ProxyAllowedHostsIndex(["localhost", ".example.org", None, "Geoserver.Local"])
+        for host in ("localhost", "example.org", "www.example.org", "a.b.example.org", "geoserver.local"):
+            self.assertTrue(index.match(host), host)
+            self.assertTrue(validate_host(host, ["localhost", ".example.org", "geoserver.local"]), host)
+        for host in ("badexample.org", "example.org.evil.com", "org", "localhost.evil.com", "", None):
+            self.assertFalse(index.match(host), host)
+
+    def test_allow_all(self):
+        self.assertTrue(ProxyAllowedHostsIndex(["*"]).match("any.host.com"))
+
+    @override_settings(PROXY_ALLOWED_HOSTS=(".example.org",))
+    def test_index_is_invalidated_on_service_changes(self):
+        from geonode.services.models import Service
+        from geonode.services.enumerations import WMS, INDEXED
+
+        self.assertFalse(get_proxy_allowed_hosts_index().match("bogus.pocus.com"))
+        service, _ = Service.objects.get_or_create(
+            type=WMS,
+            name="Bogus",
+            title="Pocus",
+            owner=get_user_model().objects.get(username="admin"),
+            method=INDEXED,
+            base_url="http://bogus.pocus.com/ows",
+        )
+        self.assertTrue(get_proxy_allowed_hosts_index().match("bogus.pocus.com"))
+        service.delete()
+        self.assertFalse(get_proxy_allowed_hosts_index().match("bogus.pocus.com"))
+
 
 class DownloadResourceTestCase(GeoNodeBaseTestSupport):
     def setUp(self):
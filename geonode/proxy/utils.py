@@ -0,0 +1,130 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import logging
+import threading
+
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+PROXY_ALLOWED_HOSTS_CACHE_KEY = "proxy_allowed_hosts_generation"
+
+_WILDCARD = object()
+
+
+class ProxyAllowedHostsIndex:
+    """
+    Precomputed version of the "django.http.request.validate_host" check over a fixed list of patterns:
+     - "*" allows any host
+     - ".example.org" allows "example.org" and any of its subdomains
+     - any other pattern must match the host exactly
+
+    Exact hosts are kept into a set, while the wildcard patterns are stored into a trie of
+    reversed domain labels, so that a lookup costs O(number of labels of the host).
+    """
+
+    def __init__(self, patterns=()):
+        self.allow_all = False
+        self.exact = set()
+        self.suffixes = {}
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern):
+        if not pattern:
+            return
+        pattern = pattern.lower()
+        if pattern == "*":
+            self.allow_all = True
+        elif pattern.startswith("."):
+            node = self.suffixes
+            for label in reversed(pattern[1:].split(".")):
+                node = node.setdefault(label, {})
+            node[_WILDCARD] = True
+        else:
+            self.exact.add(pattern)
+
+    def match(self, host):
+        if not host:
+            return False
+        host = host.lower()
+        if self.allow_all or host in self.exact:
+            return True
+        node = self.suffixes
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if _WILDCARD in node:
+                return True
+        return False
+
+
+_index_lock = threading.Lock()
+_index = None
+_index_key = None
+
+
+def _build_proxy_allowed_hosts(ogc_hostname=None):
+    from geonode.services.models import Service
+
+    patterns = list(getattr(settings, "PROXY_ALLOWED_HOSTS", ()))
+    patterns.append(urlsplit(settings.SITEURL).hostname)
+    if ogc_hostname:
+        patterns.append(ogc_hostname)
+    for base_url in Service.objects.values_list("base_url", flat=True):
+        patterns.append(urlsplit(base_url).hostname)
+    return ProxyAllowedHostsIndex(patterns)
+
+
+def get_proxy_allowed_hosts_index(ogc_hostname=None):
+    """
+    Returns the "ProxyAllowedHostsIndex" built from "PROXY_ALLOWED_HOSTS", "SITEURL", the OGC server
+    hostname and the registered remote "Service"s.
+
+    The index is kept in memory and rebuilt only when the settings change or when the
+    cache generation is bumped by "invalidate_proxy_allowed_hosts" (e.g. on Service changes).
+    """
+    global _index, _index_key
+
+    _key = (
+        cache.get(PROXY_ALLOWED_HOSTS_CACHE_KEY, 0),
+        tuple(getattr(settings, "PROXY_ALLOWED_HOSTS", ())),
+        settings.SITEURL,
+        ogc_hostname,
+    )
+    with _index_lock:
+        if _index is None or _index_key != _key:
+            _index = _build_proxy_allowed_hosts(ogc_hostname=ogc_hostname)
+            _index_key = _key
+        return _index
+
+
+def invalidate_proxy_allowed_hosts():
+    global _index
+
+    with _index_lock:
+        _index = None
+    try:
+        cache.incr(PROXY_ALLOWED_HOSTS_CACHE_KEY)
+    except ValueError:
+        cache.set(PROXY_ALLOWED_HOSTS_CACHE_KEY, 1, None)
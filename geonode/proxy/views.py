@@ -40,6 +40,7 @@ from geonode.layers.models import Dataset
 from geonode.upload.models import Upload
 from geonode.base.models import ResourceBase
 from geonode.storage.manager import storage_manager
+from geonode.proxy.utils import get_proxy_allowed_hosts_index
 from geonode.utils import (
     resolve_object,
     check_ogc_backend,
@@ -63,7 +64,7 @@ LINK_TYPES = [L for L in _LT if L.startswith("OGC:")]
 logger = logging.getLogger(__name__)
 
 
-ows_regexp = re.compile(r"^(?i)(version)=(\d\.\d\.\d)(?i)&(?i)request=(?i)(GetCapabilities)&(?i)service=(?i)(\w\w\w)$")
+ows_regexp = re.compile(r"^(version)=(\d\.\d\.\d)&request=(GetCapabilities)&service=(\w\w\w)$", re.IGNORECASE)
 
 
 @requires_csrf_token
@@ -77,6 +78,7 @@ def proxy(
     allowed_hosts=[],
     headers=None,
     access_token=None,
+    stream=None,
     **kwargs,
 ):
     # Request default timeout
@@ -85,8 +87,11 @@ def proxy(
     if not timeout:
         timeout = getattr(ogc_server_settings, "TIMEOUT", TIMEOUT)
 
-    # Security rules and settings
-    PROXY_ALLOWED_HOSTS = getattr(settings, "PROXY_ALLOWED_HOSTS", ())
+    # Streaming mode: forward raw bytes and do not buffer the remote response.
+    # Not applicable when the caller needs the whole content through a "response_callback".
+    if stream is None:
+        stream = getattr(settings, "PROXY_STREAMING_ENABLED", False)
+    stream = stream and not response_callback
 
     # Sanity url checks
     if "url" not in request.GET and not url:
@@ -107,18 +112,17 @@ def proxy(
     # White-Black Listing Hosts
     site_url = urlsplit(settings.SITEURL)
     if sec_chk_hosts and not settings.DEBUG:
-        # Attach current SITEURL
-        if site_url.hostname not in PROXY_ALLOWED_HOSTS:
-            PROXY_ALLOWED_HOSTS += (site_url.hostname,)
-
-        # Attach current hostname
-        hostname = (ogc_server_settings.hostname,) if ogc_server_settings else ()
-        if hostname not in PROXY_ALLOWED_HOSTS:
-            PROXY_ALLOWED_HOSTS += hostname
+        # PROXY_ALLOWED_HOSTS, SITEURL, OGC Server and Remote Services hosts
+        allowed_hosts_index = get_proxy_allowed_hosts_index(
+            ogc_hostname=ogc_server_settings.hostname if ogc_server_settings else None
+        )
+        _host = extract_ip_or_domain(raw_url)
+        _host_allowed = allowed_hosts_index.match(_host)
 
         # Check OWS regexp
-        if url.query and ows_regexp.match(url.query):
-            ows_tokens = ows_regexp.match(url.query).groups()
+        if not _host_allowed and url.query:
+            _ows_match = ows_regexp.match(url.query)
+            ows_tokens = _ows_match.groups() if _ows_match else ()
             if (
                 len(ows_tokens) == 4
                 and "version" == ows_tokens[0]
@@ -127,17 +131,9 @@ def proxy(
                 and ows_tokens[2].lower() in ("getcapabilities")
                 and ows_tokens[3].upper() in ("OWS", "WCS", "WFS", "WMS", "WPS", "CSW")
             ):
-                if url.hostname not in PROXY_ALLOWED_HOSTS:
-                    PROXY_ALLOWED_HOSTS += (url.hostname,)
-
-        # Check Remote Services base_urls
-        from geonode.services.models import Service
+                _host_allowed = bool(url.hostname) and validate_host(_host, (url.hostname,))
 
-        for _s in Service.objects.all():
-            _remote_host = urlsplit(_s.base_url).hostname
-            PROXY_ALLOWED_HOSTS += (_remote_host,)
-
-        if not validate_host(extract_ip_or_domain(raw_url), PROXY_ALLOWED_HOSTS):
+        if not _host_allowed:
             return HttpResponse(
                 "DEBUG is set to False but the host of the path provided to the proxy service"
                 " is not in the PROXY_ALLOWED_HOSTS setting.",
@@ -182,20 +178,40 @@ def proxy(
         query_separator = "&" if "?" in _url else "?"
         _url = f"{_url}{query_separator}access_token={access_token}"
 
-    _data = request.body.decode("utf-8")
+    _data = request.body if stream else request.body.decode("utf-8")
 
     # Avoid translating local geoserver calls into external ones
     if check_ogc_backend(geoserver.BACKEND_PACKAGE):
         from geonode.geoserver.helpers import ogc_server_settings
 
-        _url = _url.replace(f"{settings.SITEURL}geoserver", ogc_server_settings.LOCATION.rstrip("/"))
-        _data = _data.replace(f"{settings.SITEURL}geoserver", ogc_server_settings.LOCATION.rstrip("/"))
+        _gs_url = f"{settings.SITEURL}geoserver"
+        _gs_location = ogc_server_settings.LOCATION.rstrip("/")
+        _url = _url.replace(_gs_url, _gs_location)
+        if stream:
+            _data = _data.replace(_gs_url.encode("utf-8"), _gs_location.encode("utf-8"))
+        else:
+            _data = _data.replace(_gs_url, _gs_location)
 
     response, content = http_client.request(
-        _url, method=request.method, data=_data.encode("utf-8"), headers=headers, timeout=timeout, user=user
+        _url,
+        method=request.method,
+        data=_data if stream else _data.encode("utf-8"),
+        headers=headers,
+        timeout=timeout,
+        user=user,
+        stream=stream,
     )
     if response is None:
         return HttpResponse(content=content, reason=content, status=500)
+
+    if stream and 200 <= response.status_code < 300:
+        _response = StreamingHttpResponse(
+            iter_response_content(response),
+            status=response.status_code,
+            content_type=response.headers.get("Content-Type"),
+        )
+        return fetch_response_headers(_response, response.headers)
+
     content = response.content or response.reason
     status = response.status_code
     response_headers = response.headers
@@ -268,6 +284,19 @@ def proxy(
             return fetch_response_headers(_response, response_headers)
 
 
+def iter_response_content(response, chunk_size=BUFFER_CHUNK_SIZE):
+    """
+    Yields the (decoded) body of a streamed "requests" response in chunks,
+    releasing the upstream connection once done or when the client goes away.
+    """
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        response.close()
+
+
 def download(request, resourceid, sender=Dataset):
     _not_authorized = _("You are not authorized to download this resource.")
     _not_permitted = _("You are not permitted to save or edit this resource.")
@@ -26,7 +26,7 @@ from uuid import uuid1, uuid4
 from abc import ABCMeta, abstractmethod
 
 from guardian.models import UserObjectPermission, GroupObjectPermission
-from guardian.shortcuts import assign_perm, get_anonymous_user
+from guardian.shortcuts import get_anonymous_user
 
 from django.conf import settings
 from django.db import transaction
@@ -40,8 +40,15 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError, FieldDoe
 
 from geonode.thumbs.thumbnails import _generate_thumbnail_name
 from geonode.documents.tasks import create_document_thumbnail
+from geonode.security.bulk import ObjectPermissionsAssignment
+from geonode.security.signals import resource_permissions_changed
 from geonode.security.permissions import PermSpecCompact, DATA_STYLABLE_RESOURCES_SUBTYPES
-from geonode.security.utils import perms_as_set, get_user_groups, skip_registered_members_common_group
+from geonode.security.utils import (
+    perms_as_set,
+    get_user_groups,
+    sync_resource_visibility,
+    skip_registered_members_common_group,
+)
 
 from . import settings as rm_settings
 from .utils import update_resource, resourcebase_post_save
@@ -211,6 +218,40 @@ class ResourceManagerInterface(metaclass=ABCMeta):
         """
         pass
 
+    def set_permissions_bulk(
+        self,
+        resources: typing.Iterable,
+        /,
+        owner: settings.AUTH_USER_MODEL = None,
+        permissions: dict = {},
+        perm_specs: dict = None,
+        created: bool = False,
+        approval_status_changed: bool = False,
+        group_status_changed: bool = False,
+    ) -> bool:
+        """Sets the permissions of several resources at once.
+
+        - The 'permissions' parameter is the JSON 'perm_spec' of all the resources, unless the 'perm_specs'
+          dictionary provides a specific one for a resource id
+        - By default, it sets the permissions of the resources one by one
+        """
+        perm_specs = perm_specs or {}
+        _result = True
+        for _resource in resources:
+            _result = (
+                self.set_permissions(
+                    _resource.uuid,
+                    instance=_resource,
+                    owner=owner,
+                    permissions=perm_specs.get(_resource.id, permissions),
+                    created=created,
+                    approval_status_changed=approval_status_changed,
+                    group_status_changed=group_status_changed,
+                )
+                and _result
+            )
+        return _result
+
     @abstractmethod
     def set_thumbnail(
         self, uuid: str, /, instance: ResourceBase = None, overwrite: bool = True, check_bbox: bool = True
@@ -635,6 +676,8 @@ class ResourceManager(ResourceManagerInterface):
                         content_type=ContentType.objects.get_for_model(_resource.get_self_resource()),
                         object_pk=_resource.id,
                     ).delete()
+                    sync_resource_visibility([_resource.id])
+                    resource_permissions_changed.send(sender=ResourceBase, instance=_resource)
                     if not self._concrete_resource_manager.remove_permissions(uuid, instance=_resource):
                         raise Exception("Could not complete concrete manager operation successfully!")
                 _resource.set_processing_state(enumerations.STATE_PROCESSED)
@@ -666,236 +709,25 @@ class ResourceManager(ResourceManagerInterface):
                 with transaction.atomic():
                     logger.debug(f"Setting permissions {permissions} on {_resource}")
 
-                    # default permissions for owner
-                    if owner and owner != _resource.owner:
-                        _resource.owner = owner
-                        ResourceBase.objects.filter(uuid=_resource.uuid).update(owner=owner)
-                    _owner = _resource.owner
-                    _resource_type = getattr(_resource, "resource_type", None) or _resource.polymorphic_ctype.name
-                    _resource_subtype = (getattr(_resource, "subtype", None) or "").lower()
-
-                    # default permissions for anonymous users
-                    anonymous_group, _ = Group.objects.get_or_create(name="anonymous")
-
-                    if not anonymous_group:
-                        raise Exception("Could not acquire 'anonymous' Group.")
-
-                    # Gathering and validating the current permissions (if any has been passed)
-                    if not created and permissions is None:
-                        permissions = _resource.get_all_level_info()
-
-                    if permissions:
-                        if PermSpecCompact.validate(permissions):
-                            _permissions = PermSpecCompact(copy.deepcopy(permissions), _resource).extended
-                        else:
-                            _permissions = copy.deepcopy(permissions)
-                    else:
-                        _permissions = None
-
-                    # Fixup Advanced Workflow permissions
-                    _perm_spec = AdvancedSecurityWorkflowManager.get_permissions(
-                        _resource.uuid,
-                        instance=_resource,
-                        permissions=_permissions,
+                    assignment = ObjectPermissionsAssignment()
+                    _resource = self._collect_permissions(
+                        _resource,
+                        assignment,
+                        owner=owner,
+                        permissions=permissions,
                         created=created,
                         approval_status_changed=approval_status_changed,
                         group_status_changed=group_status_changed,
                     )
 
                     """
-                    Cleanup the Guardian tables
+                    Replace the Guardian permissions of the resource with the collected ones
                     """
-                    self.remove_permissions(uuid, instance=_resource)
+                    assignment.apply()
+                    self._concrete_resource_manager.remove_permissions(uuid, instance=_resource)
 
-                    def _safe_assign_perm(perm, user_or_group, obj=None):
-                        try:
-                            assign_perm(perm, user_or_group, obj)
-                        except Permission.DoesNotExist as e:
-                            logger.warn(e)
-
-                    if permissions is not None and len(permissions):
-                        """
-                        Sets an object's the permission levels based on the perm_spec JSON.
-
-                        the mapping looks like:
-                        {
-                            'users': {
-                                'AnonymousUser': ['view'],
-                                <username>: ['perm1','perm2','perm3'],
-                                <username2>: ['perm1','perm2','perm3']
-                                ...
-                            },
-                            'groups': [
-                                <groupname>: ['perm1','perm2','perm3'],
-                                <groupname2>: ['perm1','perm2','perm3'],
-                                ...
-                            ]
-                        }
-                        """
-                        # Anonymous User group
-                        if "users" in _perm_spec and (
-                            "AnonymousUser" in _perm_spec["users"] or get_anonymous_user() in _perm_spec["users"]
-                        ):
-                            anonymous_user = (
-                                "AnonymousUser" if "AnonymousUser" in _perm_spec["users"] else get_anonymous_user()
-                            )
-                            perms = copy.deepcopy(_perm_spec["users"][anonymous_user])
-                            _perm_spec["users"].pop(anonymous_user)
-                            _prev_perm = _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
-                            _perm_spec["groups"][anonymous_group] = set.union(
-                                perms_as_set(_prev_perm), perms_as_set(perms)
-                            )
-                            for perm in _perm_spec["groups"][anonymous_group]:
-                                if _resource_type == "dataset" and perm in (
-                                    "change_dataset_data",
-                                    "change_dataset_style",
-                                    "add_dataset",
-                                    "change_dataset",
-                                    "delete_dataset",
-                                ):
-                                    if (
-                                        perm == "change_dataset_style"
-                                        and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
-                                    ):
-                                        pass
-                                    else:
-                                        _safe_assign_perm(perm, anonymous_group, _resource.dataset)
-                                elif AdvancedSecurityWorkflowManager.assignable_perm_condition(perm, _resource_type):
-                                    _safe_assign_perm(perm, anonymous_group, _resource.get_self_resource())
-
-                        # All the other users
-                        if "users" in _perm_spec and len(_perm_spec["users"]) > 0:
-                            for user, perms in _perm_spec["users"].items():
-                                _user = get_user_model().objects.get(username=user)
-                                if user != "AnonymousUser" and user != get_anonymous_user():
-                                    for perm in perms:
-                                        if _resource_type == "dataset" and perm in (
-                                            "change_dataset_data",
-                                            "change_dataset_style",
-                                            "add_dataset",
-                                            "change_dataset",
-                                            "delete_dataset",
-                                        ):
-                                            if (
-                                                perm == "change_dataset_style"
-                                                and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
-                                            ):
-                                                pass
-                                            else:
-                                                _safe_assign_perm(perm, _user, _resource.dataset)
-                                        elif AdvancedSecurityWorkflowManager.assignable_perm_condition(
-                                            perm, _resource_type
-                                        ):
-                                            _safe_assign_perm(perm, _user, _resource.get_self_resource())
-
-                        # All the other groups
-                        if "groups" in _perm_spec and len(_perm_spec["groups"]) > 0:
-                            for group, perms in _perm_spec["groups"].items():
-                                _group = Group.objects.get(name=group)
-                                for perm in perms:
-                                    if _resource_type == "dataset" and perm in (
-                                        "change_dataset_data",
-                                        "change_dataset_style",
-                                        "add_dataset",
-                                        "change_dataset",
-                                        "delete_dataset",
-                                    ):
-                                        if (
-                                            perm == "change_dataset_style"
-                                            and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
-                                        ):
-                                            pass
-                                        else:
-                                            _safe_assign_perm(perm, _group, _resource.dataset)
-                                    elif AdvancedSecurityWorkflowManager.assignable_perm_condition(
-                                        perm, _resource_type
-                                    ):
-                                        _safe_assign_perm(perm, _group, _resource.get_self_resource())
-
-                        # AnonymousUser
-                        if "users" in _perm_spec and len(_perm_spec["users"]) > 0:
-                            if "AnonymousUser" in _perm_spec["users"] or get_anonymous_user() in _perm_spec["users"]:
-                                _user = get_anonymous_user()
-                                anonymous_user = (
-                                    "AnonymousUser" if "AnonymousUser" in _perm_spec["users"] else get_anonymous_user()
-                                )
-                                perms = _perm_spec["users"][anonymous_user]
-                                for perm in perms:
-                                    if _resource_type == "dataset" and perm in (
-                                        "change_dataset_data",
-                                        "change_dataset_style",
-                                        "add_dataset",
-                                        "change_dataset",
-                                        "delete_dataset",
-                                    ):
-                                        if (
-                                            perm == "change_dataset_style"
-                                            and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
-                                        ):
-                                            pass
-                                        else:
-                                            _safe_assign_perm(perm, _user, _resource.dataset)
-                                    elif AdvancedSecurityWorkflowManager.assignable_perm_condition(
-                                        perm, _resource_type
-                                    ):
-                                        _safe_assign_perm(perm, _user, _resource.get_self_resource())
-                    else:
-                        # Anonymous
-                        if AdvancedSecurityWorkflowManager.is_anonymous_can_view():
-                            _safe_assign_perm("view_resourcebase", anonymous_group, _resource.get_self_resource())
-                            _prev_perm = _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
-                            _perm_spec["groups"][anonymous_group] = set.union(
-                                perms_as_set(_prev_perm), perms_as_set("view_resourcebase")
-                            )
-                        else:
-                            for user_group in get_user_groups(_owner):
-                                if not skip_registered_members_common_group(user_group):
-                                    _safe_assign_perm("view_resourcebase", user_group, _resource.get_self_resource())
-                                    _prev_perm = (
-                                        _perm_spec["groups"].get(user_group, []) if "groups" in _perm_spec else []
-                                    )
-                                    _perm_spec["groups"][user_group] = set.union(
-                                        perms_as_set(_prev_perm), perms_as_set("view_resourcebase")
-                                    )
-
-                        if AdvancedSecurityWorkflowManager.assignable_perm_condition(
-                            "download_resourcebase", _resource_type
-                        ):
-                            if AdvancedSecurityWorkflowManager.is_anonymous_can_download():
-                                _safe_assign_perm(
-                                    "download_resourcebase", anonymous_group, _resource.get_self_resource()
-                                )
-                                _prev_perm = (
-                                    _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
-                                )
-                                _perm_spec["groups"][anonymous_group] = set.union(
-                                    perms_as_set(_prev_perm), perms_as_set("download_resourcebase")
-                                )
-                            else:
-                                for user_group in get_user_groups(_owner):
-                                    if not skip_registered_members_common_group(user_group):
-                                        _safe_assign_perm(
-                                            "download_resourcebase", user_group, _resource.get_self_resource()
-                                        )
-                                        _prev_perm = (
-                                            _perm_spec["groups"].get(user_group, []) if "groups" in _perm_spec else []
-                                        )
-                                        _perm_spec["groups"][user_group] = set.union(
-                                            perms_as_set(_prev_perm), perms_as_set("download_resourcebase")
-                                        )
-
-                        if _resource_type == "dataset":
-                            # only for layer owner
-                            _safe_assign_perm("change_dataset_data", _owner, _resource)
-                            _safe_assign_perm("change_dataset_style", _owner, _resource)
-                            _prev_perm = _perm_spec["users"].get(_owner, []) if "users" in _perm_spec else []
-                            _perm_spec["users"][_owner] = set.union(
-                                perms_as_set(_prev_perm), perms_as_set(["change_dataset_data", "change_dataset_style"])
-                            )
-
-                        _resource = AdvancedSecurityWorkflowManager.handle_moderated_uploads(
-                            _resource.uuid, instance=_resource
-                        )
+                    sync_resource_visibility([_resource.id])
+                    resource_permissions_changed.send(sender=ResourceBase, instance=_resource)
 
                     # Fixup GIS Backend Security Rules Accordingly
                     if not self._concrete_resource_manager.set_permissions(
@@ -916,6 +748,280 @@ class ResourceManager(ResourceManagerInterface):
                 _resource.clear_dirty_state()
         return False
 
+    def set_permissions_bulk(
+        self,
+        resources: typing.Iterable,
+        /,
+        owner: settings.AUTH_USER_MODEL = None,
+        permissions: dict = {},
+        perm_specs: dict = None,
+        created: bool = False,
+        approval_status_changed: bool = False,
+        group_status_changed: bool = False,
+    ) -> bool:
+        _resources = [_resource.get_real_instance() for _resource in resources]
+        perm_specs = perm_specs or {}
+        for _resource in _resources:
+            _resource.set_processing_state(enumerations.STATE_RUNNING)
+        try:
+            with transaction.atomic():
+                logger.debug(f"Setting permissions on {len(_resources)} resources")
+
+                assignment = ObjectPermissionsAssignment()
+                _resources = [
+                    self._collect_permissions(
+                        _resource,
+                        assignment,
+                        owner=owner,
+                        permissions=perm_specs.get(_resource.id, permissions),
+                        created=created,
+                        approval_status_changed=approval_status_changed,
+                        group_status_changed=group_status_changed,
+                    )
+                    for _resource in _resources
+                ]
+                assignment.apply()
+
+                sync_resource_visibility([_resource.id for _resource in _resources])
+                for _resource in _resources:
+                    resource_permissions_changed.send(sender=ResourceBase, instance=_resource)
+
+                # Fixup GIS Backend Security Rules Accordingly
+                if not self._concrete_resource_manager.set_permissions_bulk(
+                    _resources,
+                    owner=owner,
+                    perm_specs={_resource.id: _resource.get_all_level_info() for _resource in _resources},
+                    created=created,
+                ):
+                    logger.error(Exception("Could not complete concrete manager operation successfully!"))
+            for _resource in _resources:
+                _resource.set_processing_state(enumerations.STATE_PROCESSED)
+            return True
+        except Exception as e:
+            logger.exception(e)
+            for _resource in _resources:
+                _resource.set_processing_state(enumerations.STATE_INVALID)
+        finally:
+            for _resource in _resources:
+                _resource.clear_dirty_state()
+        return False
+
+    def _collect_permissions(
+        self,
+        _resource: ResourceBase,
+        assignment: ObjectPermissionsAssignment,
+        owner: settings.AUTH_USER_MODEL = None,
+        permissions: dict = {},
+        created: bool = False,
+        approval_status_changed: bool = False,
+        group_status_changed: bool = False,
+    ) -> ResourceBase:
+        """Computes the Guardian permissions of a resource and collects them into the assignment.
+
+        - It optionally gets a JSON 'perm_spec' through the 'permissions' parameter
+        - If no 'perm_spec' is provided, it will collect the default permissions (owner only)
+        """
+        assignment.add_resource(_resource)
+
+        # default permissions for owner
+        if owner and owner != _resource.owner:
+            _resource.owner = owner
+            ResourceBase.objects.filter(uuid=_resource.uuid).update(owner=owner)
+        _owner = _resource.owner
+        _resource_type = getattr(_resource, "resource_type", None) or _resource.polymorphic_ctype.name
+        _resource_subtype = (getattr(_resource, "subtype", None) or "").lower()
+
+        # default permissions for anonymous users
+        anonymous_group, _ = Group.objects.get_or_create(name="anonymous")
+
+        if not anonymous_group:
+            raise Exception("Could not acquire 'anonymous' Group.")
+
+        # Gathering and validating the current permissions (if any has been passed)
+        if not created and permissions is None:
+            permissions = _resource.get_all_level_info()
+
+        if permissions:
+            if PermSpecCompact.validate(permissions):
+                _permissions = PermSpecCompact(copy.deepcopy(permissions), _resource).extended
+            else:
+                _permissions = copy.deepcopy(permissions)
+        else:
+            _permissions = None
+
+        # Fixup Advanced Workflow permissions
+        _perm_spec = AdvancedSecurityWorkflowManager.get_permissions(
+            _resource.uuid,
+            instance=_resource,
+            permissions=_permissions,
+            created=created,
+            approval_status_changed=approval_status_changed,
+            group_status_changed=group_status_changed,
+        )
+
+        def _safe_assign_perm(perm, user_or_group, obj=None):
+            try:
+                assignment.assign(perm, user_or_group, obj)
+            except Permission.DoesNotExist as e:
+                logger.warn(e)
+
+        if permissions is not None and len(permissions):
+            """
+            Sets an object's the permission levels based on the perm_spec JSON.
+
+            the mapping looks like:
+            {
+                'users': {
+                    'AnonymousUser': ['view'],
+                    <username>: ['perm1','perm2','perm3'],
+                    <username2>: ['perm1','perm2','perm3']
+                    ...
+                },
+                'groups': [
+                    <groupname>: ['perm1','perm2','perm3'],
+                    <groupname2>: ['perm1','perm2','perm3'],
+                    ...
+                ]
+            }
+            """
+            # Anonymous User group
+            if "users" in _perm_spec and (
+                "AnonymousUser" in _perm_spec["users"] or get_anonymous_user() in _perm_spec["users"]
+            ):
+                anonymous_user = "AnonymousUser" if "AnonymousUser" in _perm_spec["users"] else get_anonymous_user()
+                perms = copy.deepcopy(_perm_spec["users"][anonymous_user])
+                _perm_spec["users"].pop(anonymous_user)
+                _prev_perm = _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
+                _perm_spec["groups"][anonymous_group] = set.union(perms_as_set(_prev_perm), perms_as_set(perms))
+                for perm in _perm_spec["groups"][anonymous_group]:
+                    if _resource_type == "dataset" and perm in (
+                        "change_dataset_data",
+                        "change_dataset_style",
+                        "add_dataset",
+                        "change_dataset",
+                        "delete_dataset",
+                    ):
+                        if perm == "change_dataset_style" and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES:
+                            pass
+                        else:
+                            _safe_assign_perm(perm, anonymous_group, _resource.dataset)
+                    elif AdvancedSecurityWorkflowManager.assignable_perm_condition(perm, _resource_type):
+                        _safe_assign_perm(perm, anonymous_group, _resource.get_self_resource())
+
+            # All the other users
+            if "users" in _perm_spec and len(_perm_spec["users"]) > 0:
+                for user, perms in _perm_spec["users"].items():
+                    _user = get_user_model().objects.get(username=user)
+                    if user != "AnonymousUser" and user != get_anonymous_user():
+                        for perm in perms:
+                            if _resource_type == "dataset" and perm in (
+                                "change_dataset_data",
+                                "change_dataset_style",
+                                "add_dataset",
+                                "change_dataset",
+                                "delete_dataset",
+                            ):
+                                if (
+                                    perm == "change_dataset_style"
+                                    and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
+                                ):
+                                    pass
+                                else:
+                                    _safe_assign_perm(perm, _user, _resource.dataset)
+                            elif AdvancedSecurityWorkflowManager.assignable_perm_condition(perm, _resource_type):
+                                _safe_assign_perm(perm, _user, _resource.get_self_resource())
+
+            # All the other groups
+            if "groups" in _perm_spec and len(_perm_spec["groups"]) > 0:
+                for group, perms in _perm_spec["groups"].items():
+                    _group = Group.objects.get(name=group)
+                    for perm in perms:
+                        if _resource_type == "dataset" and perm in (
+                            "change_dataset_data",
+                            "change_dataset_style",
+                            "add_dataset",
+                            "change_dataset",
+                            "delete_dataset",
+                        ):
+                            if (
+                                perm == "change_dataset_style"
+                                and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
+                            ):
+                                pass
+                            else:
+                                _safe_assign_perm(perm, _group, _resource.dataset)
+                        elif AdvancedSecurityWorkflowManager.assignable_perm_condition(perm, _resource_type):
+                            _safe_assign_perm(perm, _group, _resource.get_self_resource())
+
+            # AnonymousUser
+            if "users" in _perm_spec and len(_perm_spec["users"]) > 0:
+                if "AnonymousUser" in _perm_spec["users"] or get_anonymous_user() in _perm_spec["users"]:
+                    _user = get_anonymous_user()
+                    anonymous_user = "AnonymousUser" if "AnonymousUser" in _perm_spec["users"] else get_anonymous_user()
+                    perms = _perm_spec["users"][anonymous_user]
+                    for perm in perms:
+                        if _resource_type == "dataset" and perm in (
+                            "change_dataset_data",
+                            "change_dataset_style",
+                            "add_dataset",
+                            "change_dataset",
+                            "delete_dataset",
+                        ):
+                            if (
+                                perm == "change_dataset_style"
+                                and _resource_subtype not in DATA_STYLABLE_RESOURCES_SUBTYPES
+                            ):
+                                pass
+                            else:
+                                _safe_assign_perm(perm, _user, _resource.dataset)
+                        elif AdvancedSecurityWorkflowManager.assignable_perm_condition(perm, _resource_type):
+                            _safe_assign_perm(perm, _user, _resource.get_self_resource())
+        else:
+            # Anonymous
+            if AdvancedSecurityWorkflowManager.is_anonymous_can_view():
+                _safe_assign_perm("view_resourcebase", anonymous_group, _resource.get_self_resource())
+                _prev_perm = _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
+                _perm_spec["groups"][anonymous_group] = set.union(
+                    perms_as_set(_prev_perm), perms_as_set("view_resourcebase")
+                )
+            else:
+                for user_group in get_user_groups(_owner):
+                    if not skip_registered_members_common_group(user_group):
+                        _safe_assign_perm("view_resourcebase", user_group, _resource.get_self_resource())
+                        _prev_perm = _perm_spec["groups"].get(user_group, []) if "groups" in _perm_spec else []
+                        _perm_spec["groups"][user_group] = set.union(
+                            perms_as_set(_prev_perm), perms_as_set("view_resourcebase")
+                        )
+
+            if AdvancedSecurityWorkflowManager.assignable_perm_condition("download_resourcebase", _resource_type):
+                if AdvancedSecurityWorkflowManager.is_anonymous_can_download():
+                    _safe_assign_perm("download_resourcebase", anonymous_group, _resource.get_self_resource())
+                    _prev_perm = _perm_spec["groups"].get(anonymous_group, []) if "groups" in _perm_spec else []
+                    _perm_spec["groups"][anonymous_group] = set.union(
+                        perms_as_set(_prev_perm), perms_as_set("download_resourcebase")
+                    )
+                else:
+                    for user_group in get_user_groups(_owner):
+                        if not skip_registered_members_common_group(user_group):
+                            _safe_assign_perm("download_resourcebase", user_group, _resource.get_self_resource())
+                            _prev_perm = _perm_spec["groups"].get(user_group, []) if "groups" in _perm_spec else []
+                            _perm_spec["groups"][user_group] = set.union(
+                                perms_as_set(_prev_perm), perms_as_set("download_resourcebase")
+                            )
+
+            if _resource_type == "dataset":
+                # only for layer owner
+                _safe_assign_perm("change_dataset_data", _owner, _resource)
+                _safe_assign_perm("change_dataset_style", _owner, _resource)
+                _prev_perm = _perm_spec["users"].get(_owner, []) if "users" in _perm_spec else []
+                _perm_spec["users"][_owner] = set.union(
+                    perms_as_set(_prev_perm), perms_as_set(["change_dataset_data", "change_dataset_style"])
+                )
+
+            _resource = AdvancedSecurityWorkflowManager.handle_moderated_uploads(_resource.uuid, instance=_resource)
+
+        return _resource
+
     def set_thumbnail(
         self,
         uuid: str,
@@ -21,6 +21,7 @@ import os
 from uuid import uuid4
 from unittest.mock import patch
 
+from guardian.models import UserObjectPermission
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -295,6 +296,41 @@ class TestResourceManager(GeoNodeBaseTestSupport):
         self.assertTrue(self.rm.set_permissions(map.uuid, instance=map, permissions=perm_spec))
         self.assertFalse(norman.has_perm("download_resourcebase", map.get_self_resource()))
 
+    def test_set_permissions_bulk(self):
+        norman = get_user_model().objects.get(username="norman")
+        doc = create_single_doc("test_bulk_doc")
+        map = create_single_map("test_bulk_map")
+        dt = create_single_dataset("test_bulk_dataset")
+        perm_spec = {
+            "users": {
+                "AnonymousUser": ["view_resourcebase"],
+                "norman": ["view_resourcebase", "download_resourcebase", "change_dataset_style"],
+            },
+            "groups": {},
+        }
+        resources = [doc, map, dt]
+        for resource in resources:
+            self.assertTrue(self.rm.set_permissions(resource.uuid, instance=resource, permissions=perm_spec))
+        expected = {resource.id: resource.get_all_level_info() for resource in resources}
+        rows = set(UserObjectPermission.objects.filter(object_pk=str(dt.id)).values_list("id", flat=True))
+
+        self.assertTrue(self.rm.set_permissions_bulk(resources, permissions=perm_spec))
+        for resource in resources:
+            self.assertEqual(resource.get_all_level_info(), expected[resource.id])
+        # unchanged permissions are left in place
+        self.assertSetEqual(
+            set(UserObjectPermission.objects.filter(object_pk=str(dt.id)).values_list("id", flat=True)), rows
+        )
+
+        # a specific perm spec can be given per resource
+        self.assertTrue(
+            self.rm.set_permissions_bulk(
+                resources, permissions=perm_spec, perm_specs={dt.id: {"users": {"norman": ["view_resourcebase"]}}}
+            )
+        )
+        self.assertFalse(norman.has_perm("change_dataset_style", dt))
+        self.assertTrue(norman.has_perm("download_resourcebase", doc.get_self_resource()))
+
     def test_set_thumbnail(self):
         doc = create_single_doc("test_thumb_doc")
         dt = create_single_dataset("test_thumb_dataset")
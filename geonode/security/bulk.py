@@ -0,0 +1,146 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import logging
+
+from django.db import transaction
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from guardian.ctypes import get_content_type
+from guardian.models import UserObjectPermission, GroupObjectPermission
+from guardian.utils import get_identity
+
+logger = logging.getLogger(__name__)
+
+BULK_PERMISSIONS_BATCH_SIZE = 1000
+
+
+class ObjectPermissionsAssignment:
+    """
+    Collects the guardian object permissions which should be granted on a set of resources,
+    then applies them in bulk.
+
+    The resources are registered with "add_resource"; from then on their object permissions
+    (on "ResourceBase" and, for datasets, on "Dataset") are fully owned by the assignment:
+    "apply" diffs the desired "UserObjectPermission"/"GroupObjectPermission" rows against the existing ones,
+    read with one query per table and batch of resources, then creates the missing rows and deletes the stale
+    ones inside one transaction. Rows which are already in place are left untouched.
+
+    Usage:
+        assignment = ObjectPermissionsAssignment()
+        for resource in resources:
+            assignment.add_resource(resource)
+            assignment.assign("view_resourcebase", group, resource.get_self_resource())
+        created, deleted = assignment.apply()
+    """
+
+    def __init__(self, batch_size: int = BULK_PERMISSIONS_BATCH_SIZE):
+        self.batch_size = batch_size
+        # object_pk -> content type ids whose permissions are managed
+        self.scopes = {}
+        # (model, holder id, content type id, object_pk, permission id)
+        self.desired = set()
+        self._permissions = {}
+
+    def add_resource(self, resource):
+        """
+        Registers a resource: all of its object permissions not assigned again will be removed.
+        """
+        from geonode.layers.models import Dataset
+
+        _resource = resource.get_real_instance()
+        scope = self.scopes.setdefault(str(_resource.id), set())
+        scope.add(ContentType.objects.get_for_model(_resource.get_self_resource()).id)
+        if isinstance(_resource, Dataset):
+            scope.add(ContentType.objects.get_for_model(_resource).id)
+
+    def get_permission_id(self, perm: str, ctype) -> int:
+        """
+        Resolves a permission codename as guardian "assign_perm" does.
+        Raises "Permission.DoesNotExist" if the permission is not defined for the content type.
+        """
+        if ctype.id not in self._permissions:
+            self._permissions[ctype.id] = dict(
+                Permission.objects.filter(content_type=ctype).values_list("codename", "id")
+            )
+        codename = perm.split(".", 1)[1] if "." in perm else perm
+        try:
+            return self._permissions[ctype.id][codename]
+        except KeyError:
+            raise Permission.DoesNotExist(f"Permission {perm} does not exist for {ctype}")
+
+    def assign(self, perm: str, user_or_group, obj):
+        """
+        Bulk counterpart of guardian "assign_perm(perm, user_or_group, obj)".
+        """
+        user, group = get_identity(user_or_group)
+        ctype = get_content_type(obj)
+        permission_id = self.get_permission_id(perm, ctype)
+        if group:
+            self.desired.add((GroupObjectPermission, group.id, ctype.id, str(obj.pk), permission_id))
+        else:
+            self.desired.add((UserObjectPermission, user.id, ctype.id, str(obj.pk), permission_id))
+
+    def _get_existing(self, model, holder_field: str) -> dict:
+        """
+        Returns the existing rows of the managed resources as a dict of key -> row id.
+        """
+        existing = {}
+        ctype_ids = set().union(*self.scopes.values()) if self.scopes else set()
+        object_pks = list(self.scopes.keys())
+        for i in range(0, len(object_pks), self.batch_size):
+            rows = model.objects.filter(
+                object_pk__in=object_pks[i : i + self.batch_size], content_type_id__in=ctype_ids
+            ).values_list("id", holder_field, "content_type_id", "object_pk", "permission_id")
+            for row_id, holder_id, ctype_id, object_pk, permission_id in rows:
+                if ctype_id in self.scopes.get(object_pk, ()):
+                    existing[(model, holder_id, ctype_id, object_pk, permission_id)] = row_id
+        return existing
+
+    def apply(self) -> tuple:
+        """
+        Creates the missing rows and deletes the stale ones of the managed resources.
+        :return: the number of created and deleted rows
+        """
+        created = deleted = 0
+        with transaction.atomic():
+            for model, holder_field in ((UserObjectPermission, "user_id"), (GroupObjectPermission, "group_id")):
+                existing = self._get_existing(model, holder_field)
+                desired = {_k for _k in self.desired if _k[0] is model}
+
+                stale = [_id for _k, _id in existing.items() if _k not in desired]
+                for i in range(0, len(stale), self.batch_size):
+                    deleted += model.objects.filter(id__in=stale[i : i + self.batch_size]).delete()[0]
+
+                missing = [
+                    model(
+                        **{holder_field: holder_id},
+                        content_type_id=ctype_id,
+                        object_pk=object_pk,
+                        permission_id=permission_id,
+                    )
+                    for _, holder_id, ctype_id, object_pk, permission_id in desired - existing.keys()
+                ]
+                # permissions assigned on objects out of the managed scope may already exist
+                model.objects.bulk_create(missing, batch_size=self.batch_size, ignore_conflicts=True)
+                created += len(missing)
+
+        logger.debug(f"Applied permissions of {len(self.scopes)} resources: {created} created, {deleted} deleted")
+        return created, deleted
@@ -0,0 +1,57 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import logging
+
+from django.core.management.base import BaseCommand
+
+from geonode.base.models import ResourceBase
+from geonode.security.utils import rebuild_resource_visibility
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the resources visibility table from the guardian permissions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-r",
+            "--resources",
+            dest="resources",
+            nargs="*",
+            type=int,
+            default=None,
+            help="Only rebuild the visibility of the resources with the given ids",
+        )
+        parser.add_argument(
+            "-c",
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            default=1000,
+            help="Number of resources processed in a single transaction",
+        )
+
+    def handle(self, *args, **options):
+        queryset = ResourceBase.objects.all()
+        if options.get("resources"):
+            queryset = queryset.filter(id__in=options.get("resources"))
+        count = rebuild_resource_visibility(queryset, chunk_size=options.get("chunk_size"))
+        logger.info(f"Visibility rebuilt for {count} resources")
+        self.stdout.write(f"Visibility rebuilt for {count} resources")
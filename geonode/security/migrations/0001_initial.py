@@ -0,0 +1,33 @@
+# Generated by Django 4.2.9 on 2026-10-18 10:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('base', '0090_alter_resourcebase_polymorphic_ctype'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceVisibility',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('can_view', models.BooleanField(default=False)),
+                ('can_change', models.BooleanField(default=False)),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='auth.group')),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visibility', to='base.resourcebase')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'resource'], name='security_visibility_user_idx'), models.Index(fields=['group', 'resource'], name='security_visibility_group_idx')],
+            },
+        ),
+    ]
@@ -44,7 +44,7 @@ from geonode.maps.models import Map
 from geonode.layers.models import Dataset
 from geonode.documents.models import Document
 from geonode.compat import ensure_string
-from geonode.utils import check_ogc_backend
+from geonode.utils import check_ogc_backend, get_dataset_workspace
 from geonode.tests.utils import check_dataset
 from geonode.decorators import on_ogc_backend
 from geonode.resource.manager import resource_manager
@@ -62,11 +62,13 @@ from geonode.base.populate_test_data import (
     remove_models,
     create_single_dataset,
 )
+from geonode.geoserver.geofence_mirror import rule_signature, rules_diff, rules_mirror
 from geonode.geoserver.security import (
     _get_gf_services,
     allow_layer_to_all,
     delete_all_geofence_rules,
     sync_resources_with_guardian,
+    _split_operations,
     _get_gwc_filters_and_formats,
     has_geolimits,
     create_geofence_rules,
@@ -77,7 +79,9 @@ from geonode.geoserver.security import (
 from .utils import (
     get_users_with_perms,
     get_visible_resources,
+    rebuild_resource_visibility,
 )
+from .models import ResourceVisibility
 
 from .permissions import PermSpec, PermSpecCompact
 
@@ -1319,6 +1323,32 @@ class SecurityTests(ResourceTestCaseMixin, GeoNodeBaseTestSupport):
         actual = get_visible_resources(queryset=layers, user=get_user_model().objects.get(username=self.user))
         self.assertIn(_title, list(actual.values_list("title", flat=True)))
 
+    def test_get_visible_resources_with_visibility_index(self):
+        standard_user = get_user_model().objects.get(username="bobby")
+        layers = Dataset.objects.all()
+        rebuild_resource_visibility()
+        with override_settings(SECURITY_VISIBILITY_INDEX_ENABLED=False):
+            expected = set(get_visible_resources(queryset=layers, user=standard_user).values_list("id", flat=True))
+            expected_anonymous = set(
+                get_visible_resources(queryset=layers, user=AnonymousUser()).values_list("id", flat=True)
+            )
+        with override_settings(SECURITY_VISIBILITY_INDEX_ENABLED=True):
+            actual = set(get_visible_resources(queryset=layers, user=standard_user).values_list("id", flat=True))
+            actual_anonymous = set(
+                get_visible_resources(queryset=layers, user=AnonymousUser()).values_list("id", flat=True)
+            )
+        self.assertSetEqual(expected, actual)
+        self.assertSetEqual(expected_anonymous, actual_anonymous)
+
+        # the index is updated incrementally by the resource manager
+        _title = "common bar"
+        for x in Dataset.objects.filter(title=_title):
+            x.set_permissions({"users": {"bobby": []}, "groups": []})
+            self.assertFalse(ResourceVisibility.objects.filter(resource_id=x.id, user=standard_user).exists())
+        with override_settings(SECURITY_VISIBILITY_INDEX_ENABLED=True):
+            actual = get_visible_resources(queryset=layers, user=standard_user)
+            self.assertNotIn(_title, list(actual.values_list("title", flat=True)))
+
     def test_perm_spec_conversion(self):
         """
         Perm Spec from extended to cmpact and viceversa
@@ -1756,6 +1786,88 @@ class SecurityRulesTests(TestCase):
             # TODO: DELAYED SECURITY MUST BE REVISED
             # self.assertFalse(clean_dataset.dirty_state)
 
+    def test_collect_layers_rules(self):
+        pages = [
+            {
+                "rules": [
+                    {"id": 1, "priority": 4, "workspace": "geonode", "layer": "a"},
+                    {"id": 2, "priority": 7, "workspace": "geonode", "layer": "b"},
+                ]
+            },
+            {
+                "rules": [
+                    {"id": 3, "priority": 9, "workspace": "other", "layer": "a"},
+                    {"id": 4, "priority": 2, "workspace": None, "layer": None},
+                ]
+            },
+            {"rules": [{"id": 5, "priority": 11, "workspace": "geonode", "layer": "a"}]},
+        ]
+        with mock.patch.object(gf_utils.geofence, "get_rules", side_effect=pages) as get_rules:
+            rules_by_layer, first_priority = gf_utils.collect_layers_rules(
+                [("geonode", "a"), ("geonode", "c")], page_size=2
+            )
+        self.assertEqual(get_rules.call_count, 3)
+        self.assertDictEqual(rules_by_layer, {("geonode", "a"): [1, 5], ("geonode", "c"): []})
+        self.assertEqual(first_priority, 12)
+
+    @override_settings(GEOFENCE_RULES_MIRROR_ENABLED=True, GEOFENCE_SYNC_BATCH_SIZE=1)
+    @mock.patch.object(gf_utils, "get_first_available_priority", return_value=1)
+    @mock.patch.object(geofence, "run_batch", return_value=True)
+    def test_sync_resources_mirror_refreshed_once(self, run_batch, _):
+        other = create_single_dataset("test_dataset_other")
+        layers = {(get_dataset_workspace(dataset), dataset.name) for dataset in (self._l, other)}
+        run_batch.reset_mock()
+        with mock.patch.object(rules_mirror, "get_rules", return_value={layer: [] for layer in layers}):
+            with mock.patch.object(rules_mirror, "refresh") as refresh:
+                sync_resources_with_guardian(force=True)
+        # one batch for each dataset, the inserted rules are read back once
+        self.assertEqual(run_batch.call_count, 2)
+        refresh.assert_called_once_with(layers)
+
+    @mock.patch.object(gf_utils, "get_first_available_priority", return_value=1)
+    @mock.patch.object(geofence, "run_batch", return_value=True)
+    def test_sync_resources_rules_read_failure(self, run_batch, _):
+        other = create_single_dataset("test_dataset_other")
+        run_batch.reset_mock()
+        with mock.patch.object(gf_utils, "collect_layers_rules", side_effect=Exception("GeoFence unavailable")):
+            with mock.patch.object(gf_utils, "collect_delete_layer_rules", return_value=None) as collect_rules:
+                sync_resources_with_guardian(force=True)
+        # the rules are read again for each dataset, none is left out of the sync
+        self.assertEqual(collect_rules.call_count, 2)
+        self.assertEqual(run_batch.call_count, 1)
+        self.assertFalse(Dataset.objects.get(pk=other.pk).dirty_state)
+
+    def test_split_operations(self):
+        ranges = [("a", 0, 3), ("b", 3, 5), ("c", 5, 12), ("d", 12, 13)]
+        self.assertListEqual(
+            list(_split_operations(ranges, 5)),
+            [[("a", 0, 3), ("b", 3, 5)], [("c", 5, 12)], [("d", 12, 13)]],
+        )
+        self.assertListEqual(list(_split_operations(ranges, 100)), [ranges])
+
+    def test_rules_diff(self):
+        def _insert(**fields):
+            return {"@service": "rules", "@type": "insert", "Rule": dict(workspace="geonode", layer="a", **fields)}
+
+        wms = _insert(service="WMS", access="ALLOW")
+        wps_deny = _insert(userName="bobby", service="WPS", subfield="GS:DOWNLOAD", access="DENY")
+        wps = _insert(userName="bobby", service="WPS", access="ALLOW")
+        existing = [(1, rule_signature(wms["Rule"])), (2, rule_signature(wps_deny["Rule"]))]
+
+        # nothing changed
+        self.assertEqual(rules_diff(existing, [wms, wps_deny]), ([], []))
+        # rules appended to the existing ones
+        self.assertEqual(rules_diff(existing, [wms, wps_deny, wps]), ([], [wps]))
+        # removed rules
+        self.assertEqual(rules_diff(existing, [wps_deny]), ([1], []))
+        # rules needing a higher precedence than the existing ones are replaced with them
+        self.assertEqual(rules_diff(existing, [wps, wms, wps_deny]), ([1, 2], [wps, wms, wps_deny]))
+        # "*" and missing values are equivalent, as GeoFence returns them
+        self.assertEqual(
+            rule_signature({"service": "*", "access": "ALLOW", "limits": {}}),
+            rule_signature({"access": "ALLOW"}),
+        )
+
 
 class TestGetUserGeolimits(TestCase):
     def setUp(self):
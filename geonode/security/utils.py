@@ -22,13 +22,15 @@ import logging
 import collections
 from itertools import chain
 
+from django.db import transaction
 from django.db.models import Q
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import Group, Permission
 from guardian.utils import get_user_obj_perms_model
-from guardian.shortcuts import get_objects_for_user, get_objects_for_group
+from guardian.models import UserObjectPermission, GroupObjectPermission
+from guardian.shortcuts import get_anonymous_user, get_objects_for_user, get_objects_for_group
 
 from geonode.groups.conf import settings as groups_settings
 from geonode.groups.models import GroupProfile
@@ -65,21 +67,6 @@ def get_visible_resources(
     from geonode.groups.models import GroupProfile
 
     is_admin = user.is_superuser if user and user.is_authenticated else False
-    anonymous_group = None
-    public_groups = GroupProfile.objects.exclude(access="private").values("group")
-    groups = []
-    group_list_all = []
-    try:
-        group_list_all = user.group_list_all().values("group")
-    except Exception:
-        pass
-
-    try:
-        anonymous_group = Group.objects.get(name="anonymous")
-        if anonymous_group and anonymous_group not in groups:
-            groups.append(anonymous_group)
-    except Exception:
-        pass
 
     if metadata_only is not None:
         # Hide Dirty State Resources
@@ -90,13 +77,18 @@ def get_visible_resources(
 
     if not is_admin:
         if user:
-            _allowed_resources = get_objects_for_user(
-                user, ["base.view_resourcebase", "base.change_resourcebase"], any_perm=True
-            )
-            queryset = queryset.filter(id__in=_allowed_resources.values("id"))
+            if is_visibility_index_enabled():
+                queryset = filter_visible_by_index(queryset, user)
+            else:
+                _allowed_resources = get_objects_for_user(
+                    user, ["base.view_resourcebase", "base.change_resourcebase"], any_perm=True
+                )
+                queryset = queryset.filter(id__in=_allowed_resources.values("id"))
 
         if admin_approval_required and not AdvancedSecurityWorkflowManager.is_simplified_workflow():
             if not user or not user.is_authenticated or user.is_anonymous:
+                public_groups = GroupProfile.objects.exclude(access="private").values("group")
+                groups = Group.objects.filter(name="anonymous")
                 queryset = queryset.filter(
                     Q(is_published=True) | Q(group__in=public_groups) | Q(group__in=groups)
                 ).exclude(is_approved=False)
@@ -109,6 +101,11 @@ def get_visible_resources(
         # Hide Resources Belonging to Private Groups
         if private_groups_not_visibile:
             private_groups = GroupProfile.objects.filter(access="private").values("group")
+            group_list_all = []
+            try:
+                group_list_all = user.group_list_all().values("group")
+            except Exception:
+                pass
             if user and user.is_authenticated:
                 queryset = queryset.exclude(
                     Q(group__in=private_groups) & ~(Q(owner__username__iexact=str(user)) | Q(group__in=group_list_all))
@@ -119,6 +116,93 @@ def get_visible_resources(
     return queryset
 
 
+VISIBILITY_PERMISSIONS = ("view_resourcebase", "change_resourcebase")
+
+
+def is_visibility_index_enabled():
+    return getattr(settings, "SECURITY_VISIBILITY_INDEX_ENABLED", False)
+
+
+def filter_visible_by_index(queryset, user):
+    """
+    Restricts the "queryset" to the resources the user can view or change, by joining
+    the "ResourceVisibility" table instead of evaluating the guardian permissions.
+
+    Mirrors "get_objects_for_user(user, VISIBILITY_PERMISSIONS, any_perm=True)":
+    grants assigned to the user itself and to any of its groups are considered.
+    """
+    from geonode.security.models import ResourceVisibility
+
+    if user.is_anonymous:
+        user = get_anonymous_user()
+    if user.is_superuser:
+        return queryset
+
+    _visible = ResourceVisibility.objects.filter(Q(user=user) | Q(group__in=user.groups.values("id"))).values(
+        "resource_id"
+    )
+    return queryset.filter(id__in=_visible)
+
+
+def sync_resource_visibility(resource_ids):
+    """
+    Rebuilds the "ResourceVisibility" rows of the given resources from the current guardian
+    "view_resourcebase" / "change_resourcebase" grants.
+    """
+    from geonode.base.models import ResourceBase
+    from geonode.security.models import ResourceVisibility
+
+    resource_ids = [int(_id) for _id in resource_ids]
+    if not resource_ids:
+        return 0
+
+    ctype = ContentType.objects.get_for_model(ResourceBase)
+    _filter = {
+        "content_type": ctype,
+        "object_pk__in": [str(_id) for _id in resource_ids],
+        "permission__codename__in": VISIBILITY_PERMISSIONS,
+    }
+    grants = {}
+    for model, subject in ((UserObjectPermission, "user_id"), (GroupObjectPermission, "group_id")):
+        for object_pk, subject_id, codename in model.objects.filter(**_filter).values_list(
+            "object_pk", subject, "permission__codename"
+        ):
+            key = (int(object_pk), subject, subject_id)
+            grants.setdefault(key, set()).add(codename)
+
+    rows = [
+        ResourceVisibility(
+            resource_id=resource_id,
+            user_id=subject_id if subject == "user_id" else None,
+            group_id=subject_id if subject == "group_id" else None,
+            can_view="view_resourcebase" in codenames,
+            can_change="change_resourcebase" in codenames,
+        )
+        for (resource_id, subject, subject_id), codenames in grants.items()
+    ]
+    with transaction.atomic():
+        ResourceVisibility.objects.filter(resource_id__in=resource_ids).delete()
+        # the resources might have been deleted in the meantime
+        existing = set(ResourceBase.objects.filter(id__in=resource_ids).values_list("id", flat=True))
+        ResourceVisibility.objects.bulk_create([_row for _row in rows if _row.resource_id in existing])
+    return len(rows)
+
+
+def rebuild_resource_visibility(queryset=None, chunk_size=1000):
+    """
+    (Re)builds the "ResourceVisibility" table for the resources of the "queryset" (all by default),
+    "chunk_size" resources at a time.
+    """
+    from geonode.base.models import ResourceBase
+
+    if queryset is None:
+        queryset = ResourceBase.objects.all()
+    resource_ids = list(queryset.order_by("id").values_list("id", flat=True))
+    for offset in range(0, len(resource_ids), chunk_size):
+        sync_resource_visibility(resource_ids[offset : offset + chunk_size])
+    return len(resource_ids)
+
+
 def get_users_with_perms(obj):
     """
     Override of the Guardian get_users_with_perms
@@ -176,7 +260,8 @@ def get_resources_with_perms(user, filter_options={}, shortcut_kwargs={}):
     """
     from geonode.base.models import ResourceBase
 
-    if settings.SKIP_PERMS_FILTER:
+    if settings.SKIP_PERMS_FILTER or (is_visibility_index_enabled() and not shortcut_kwargs):
+        # the visibility filter is applied by "get_visible_resources" below
         resources = ResourceBase.objects.all()
     else:
         resources = get_objects_for_user(
@@ -548,6 +548,11 @@ REST_FRAMEWORK_EXTENSIONS = {
 REST_API_DEFAULT_PAGE = os.getenv("REST_API_DEFAULT_PAGE", 1)
 REST_API_DEFAULT_PAGE_SIZE = os.getenv("REST_API_DEFAULT_PAGE_SIZE", 10)
 REST_API_DEFAULT_PAGE_QUERY_PARAM = os.getenv("REST_API_DEFAULT_PAGE_QUERY_PARAM", "page_size")
+# keyset pagination, enabled by the "cursor" query param, see geonode.base.api.pagination.GeoNodeApiPagination
+REST_API_DEFAULT_CURSOR_QUERY_PARAM = os.getenv("REST_API_DEFAULT_CURSOR_QUERY_PARAM", "cursor")
+# default way to compute the total of the cursor paginated responses: exact, cached, estimate or none
+REST_API_CURSOR_TOTAL = os.getenv("REST_API_CURSOR_TOTAL", "cached")
+REST_API_CURSOR_TOTAL_CACHE_TIMEOUT = int(os.getenv("REST_API_CURSOR_TOTAL_CACHE_TIMEOUT", 60))
 
 REST_API_PRESETS = {
     "bare": {"exclude[]": ["*"], "include[]": ["pk", "title"]},
@@ -1028,6 +1033,16 @@ GEOFENCE_SECURITY_ENABLED = (
     False if TEST and not INTEGRATION else ast.literal_eval(os.getenv("GEOFENCE_SECURITY_ENABLED", "True"))
 )
 
+# Number of GeoFence rules fetched per page when scanning the rules of many datasets at once
+GEOFENCE_RULES_PAGE_SIZE = int(os.getenv("GEOFENCE_RULES_PAGE_SIZE", "1000"))
+
+# Max number of operations sent to GeoFence with a single batch when synching many datasets at once
+GEOFENCE_SYNC_BATCH_SIZE = int(os.getenv("GEOFENCE_SYNC_BATCH_SIZE", "5000"))
+
+# Keep a local mirror of the GeoFence rules, so that the sync only sends the rules which actually changed
+# Run the "reconcile_geofence_rules" command after enabling it
+GEOFENCE_RULES_MIRROR_ENABLED = ast.literal_eval(os.getenv("GEOFENCE_RULES_MIRROR_ENABLED", "False"))
+
 # OGC (WMS/WFS/WCS) Server Settings
 # OGC (WMS/WFS/WCS) Server Settings
 OGC_SERVER = {
@@ -1064,6 +1079,10 @@ OGC_SERVER = {
     }
 }
 
+# Max number of pooled HTTP sessions kept by geonode.utils.HttpClient, one for each scheme, host,
+# authentication mode and retries policy; the least recently used ones are closed beyond it
+HTTP_CLIENT_MAX_POOLED_SESSIONS = int(os.getenv("HTTP_CLIENT_MAX_POOLED_SESSIONS", 100))
+
 USE_GEOSERVER = "geonode.geoserver" in INSTALLED_APPS and OGC_SERVER["default"]["BACKEND"] == "geonode.geoserver"
 
 # Uploader Settings
@@ -1292,8 +1311,14 @@ except ValueError:
 # The proxy to use when making cross origin requests.
 PROXY_URL = os.environ.get("PROXY_URL", "/proxy/?url=")
 
+# Stream the proxied responses in chunks instead of buffering them in memory
+PROXY_STREAMING_ENABLED = ast.literal_eval(os.getenv("PROXY_STREAMING_ENABLED", "False"))
+
 # Avoid permissions prefiltering
 SKIP_PERMS_FILTER = ast.literal_eval(os.getenv("SKIP_PERMS_FILTER", "False"))
+# Filter the visible resources through the denormalized "ResourceVisibility" table instead of
+# the guardian permissions tables. Run "manage.py sync_resource_visibility" once before enabling it.
+SECURITY_VISIBILITY_INDEX_ENABLED = ast.literal_eval(os.getenv("SECURITY_VISIBILITY_INDEX_ENABLED", "False"))
 # Available download formats
 DOWNLOAD_FORMATS_METADATA = [
     "Atom",
@@ -1368,6 +1393,8 @@ API_LOCKDOWN = ast.literal_eval(os.getenv("API_LOCKDOWN", "False"))
 # Number of items returned by the apis 0 equals no limit
 API_LIMIT_PER_PAGE = int(os.getenv("API_LIMIT_PER_PAGE", "200"))
 API_INCLUDE_REGIONS_COUNT = ast.literal_eval(os.getenv("API_INCLUDE_REGIONS_COUNT", "False"))
+# Compute the contact roles, favorite, perms and links of a page of resources with one query per lookup
+RESOURCES_API_PREFETCH_ENABLED = ast.literal_eval(os.getenv("RESOURCES_API_PREFETCH_ENABLED", "True"))
 
 # Settings for EXIF plugin
 EXIF_ENABLED = ast.literal_eval(os.getenv("EXIF_ENABLED", "True"))
@@ -2036,6 +2063,44 @@ THUMBNAIL_SIZE = {
     "height": int(os.environ.get("THUMBNAIL_GENERATOR_DEFAULT_SIZE_HEIGHT", 200)),
 }
 
+# How long, in seconds, the result of the blank check of an image URL (e.g. a thumbnail) is cached
+MONOCHROMATIC_IMAGE_CACHE_TIMEOUT = int(os.getenv("MONOCHROMATIC_IMAGE_CACHE_TIMEOUT", 86400))
+
+# Smaller sizes and compact encodings of the thumbnails, stored next to them and served by content negotiation
+# through the resources' "thumbnail" API endpoint
+THUMBNAIL_DERIVATIVES = {
+    "enabled": ast.literal_eval(os.environ.get("THUMBNAIL_DERIVATIVES_ENABLED", "True")),
+    # widths of the smaller sizes, their heights keep the thumbnails ratio
+    "widths": ast.literal_eval(os.environ.get("THUMBNAIL_DERIVATIVES_WIDTHS", "[125, 250]")),
+    # encodings by order of preference, in addition to JPEG; "image/avif" requires a Pillow build supporting it
+    "formats": ast.literal_eval(os.environ.get("THUMBNAIL_DERIVATIVES_FORMATS", "['image/avif', 'image/webp']")),
+    "quality": int(os.environ.get("THUMBNAIL_DERIVATIVES_QUALITY", 80)),
+}
+
+# On-disk cache of the thumbnails' background tiles, shared by the processes having access to its location
+THUMBNAIL_TILES_CACHE = {
+    "enabled": ast.literal_eval(os.environ.get("THUMBNAIL_TILES_CACHE_ENABLED", "True")),
+    "location": os.environ.get("THUMBNAIL_TILES_CACHE_LOCATION", "/tmp/geonode_thumbnail_tiles"),
+    # size budget in bytes, the least recently used tiles are evicted beyond it
+    "max_size": int(os.environ.get("THUMBNAIL_TILES_CACHE_MAX_SIZE", 512 * 1024 * 1024)),
+}
+
+# Concurrency of the requests fetching the thumbnails' WMS images and background tiles
+THUMBNAIL_FETCH_OPTIONS = {
+    "max_workers": int(os.environ.get("THUMBNAIL_FETCH_MAX_WORKERS", 8)),
+    # max number of concurrent requests to the same host
+    "max_per_host": int(os.environ.get("THUMBNAIL_FETCH_MAX_PER_HOST", 4)),
+    # overall deadline, in seconds, for fetching the images of a thumbnail
+    "timeout": int(os.environ.get("THUMBNAIL_FETCH_TIMEOUT", 60)),
+}
+
+# Bulk thumbnails regeneration, see geonode.thumbs.batch.regenerate_thumbnails
+THUMBNAIL_BATCH_OPTIONS = {
+    "workers": int(os.environ.get("THUMBNAIL_BATCH_WORKERS", 4)),
+    # max number of resources, sharing the OGC server and background tiles, taken at once by a worker
+    "chunk_size": int(os.environ.get("THUMBNAIL_BATCH_CHUNK_SIZE", 10)),
+}
+
 THUMBNAIL_BACKGROUND = {
     # class generating thumbnail's background
     # 'class': 'geonode.thumbs.background.WikiMediaTileBackground',
@@ -2080,6 +2145,14 @@ if USE_GEOSERVER:
     MAP_BASELAYERS = [PUBLIC_GEOSERVER]
     MAP_BASELAYERS.extend(baselayers)
 
+# Number of GeoServer layers of the chunks updatelayers records its progress by
+GS_SLURP_CHUNK_SIZE = int(os.getenv("GS_SLURP_CHUNK_SIZE", 50))
+
+# Max number of concurrent WPS requests computing the statistics of the attributes of a dataset
+ATTRIBUTE_STATISTICS_MAX_WORKERS = int(os.getenv("ATTRIBUTE_STATISTICS_MAX_WORKERS", 4))
+# How long, in seconds, the attributes statistics are cached, they are recomputed anyway when the dataset changes
+ATTRIBUTE_STATISTICS_CACHE_TIMEOUT = int(os.getenv("ATTRIBUTE_STATISTICS_CACHE_TIMEOUT", 86400))
+
 # Settings for MONITORING plugin
 MONITORING_ENABLED = ast.literal_eval(os.environ.get("MONITORING_ENABLED", "False"))
 
@@ -2090,6 +2163,31 @@ MONITORING_SERVICE_NAME = os.getenv("MONITORING_SERVICE_NAME", "geonode")
 # how long monitoring data should be stored
 MONITORING_DATA_TTL = timedelta(days=int(os.getenv("MONITORING_DATA_TTL", 365)))
 
+# the requests events are written in batches by a background thread, out of the requests,
+# max number of events waiting to be written, the following ones are dropped
+MONITORING_INGESTION_QUEUE_SIZE = int(os.getenv("MONITORING_INGESTION_QUEUE_SIZE", 10000))
+# how long, in seconds, a request waits for room in a full queue before dropping its event
+MONITORING_INGESTION_QUEUE_TIMEOUT = int(os.getenv("MONITORING_INGESTION_QUEUE_TIMEOUT", 0))
+# max number of events written at once
+MONITORING_INGESTION_BATCH_SIZE = int(os.getenv("MONITORING_INGESTION_BATCH_SIZE", 100))
+# max time, in seconds, an event waits for its batch to be filled before being written
+MONITORING_INGESTION_FLUSH_INTERVAL = int(os.getenv("MONITORING_INGESTION_FLUSH_INTERVAL", 1))
+
+# number of periods checked at once for data to aggregate when downsampling the past data,
+# the chunks with nothing to aggregate are skipped
+MONITORING_DATA_AGGREGATION_CHUNK_SIZE = int(os.getenv("MONITORING_DATA_AGGREGATION_CHUNK_SIZE", 60))
+
+# length of the time-range partitions of the monitoring tables, "day" or "week" (PostgreSQL only),
+# the tables are converted by the "partition_monitoring" command
+MONITORING_PARTITIONS_INTERVAL = os.getenv("MONITORING_PARTITIONS_INTERVAL", "day")
+# number of partitions created ahead of time by the maintenance task
+MONITORING_PARTITIONS_AHEAD = int(os.getenv("MONITORING_PARTITIONS_AHEAD", 7))
+
+# granularities of the metric values rollups maintained by the collector, "hour" and/or "day" (PostgreSQL only),
+# the dashboard queries read the whole hours or days of their periods from them.
+# The history prior to the rollups is rolled up by the "rollup_metrics" command
+MONITORING_DATA_ROLLUPS = ast.literal_eval(os.getenv("MONITORING_DATA_ROLLUPS", "['hour', 'day']"))
+
 # this will disable csrf check for notification config views,
 # use with caution - for dev purpose only
 MONITORING_DISABLE_CSRF = ast.literal_eval(os.environ.get("MONITORING_DISABLE_CSRF", "False"))
@@ -2352,6 +2450,10 @@ IMPORTER_HANDLERS = ast.literal_eval(
 INSTALLED_APPS += ("geonode.facets",)
 GEONODE_APPS += ("geonode.facets",)
 
+# Cache alias and timeout (seconds) of the facets topics; a timeout of 0 disables the cache
+FACETS_CACHE = os.getenv("FACETS_CACHE", "default")
+FACETS_CACHE_TIMEOUT = int(os.getenv("FACETS_CACHE_TIMEOUT", 0))
+
 FACET_PROVIDERS = [
     {"class": "geonode.facets.providers.baseinfo.ResourceTypeFacetProvider"},
     {"class": "geonode.facets.providers.baseinfo.FeaturedFacetProvider"},
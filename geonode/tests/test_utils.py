@@ -24,12 +24,17 @@ import zipfile
 import tempfile
 from django.test import override_settings
 
+from io import BytesIO
 from osgeo import ogr
+from PIL import Image
 from unittest.mock import patch
 from datetime import datetime, timedelta
 
 from django.contrib.gis.geos import GEOSGeometry, Polygon
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.core.management import call_command
 
 from geonode.maps.models import Dataset
@@ -37,7 +42,16 @@ from geonode.layers.models import Attribute
 from geonode.geoserver.helpers import set_attributes
 from geonode.tests.base import GeoNodeBaseTestSupport
 from geonode.br.management.commands.utils.utils import ignore_time
-from geonode.utils import copy_tree, fixup_shp_columnnames, get_supported_datasets_file_types, unzip_file, bbox_to_wkt
+from geonode.utils import (
+    copy_tree,
+    unzip_file,
+    bbox_to_wkt,
+    HttpSessionRegistry,
+    fixup_shp_columnnames,
+    get_supported_datasets_file_types,
+    is_monochromatic_image,
+    cache_monochromatic_image,
+)
 from geonode import settings
 
 
@@ -240,6 +254,49 @@ class TestSetAttributes(GeoNodeBaseTestSupport):
         for a in _l.attributes:
             self.assertIn([a.attribute, a.attribute_type], expected_results)
 
+    def test_set_attributes_in_bulk(self):
+        """Test that set_attributes() applies the changes with a bounded number of queries."""
+        _l = Dataset.objects.create(
+            owner=self.user,
+            name="dummy_wide_dataset",
+            bbox_polygon=Polygon.from_bbox((-180, -90, 180, 90)),
+            srid="EPSG:4326",
+        )
+        attribute_map = [[f"field_{i}", "xsd:int"] for i in range(300)]
+        stats = {
+            "Count": 10,
+            "Min": 0,
+            "Max": 9,
+            "Average": 4.5,
+            "Median": 4.5,
+            "StandardDeviation": 1,
+            "Sum": 45,
+            "unique_values": "NA",
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            set_attributes(_l, copy.deepcopy(attribute_map), attribute_stats={_l.name: {"field_0": stats}})
+        self.assertLess(len(ctx.captured_queries), 10)
+        self.assertEqual(_l.attribute_set.count(), 300)
+        self.assertEqual(_l.attribute_set.get(attribute="field_0").max, "9")
+        self.assertEqual(
+            list(_l.attribute_set.order_by("display_order").values_list("attribute", flat=True)[:2]),
+            ["field_0", "field_1"],
+        )
+
+        # existing attributes are kept and get the new statistics, the missing ones are deleted
+        _l.attribute_set.filter(attribute="field_1").update(attribute_label="Field 1")
+        with CaptureQueriesContext(connection) as ctx:
+            set_attributes(
+                _l,
+                copy.deepcopy(attribute_map[1:] + [["new", "xsd:string"]]),
+                attribute_stats={_l.name: {"field_1": stats}},
+            )
+        self.assertLess(len(ctx.captured_queries), 10)
+        self.assertFalse(_l.attribute_set.filter(attribute="field_0").exists())
+        self.assertEqual(_l.attribute_set.get(attribute="field_1").attribute_label, "Field 1")
+        self.assertEqual(_l.attribute_set.get(attribute="field_1").max, "9")
+        self.assertEqual(_l.attribute_set.get(attribute="new").display_order, 300)
+
 
 class TestSupportedTypes(TestCase):
     def setUp(self):
@@ -351,3 +408,67 @@ class TestRegionsCrossingDateLine(TestCase):
         _, wkt = bbox_across_idl.split(";")
         poly = GEOSGeometry(wkt, srid=4326)
         self.assertEqual(poly.geom_type, "MultiPolygon", f"Expexted 'MultiPolygon' type but received {poly.geom_type}")
+
+
+class TestHttpSessionRegistry(TestCase):
+    def setUp(self):
+        self.registry = HttpSessionRegistry(max_sessions=2)
+
+    def test_sessions_are_reused_per_host_and_auth_mode(self):
+        session = self.registry.get_session("http://localhost:8080/geoserver/ows")
+        self.assertIs(session, self.registry.get_session("http://localhost:8080/geoserver/rest"))
+        self.assertIsNot(session, self.registry.get_session("http://localhost:8080/geoserver/ows", auth_mode="basic"))
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["sessions"], 2)
+
+    def test_least_recently_used_sessions_are_evicted(self):
+        self.registry.get_session("http://host1")
+        self.registry.get_session("http://host2")
+        self.registry.get_session("http://host1")
+        self.registry.get_session("http://host3")
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["sessions"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.registry.get_session("http://host1")
+        self.assertEqual(self.registry.get_stats()["hits"], 2)
+
+    def test_registry_is_reset_after_fork(self):
+        session = self.registry.get_session("http://localhost")
+        with patch("os.getpid", return_value=-1):
+            self.assertIsNot(session, self.registry.get_session("http://localhost"))
+            self.assertEqual(self.registry.get_stats()["sessions"], 1)
+
+    def test_auth_mode(self):
+        self.assertIsNone(HttpSessionRegistry.get_auth_mode({}))
+        self.assertEqual(HttpSessionRegistry.get_auth_mode({"Authorization": "Bearer 1234"}), "bearer")
+
+
+class TestIsMonochromaticImage(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_in_memory_image(self):
+        image = Image.new("RGBA", (50, 20), (250, 250, 250, 255))
+        self.assertTrue(is_monochromatic_image(None, image=image))
+        image.putpixel((10, 10), (0, 0, 250, 255))
+        self.assertFalse(is_monochromatic_image(None, image=image))
+
+    def test_image_data(self):
+        with BytesIO() as output:
+            Image.new("P", (50, 20)).save(output, format="PNG")
+            self.assertTrue(is_monochromatic_image(None, output.getvalue()))
+
+    def test_image_url_result_is_cached(self):
+        with BytesIO() as output:
+            Image.new("RGB", (50, 20), (0, 0, 0)).save(output, format="JPEG")
+            content = output.getvalue()
+        with patch("geonode.utils.http_client.get", return_value=(None, content)) as get_mock:
+            self.assertTrue(is_monochromatic_image("http://remote.org/thumb.jpg"))
+            self.assertTrue(is_monochromatic_image("http://remote.org/thumb.jpg"))
+            get_mock.assert_called_once()
+
+            cache_monochromatic_image("http://remote.org/other.jpg", False)
+            self.assertFalse(is_monochromatic_image("http://remote.org/other.jpg"))
+            get_mock.assert_called_once()
@@ -26,6 +26,7 @@ import mercantile
 import requests
 
 from io import BytesIO
+from functools import partial
 from pyproj import Transformer
 from abc import ABC, abstractmethod
 from math import ceil, floor, copysign
@@ -38,6 +39,7 @@ from django.utils.html import strip_tags
 from geonode.thumbs import utils
 from geonode.utils import http_client
 from geonode.thumbs.exceptions import ThumbnailError
+from geonode.thumbs.tiles_cache import get_tiles_cache
 
 logger = logging.getLogger(__name__)
 
@@ -342,34 +344,37 @@ class GenericXYZBackground(BaseThumbBackground):
             (250, 250, 250),
         )
 
+        tiles = []
         for offset_x, x in enumerate(tiles_rows):
             for offset_y, y in enumerate(tiles_cols):
                 if self.tms:
                     y = (2**zoom) - y - 1
-                imgurl = self.url.format(x=x, y=y, z=zoom)
-
-                im = None
-                for retries in range(self.max_retries):
-                    try:
-                        resp, content = http_client.request(imgurl)
-                        if resp.status_code > 400:
-                            retries = self.max_retries - 1
-                            raise Exception(f"{strip_tags(content)}")
-                        im = BytesIO(content)
-                        Image.open(im).verify()  # verify that it is, in fact an image
-                        break
-                    except Exception as e:
-                        logger.error(f"Thumbnail background fetching from {imgurl} failed {retries} time(s) with: {e}")
-                        if retries + 1 == self.max_retries:
-                            raise e
-                        time.sleep(self.retry_delay)
-                        continue
-
-                if im:
-                    image = Image.open(im)  # "re-open" the file (required after running verify method)
-
-                    # add the fetched tile to the background image, placing it under proper coordinates
-                    background.paste(image, (offset_x * self.tile_size, offset_y * self.tile_size + fixed_top_offset))
+                tiles.append((offset_x, offset_y, (x, y)))
+
+        # fetch the tiles concurrently, each distinct tile once
+        coords = list(dict.fromkeys(xy for _, _, xy in tiles))
+        images = dict(
+            zip(
+                coords,
+                utils.fetch_concurrently(
+                    [
+                        (self.url.format(x=x, y=y, z=zoom), partial(self.fetch_cached_tile, self.url, zoom, x, y))
+                        for x, y in coords
+                    ]
+                ),
+            )
+        )
+
+        for offset_x, offset_y, xy in tiles:
+            im = images[xy]
+            if isinstance(im, Exception):
+                raise im
+
+            if im:
+                image = Image.open(BytesIO(im))
+
+                # add the fetched tile to the background image, placing it under proper coordinates
+                background.paste(image, (offset_x * self.tile_size, offset_y * self.tile_size + fixed_top_offset))
 
         # get BBOX of the tiles
         top_left_bounds = mercantile.bounds(top_left_tile)
@@ -419,6 +424,34 @@ class GenericXYZBackground(BaseThumbBackground):
             raise ThumbnailError("Thumbnail background outside the allowed area.")
         return background
 
+    def fetch_cached_tile(self, template: str, z: int, x: int, y: int) -> bytes:
+        """
+        Returns a tile from the tiles cache, fetching it on a miss.
+        """
+        imgurl = template.format(x=x, y=y, z=z)
+        tiles_cache = get_tiles_cache()
+        if tiles_cache is None:
+            return self.fetch_tile(imgurl)
+        return tiles_cache.get_or_fetch(template, z, x, y, partial(self.fetch_tile, imgurl))
+
+    def fetch_tile(self, imgurl: str) -> bytes:
+        """
+        Fetches a tile, retrying self.max_retries times, waiting self.retry_delay seconds between consecutive requests.
+        """
+        for retries in range(self.max_retries):
+            try:
+                resp, content = http_client.request(imgurl)
+                if resp.status_code > 400:
+                    retries = self.max_retries - 1
+                    raise Exception(f"{strip_tags(content)}")
+                Image.open(BytesIO(content)).verify()  # verify that it is, in fact an image
+                return content
+            except Exception as e:
+                logger.error(f"Thumbnail background fetching from {imgurl} failed {retries} time(s) with: {e}")
+                if retries + 1 == self.max_retries:
+                    raise e
+                time.sleep(self.retry_delay)
+
     def calculate_zoom(self):
         # maximum number of needed tiles for thumbnail of given width and height
         max_tiles = (ceil(self.thumbnail_width / self.tile_size) + 1) * (
@@ -510,22 +543,22 @@ class GenericWMTSBackground(BaseThumbBackground):
 
         background = Image.new("RGB", (tiles_width, tiles_height), (250, 250, 250))
 
-        for tile_coord in tile_rowcols:
-            try:
-                im = None
-                imgurl = self.build_request([tile_coord[0], tile_coord[1], zoom])
-                resp = requests.get(imgurl)
-                if resp.status_code > 400:
-                    raise Exception(f"{strip_tags(resp.content)}")
-                im = BytesIO(resp.content)
-                Image.open(im).verify()
-                if im:
-                    offsetx = (tile_coord[0] - tiles_mincol) * tilewidth
-                    offsety = (tile_coord[1] - tiles_minrow) * tileheight
-                    image = Image.open(im)
-                    background.paste(image, (offsetx, offsety))
-            except Exception as e:
-                logger.error(f"Error fetching {imgurl} for thumbnail: {e}")
+        tile_urls = [self.build_request([tile_coord[0], tile_coord[1], zoom]) for tile_coord in tile_rowcols]
+        tile_images = utils.fetch_concurrently(
+            [
+                (imgurl, partial(self.fetch_cached_tile, imgurl, zoom, tile_coord[0], tile_coord[1]))
+                for tile_coord, imgurl in zip(tile_rowcols, tile_urls)
+            ]
+        )
+
+        for tile_coord, imgurl, im in zip(tile_rowcols, tile_urls, tile_images):
+            if isinstance(im, Exception):
+                logger.error(f"Error fetching {imgurl} for thumbnail: {im}")
+                continue
+            offsetx = (tile_coord[0] - tiles_mincol) * tilewidth
+            offsety = (tile_coord[1] - tiles_minrow) * tileheight
+            image = Image.open(BytesIO(im))
+            background.paste(image, (offsetx, offsety))
 
         left = abs(tiles_minx - bbox[0]) / pixelspan
         right = left + self.thumbnail_width
@@ -541,6 +574,19 @@ class GenericWMTSBackground(BaseThumbBackground):
 
         return background
 
+    def fetch_cached_tile(self, imgurl: str, z: int, x: int, y: int) -> bytes:
+        tiles_cache = get_tiles_cache()
+        if tiles_cache is None:
+            return self.fetch_tile(imgurl)
+        return tiles_cache.get_or_fetch(imgurl, z, x, y, partial(self.fetch_tile, imgurl))
+
+    def fetch_tile(self, imgurl: str) -> bytes:
+        resp = requests.get(imgurl)
+        if resp.status_code > 400:
+            raise Exception(f"{strip_tags(resp.content)}")
+        Image.open(BytesIO(resp.content)).verify()
+        return resp.content
+
     def build_kvp_request(self, baseurl, layer, style, xyz):
         return f"{baseurl}?&Service=WMTS&Request=GetTile&Version=1.0.0&Format=image/png&layer={layer}&style={style}\
 &tilematrixset={self.options['tilematrixset']}&TileMatrix={xyz[2]}&TileRow={xyz[1]}&TileCol={xyz[0]}"
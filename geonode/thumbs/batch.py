@@ -0,0 +1,262 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import os
+import json
+import math
+import time
+import uuid
+import logging
+import threading
+import dataclasses
+
+import mercantile
+
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+
+from geonode.base.models import ResourceBase
+from geonode.resource.manager import resource_manager
+from geonode.thumbs.exceptions import ThumbnailError
+
+logger = logging.getLogger(__name__)
+
+# latitude bounds of the Web Mercator tiles
+MAX_LATITUDE = 85.0511
+# zoom of the resources with a point-like bbox
+MAX_ZOOM = 18
+
+
+@dataclasses.dataclass()
+class ThumbnailsBatchReport:
+    total: int = 0
+    skipped: int = 0
+    created: int = 0
+    failed: Dict[int, str] = dataclasses.field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.created + len(self.failed)
+
+    @property
+    def throughput(self) -> float:
+        """Thumbnails processed per second."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+class ThumbnailsBatchCheckpoint:
+    """
+    Progress of a thumbnails batch, optionally persisted to a JSON file, so that an interrupted batch
+    resumes from where it stopped.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.done = set()
+        self.failed = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.done = set(state.get("done", []))
+            self.failed = {int(_id): error for _id, error in state.get("failed", {}).items()}
+
+    def record(self, resource_id: int, error: Optional[str] = None):
+        with self._lock:
+            if error is None:
+                self.done.add(resource_id)
+                self.failed.pop(resource_id, None)
+            else:
+                self.failed[resource_id] = error
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            state = {"done": sorted(self.done), "failed": {str(_id): error for _id, error in self.failed.items()}}
+        # written atomically, an interruption while saving must not lose the previous checkpoint
+        tmp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+
+def get_batch_resources(
+    resource_type: Optional[str] = None,
+    title: Optional[str] = None,
+    username: Optional[str] = None,
+    ids: Optional[List[int]] = None,
+) -> QuerySet:
+    """
+    Returns the resources of a thumbnails batch, optionally only those of the given type, whose title contains
+    the given text, owned by the given user or with the given ids.
+    """
+    resources = ResourceBase.objects.all()
+    if resource_type:
+        resources = resources.filter(resource_type=resource_type)
+    if title:
+        resources = resources.filter(title__icontains=title)
+    if username:
+        resources = resources.filter(owner__username=username)
+    if ids is not None:
+        resources = resources.filter(id__in=ids)
+    return resources
+
+
+def get_resource_group_key(ogc_server: Optional[str], ll_bbox_polygon) -> Tuple:
+    """
+    Returns the key grouping the resources whose thumbnails are fetched from the same OGC server, with the same
+    background tiles: the OGC server, and the Slippy Map tile (z, x, y) containing the center of the resource's
+    bbox, at the zoom the bbox size would fit in.
+    """
+    if ll_bbox_polygon is None:
+        return (ogc_server or "", -1, 0, 0)
+    west, south, east, north = ll_bbox_polygon.extent
+    span = max(east - west, north - south)
+    zoom = min(int(math.log2(360.0 / span)), MAX_ZOOM) if span > 0 else MAX_ZOOM
+    tile = mercantile.tile(
+        min(max((west + east) / 2, -180.0), 180.0),
+        min(max((south + north) / 2, -MAX_LATITUDE), MAX_LATITUDE),
+        max(zoom, 0),
+    )
+    return (ogc_server or "", tile.z, tile.x, tile.y)
+
+
+def group_resources(resources: QuerySet, chunk_size: int, exclude: Optional[set] = None) -> List[List[int]]:
+    """
+    Splits the resources into chunks of at most chunk_size ids, each one within a group of resources sharing the
+    OGC server and the background tiles, ordered so that the chunks of the same group, and of the neighbouring
+    tiles, are processed one after the other.
+    """
+    exclude = exclude or set()
+    groups = {}
+    rows = (
+        ResourceBase.objects.filter(id__in=resources.values("id"))
+        .order_by()
+        .values_list("id", "dataset__remote_service__base_url", "ll_bbox_polygon")
+    )
+    for resource_id, ogc_server, ll_bbox_polygon in rows:
+        if resource_id not in exclude:
+            groups.setdefault(get_resource_group_key(ogc_server, ll_bbox_polygon), []).append(resource_id)
+
+    chunks = []
+    for key in sorted(groups):
+        ids = sorted(groups[key])
+        chunks.extend(ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size))
+    return chunks
+
+
+def _generate_thumbnail(resource_id: int, overwrite: bool, check_bbox: bool):
+    instance = ResourceBase.objects.filter(id=resource_id).first()
+    if instance is None:
+        raise ThumbnailError(f"Resource id {resource_id} does not exist")
+    if not resource_manager.set_thumbnail(None, instance=instance, overwrite=overwrite, check_bbox=check_bbox):
+        raise ThumbnailError(f"Thumbnail generation failed for resource id {resource_id}")
+
+
+def regenerate_thumbnails(
+    resources: QuerySet,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    overwrite: bool = True,
+    check_bbox: bool = True,
+    checkpoint: Optional[str] = None,
+    retry_failed: bool = False,
+    progress: Optional[Callable[[ThumbnailsBatchReport], None]] = None,
+) -> ThumbnailsBatchReport:
+    """
+    Regenerates the thumbnails of the given resources with a bounded pool of workers, according to
+    settings.THUMBNAIL_BATCH_OPTIONS.
+
+    The resources are grouped by OGC server and background tiles, and split into chunks queued in order:
+    each idle worker takes the next chunk, so the tiles of a group are fetched (and cached) once, and
+    the slow groups don't hold the others back.
+
+    :param resources: queryset of the resources (of any type)
+    :param workers: number of workers (default: the 'workers' option)
+    :param chunk_size: max number of resources of a chunk (default: the 'chunk_size' option)
+    :param overwrite: overwrite the existing thumbnails
+    :param check_bbox: passed to the thumbnail generator
+    :param checkpoint: path of the file recording the progress, the resources already processed in a previous
+                       run with the same file are skipped
+    :param retry_failed: process again the resources failed in a previous run with the same checkpoint
+    :param progress: function called with the report after each chunk
+    :returns: the report of the batch, with the ids of the failed resources and the throughput
+    """
+    options = getattr(settings, "THUMBNAIL_BATCH_OPTIONS", {})
+    workers = workers or options.get("workers", 4)
+    chunk_size = chunk_size or options.get("chunk_size", 10)
+
+    state = ThumbnailsBatchCheckpoint(checkpoint)
+    exclude = state.done if retry_failed else state.done | set(state.failed)
+    chunks = group_resources(resources, chunk_size, exclude=exclude)
+
+    report = ThumbnailsBatchReport(total=resources.count())
+    report.skipped = report.total - sum(len(chunk) for chunk in chunks)
+    report_lock = threading.Lock()
+    stop = threading.Event()
+
+    def _process(chunk):
+        try:
+            for resource_id in chunk:
+                if stop.is_set():
+                    return
+                try:
+                    _generate_thumbnail(resource_id, overwrite, check_bbox)
+                    error = None
+                except Exception as e:
+                    logger.exception(e)
+                    error = str(e) or e.__class__.__name__
+                state.record(resource_id, error)
+                with report_lock:
+                    if error is None:
+                        report.created += 1
+                    else:
+                        report.failed[resource_id] = error
+        finally:
+            # close the DB connections opened by this thread
+            connections.close_all()
+
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="thumbs-batch")
+    try:
+        for future in as_completed([executor.submit(_process, chunk) for chunk in chunks]):
+            future.result()
+            state.save()
+            with report_lock:
+                report.elapsed = time.monotonic() - start
+                if progress:
+                    progress(report)
+    finally:
+        # on interruption, the workers stop after their current thumbnail and the progress is saved
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        state.save()
+        report.elapsed = time.monotonic() - start
+
+    logger.info(
+        f"Thumbnails batch: {report.created} created, {len(report.failed)} failed, {report.skipped} skipped "
+        f"in {report.elapsed:.1f}s ({report.throughput:.2f} thumbnails/sec)"
+    )
+    return report
@@ -0,0 +1,183 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import os
+import logging
+
+from io import BytesIO
+from PIL import Image
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from geonode.storage.manager import storage_manager
+
+logger = logging.getLogger(__name__)
+
+# file extension and PIL format of the thumbnails' encodings, by mime type
+FORMATS = {
+    "image/avif": ("avif", "AVIF"),
+    "image/webp": ("webp", "WEBP"),
+    "image/jpeg": ("jpg", "JPEG"),
+}
+# encoding of the thumbnails themselves, understood by any client
+DEFAULT_FORMAT = "image/jpeg"
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "THUMBNAIL_DERIVATIVES", {}).get("enabled", False)
+
+
+def get_formats() -> List[str]:
+    """
+    Returns the mime types of the derivatives' encodings, in order of preference, according to
+    settings.THUMBNAIL_DERIVATIVES 'formats' and to the encoders available to Pillow, always ending with the default one.
+    """
+    Image.init()
+    formats = []
+    for mime_type in getattr(settings, "THUMBNAIL_DERIVATIVES", {}).get("formats", []):
+        if mime_type not in FORMATS or mime_type == DEFAULT_FORMAT:
+            continue
+        if FORMATS[mime_type][1] not in Image.SAVE:
+            logger.debug(f"Thumbnail derivatives: skipping {mime_type}, not supported by Pillow")
+            continue
+        formats.append(mime_type)
+    return formats + [DEFAULT_FORMAT]
+
+
+def get_widths() -> List[int]:
+    """
+    Returns the widths of the derivatives, smaller than the thumbnails ones, in increasing order.
+    """
+    max_width = settings.THUMBNAIL_SIZE["width"]
+    widths = getattr(settings, "THUMBNAIL_DERIVATIVES", {}).get("widths", [])
+    return sorted({int(width) for width in widths if 0 < int(width) < max_width})
+
+
+def derivative_path(thumbnail_path: str, width: Optional[int], mime_type: str) -> str:
+    """
+    Returns the path of a derivative of the thumbnail, stored next to it with the same name prefix:
+    <name>-<width>w.<ext>, or <name>.<ext> for the full size (the thumbnail itself for the default format).
+    """
+    root, ext = os.path.splitext(thumbnail_path)
+    suffix = f"-{width}w" if width else ""
+    if not suffix and mime_type == DEFAULT_FORMAT:
+        return thumbnail_path
+    return f"{root}{suffix}.{FORMATS[mime_type][0]}"
+
+
+def get_local_thumbnail_path(instance) -> Optional[str]:
+    """
+    Returns the storage path of the instance's thumbnail, if it has been generated by GeoNode,
+    None if it's a remote or a missing one.
+    """
+    thumbnail_url = instance.thumbnail_url
+    thumbnail_path = instance.thumbnail_path
+    if thumbnail_url and thumbnail_path and thumbnail_url.endswith(os.path.basename(thumbnail_path)):
+        return thumbnail_path
+    return None
+
+
+def create_derivatives(thumbnail_path: str, image: Image.Image) -> List[str]:
+    """
+    Stores the derivatives of a thumbnail: its smaller sizes (keeping its ratio), in all the encodings,
+    and its full size in the compact encodings.
+
+    :param thumbnail_path: storage path of the thumbnail
+    :param image: image of the thumbnail
+    :returns: the storage paths of the derivatives
+    """
+    if not is_enabled():
+        return []
+
+    quality = settings.THUMBNAIL_DERIVATIVES.get("quality", 80)
+    formats = get_formats()
+    image = image.convert("RGB")
+    paths = []
+    for width in get_widths() + [None]:
+        if width:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+        else:
+            resized = image
+        for mime_type in formats:
+            path = derivative_path(thumbnail_path, width, mime_type)
+            if path == thumbnail_path:
+                continue
+            try:
+                with BytesIO() as output:
+                    resized.save(output, format=FORMATS[mime_type][1], quality=quality)
+                    storage_manager.save(path, ContentFile(output.getvalue()))
+                paths.append(path)
+            except Exception as e:
+                logger.error(f"Error when generating the thumbnail derivative {path}: {e}")
+    return paths
+
+
+def remove_derivatives(thumbnail_path: str):
+    """Deletes the derivatives of a thumbnail from the storage"""
+    for width in get_widths() + [None]:
+        for mime_type in FORMATS:
+            path = derivative_path(thumbnail_path, width, mime_type)
+            if path != thumbnail_path and storage_manager.exists(path):
+                storage_manager.delete(path)
+
+
+def parse_accept(accept: str) -> List[str]:
+    """
+    Returns the image mime types explicitly accepted by the given Accept header.
+    Wildcards are ignored, since clients not supporting the compact encodings send them too.
+    """
+    mime_types = []
+    for item in (accept or "").split(","):
+        mime_type, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if mime_type.lower() in FORMATS and quality > 0:
+            mime_types.append(mime_type.lower())
+    return mime_types
+
+
+def select_derivative(thumbnail_path: str, accept: str = None, width: Optional[int] = None) -> str:
+    """
+    Returns the storage path of the derivative of the thumbnail best matching the request:
+    the smallest size at least as wide as the requested width, in the preferred encoding accepted by the client.
+    Falls back to the thumbnail itself when no derivative matches.
+    """
+    if not is_enabled():
+        return thumbnail_path
+
+    size = None
+    if width:
+        size = next((_width for _width in get_widths() if _width >= width), None)
+
+    accepted = parse_accept(accept)
+    for mime_type in get_formats():
+        if mime_type != DEFAULT_FORMAT and mime_type not in accepted:
+            continue
+        path = derivative_path(thumbnail_path, size, mime_type)
+        if path == thumbnail_path or storage_manager.exists(path):
+            return path
+    return thumbnail_path
@@ -0,0 +1,96 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import logging
+
+from datetime import datetime
+
+from geonode.celery_app import app
+from geonode.resource.models import ExecutionRequest
+from geonode.tasks.tasks import AcquireLock, FaultTolerantTask
+from geonode.thumbs.batch import get_batch_resources, regenerate_thumbnails
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(
+    bind=True,
+    base=FaultTolerantTask,
+    name="geonode.thumbs.tasks.regenerate_thumbnails_task",
+    queue="geonode",
+    expires=30,
+    acks_late=False,
+    ignore_result=False,
+)
+def regenerate_thumbnails_task(self, execution_id: str):
+    """
+    Regenerates in bulk the thumbnails of the resources selected by the `input_params` of the ExecutionRequest.
+
+    The progress is recorded in the `step` of the request, the report of the batch in its `output_params`.
+    """
+    with AcquireLock(execution_id) as lock:
+        if lock.acquire() is not True:
+            return
+        _exec_request = ExecutionRequest.objects.filter(exec_id=execution_id, status=ExecutionRequest.STATUS_READY)
+        _request = _exec_request.first()
+        if _request is None:
+            return
+        _exec_request.update(status=ExecutionRequest.STATUS_RUNNING)
+        params = _request.input_params or {}
+
+        def _progress(report):
+            _exec_request.update(
+                step=f"{report.skipped + report.processed}/{report.total} thumbnails processed",
+                last_updated=datetime.now(),
+            )
+
+        try:
+            resources = get_batch_resources(
+                resource_type=params.get("resource_type"),
+                title=params.get("filter"),
+                username=params.get("username"),
+                ids=params.get("ids"),
+            )
+            report = regenerate_thumbnails(
+                resources, overwrite=not params.get("keep_existing", False), progress=_progress
+            )
+            _exec_request.update(
+                status=ExecutionRequest.STATUS_FINISHED,
+                finished=datetime.now(),
+                output_params={
+                    "output": {
+                        "total": report.total,
+                        "created": report.created,
+                        "skipped": report.skipped,
+                        "failed": {str(_id): error for _id, error in report.failed.items()},
+                        "elapsed": report.elapsed,
+                        "throughput": report.throughput,
+                    }
+                },
+            )
+        except Exception as e:
+            logger.exception(e)
+            _exec_request.update(
+                status=ExecutionRequest.STATUS_FAILED,
+                finished=datetime.now(),
+                output_params={
+                    "error": f"Error occurred while executing the operation: '{_request.func_name}'",
+                    "exception": str(e),
+                },
+            )
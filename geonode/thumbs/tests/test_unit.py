@@ -17,19 +17,34 @@
 #
 #########################################################################
 
+import os
 import re
+import time
+import tempfile
 import uuid
+import threading
+
+from io import BytesIO
+from functools import partial
+from PIL import Image
 
 from unittest.mock import patch, PropertyMock, MagicMock
 from django.conf import settings
+from django.test import override_settings
 from django.contrib.auth import get_user_model
 from django.contrib.gis.geos import Polygon
 from geonode.documents.models import Document
 from geonode.geoapps.models import GeoApp
 from geonode.resource.manager import resource_manager
+from geonode.resource.models import ExecutionRequest
 
 from geonode.thumbs import utils
+from geonode.thumbs import batch
+from geonode.thumbs.tasks import regenerate_thumbnails_task
+from geonode.thumbs import derivatives
 from geonode.thumbs import thumbnails
+from geonode.thumbs.exceptions import ThumbnailError
+from geonode.thumbs.tiles_cache import TilesCache
 from geonode.layers.models import Dataset
 from geonode.utils import DisableDjangoSignals
 from geonode.maps.models import Map, MapLayer
@@ -62,6 +77,87 @@ class ThumbnailsUtilsUnitTest(GeoNodeBaseSimpleTestSupport):
             },
         )
 
+    def test_fetch_concurrently(self):
+        lock = threading.Lock()
+        running = {"http://a": 0, "http://b": 0}
+        peaks = {"http://a": 0, "http://b": 0}
+
+        def _fetch(host, value):
+            with lock:
+                running[host] += 1
+                peaks[host] = max(peaks[host], running[host])
+            time.sleep(0.05)
+            with lock:
+                running[host] -= 1
+            if value is None:
+                raise ValueError("failed")
+            return value
+
+        requests = [
+            (f"{host}/{i}", partial(_fetch, host, i or None)) for i in range(6) for host in ("http://a", "http://b")
+        ]
+        with self.settings(THUMBNAIL_FETCH_OPTIONS={"max_workers": 8, "max_per_host": 2, "timeout": 10}):
+            results = utils.fetch_concurrently(requests)
+
+        # results are returned in the order of the requests
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertListEqual(results[2:], [i for i in range(1, 6) for _ in range(2)])
+        self.assertDictEqual(peaks, {"http://a": 2, "http://b": 2})
+
+        # requests not completed before the deadline result in an error
+        results = utils.fetch_concurrently([("http://a", lambda: time.sleep(1)), ("http://b", lambda: 1)], timeout=0.2)
+        self.assertIsInstance(results[0], ThumbnailError)
+        self.assertEqual(results[1], 1)
+
+    def test_tiles_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            cache = TilesCache(location, max_size=100)
+            fetch = MagicMock(return_value=b"x" * 30)
+
+            self.assertEqual(cache.get_or_fetch("http://tiles/{z}/{x}/{y}.png", 1, 0, 0, fetch), b"x" * 30)
+            self.assertEqual(cache.get_or_fetch("http://tiles/{z}/{x}/{y}.png", 1, 0, 0, fetch), b"x" * 30)
+            fetch.assert_called_once()
+            self.assertIsNone(cache.get("http://other/{z}/{x}/{y}.png", 1, 0, 0))
+
+            # the least recently used tiles are evicted beyond the budget
+            for x in range(1, 4):
+                os.utime(cache.path("http://tiles/{z}/{x}/{y}.png", 1, x - 1, 0), (x, x))
+                cache.set("http://tiles/{z}/{x}/{y}.png", 1, x, 0, b"y" * 30)
+            cache.evict()
+            self.assertIsNone(cache.get("http://tiles/{z}/{x}/{y}.png", 1, 0, 0))
+            self.assertEqual(cache.get("http://tiles/{z}/{x}/{y}.png", 1, 3, 0), b"y" * 30)
+
+    @override_settings(
+        THUMBNAIL_SIZE={"width": 500, "height": 200},
+        THUMBNAIL_DERIVATIVES={"enabled": True, "widths": [250, 1000], "formats": ["image/webp"], "quality": 80},
+    )
+    def test_thumbnail_derivatives(self):
+        self.assertEqual(derivatives.get_widths(), [250])
+        self.assertEqual(derivatives.get_formats(), ["image/webp", "image/jpeg"])
+        self.assertEqual(derivatives.parse_accept("image/avif;q=0,image/webp,image/*;q=0.8,*/*;q=0.5"), ["image/webp"])
+
+        saved = {}
+        with patch("geonode.thumbs.derivatives.storage_manager") as storage_mock:
+            storage_mock.save.side_effect = lambda path, content: saved.setdefault(path, content.read())
+            paths = derivatives.create_derivatives("thumbs/map-thumb.jpg", Image.new("RGB", (500, 200)))
+        self.assertCountEqual(
+            paths, ["thumbs/map-thumb-250w.webp", "thumbs/map-thumb-250w.jpg", "thumbs/map-thumb.webp"]
+        )
+        self.assertEqual(Image.open(BytesIO(saved["thumbs/map-thumb-250w.webp"])).size, (250, 100))
+
+        with patch("geonode.thumbs.derivatives.storage_manager") as storage_mock:
+            storage_mock.exists.side_effect = lambda path: path in saved
+            self.assertEqual(
+                derivatives.select_derivative("thumbs/map-thumb.jpg", "image/webp", width=100),
+                "thumbs/map-thumb-250w.webp",
+            )
+            self.assertEqual(derivatives.select_derivative("thumbs/map-thumb.jpg", "*/*"), "thumbs/map-thumb.jpg")
+            # thumbnails generated before the derivatives were enabled are served as they are
+            self.assertEqual(
+                derivatives.select_derivative("thumbs/old-thumb.jpg", "image/webp", width=100), "thumbs/old-thumb.jpg"
+            )
+
     def test_make_bbox_to_pixels_transf_same(self):
         src_bbox = [0, 0, 1, 1]
         dest_bbox = [0, 0, 1, 1]
@@ -283,3 +379,58 @@ class ThumbnailsUnitTest(GeoNodeBaseTestSupport):
             map.save()
             thumbnails.create_thumbnail(map, overwrite=True)
             _mck.assert_called_with(map, compute_bbox=False, target_crs="EPSG:3857")
+
+    def test_regenerate_thumbnails(self):
+        # resources with close bboxes of similar size share the group key
+        self.assertEqual(
+            batch.get_resource_group_key(None, Polygon.from_bbox((10, 40, 11, 41))),
+            batch.get_resource_group_key(None, Polygon.from_bbox((10.1, 40.1, 10.9, 40.9))),
+        )
+        self.assertNotEqual(
+            batch.get_resource_group_key(None, Polygon.from_bbox((10, 40, 11, 41))),
+            batch.get_resource_group_key(None, Polygon.from_bbox((-10, -40, 50, 60))),
+        )
+        self.assertNotEqual(
+            batch.get_resource_group_key(None, Polygon.from_bbox((10, 40, 11, 41))),
+            batch.get_resource_group_key("http://remote/ows", Polygon.from_bbox((10, 40, 11, 41))),
+        )
+
+        resources = Dataset.objects.all()
+        failing_id = resources.first().id
+        generated = []
+
+        def _generate_thumbnail(resource_id, overwrite, check_bbox):
+            generated.append(resource_id)
+            if resource_id == failing_id:
+                raise ThumbnailError("boom")
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "geonode.thumbs.batch._generate_thumbnail", side_effect=_generate_thumbnail
+        ):
+            checkpoint = os.path.join(tmpdir, "checkpoint.json")
+            report = batch.regenerate_thumbnails(resources, workers=2, chunk_size=1, checkpoint=checkpoint)
+            self.assertEqual(report.total, resources.count())
+            self.assertEqual(report.created, resources.count() - 1)
+            self.assertEqual(list(report.failed), [failing_id])
+            self.assertCountEqual(generated, resources.values_list("id", flat=True))
+
+            # a new run with the same checkpoint only retries the failed resources, if requested
+            generated.clear()
+            report = batch.regenerate_thumbnails(resources, checkpoint=checkpoint)
+            self.assertEqual(report.skipped, resources.count())
+            self.assertEqual(generated, [])
+            report = batch.regenerate_thumbnails(resources, checkpoint=checkpoint, retry_failed=True)
+            self.assertEqual(generated, [failing_id])
+            self.assertEqual(report.skipped, resources.count() - 1)
+
+            # the same batch run by the task of an execution request
+            exec_request = ExecutionRequest.objects.create(
+                func_name="regenerate_thumbnails", input_params={"resource_type": "dataset"}
+            )
+            regenerate_thumbnails_task(str(exec_request.exec_id))
+            exec_request.refresh_from_db()
+            self.assertEqual(exec_request.status, ExecutionRequest.STATUS_FINISHED)
+            output = exec_request.output_params["output"]
+            self.assertEqual(output["total"], resources.count())
+            self.assertEqual(output["created"], resources.count() - 1)
+            self.assertEqual(list(output["failed"]), [str(failing_id)])
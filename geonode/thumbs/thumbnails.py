@@ -19,6 +19,7 @@
 import logging
 
 from io import BytesIO
+from functools import partial
 from PIL import Image, UnidentifiedImageError
 from typing import List, Union, Optional, Tuple
 
@@ -31,7 +32,7 @@ from geonode.geoapps.models import GeoApp
 from geonode.maps.models import Map, MapLayer
 from geonode.layers.models import Dataset
 from geonode.geoserver.helpers import ogc_server_settings
-from geonode.utils import get_dataset_name, get_dataset_workspace
+from geonode.utils import get_dataset_name, get_dataset_workspace, is_monochromatic_image
 from geonode.thumbs import utils
 from geonode.thumbs.exceptions import ThumbnailError
 
@@ -136,16 +137,19 @@ def create_thumbnail(
             styles = [instance.default_style.name]
 
     # --- fetch WMS datasets ---
-    partial_thumbs = []
-
+    # the requests are prepared here, since they may query the DB, then the images are fetched concurrently
+    requests = []
     for ogc_server, datasets, _styles in locations:
         if isinstance(instance, Map):
             styles = []
             if len(datasets) == len(_styles):
                 styles = _styles
-        try:
-            partial_thumbs.append(
-                utils.get_map(
+        request_info = utils.get_map_request_info(ogc_server)
+        requests.append(
+            (
+                request_info[0],
+                partial(
+                    utils.get_map,
                     ogc_server,
                     datasets,
                     wms_version=wms_version,
@@ -154,11 +158,18 @@ def create_thumbnail(
                     styles=styles,
                     width=width,
                     height=height,
-                )
+                    request_info=request_info,
+                ),
             )
-        except Exception as e:
+        )
+
+    partial_thumbs = []
+    for image in utils.fetch_concurrently(requests):
+        if isinstance(image, Exception):
             logger.error(f"Exception occurred while fetching partial thumbnail for {instance.title}.")
-            logger.exception(e)
+            logger.exception(image)
+        else:
+            partial_thumbs.append(image)
 
     if not partial_thumbs and is_map_with_datasets:
         utils.assign_missing_thumbnail(instance)
@@ -202,8 +213,10 @@ def create_thumbnail(
         thumbnail.save(output, format="PNG")
         content = output.getvalue()
 
-    # save thumbnail
-    instance.save_thumbnail(default_thumbnail_name, image=content)
+    # save thumbnail, the blank check is done on the composed image rather than on its encoded content
+    instance.save_thumbnail(
+        default_thumbnail_name, image=content, monochromatic=is_monochromatic_image(None, image=thumbnail)
+    )
     return instance.thumbnail_url
 
 
@@ -0,0 +1,139 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import os
+import uuid
+import hashlib
+import logging
+
+from typing import Callable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_tiles_caches = {}
+
+
+class TilesCache:
+    """
+    On-disk cache of the thumbnails' background tiles, shared by all the processes (e.g. Celery workers)
+    having access to its location.
+
+    Tiles are stored in files named after the hash of their (URL template, z, x, y) key, and written atomically,
+    so that concurrent processes never read partial tiles. Files are touched when read, and the least recently
+    used ones are evicted when the total size exceeds the budget.
+    """
+
+    # fraction of the budget freed by an eviction, to avoid evicting on each write
+    EVICTION_RATIO = 0.1
+
+    def __init__(self, location: str, max_size: int):
+        self.location = location
+        self.max_size = max_size
+        self._written = 0
+
+    def path(self, template: str, z: int, x: int, y: int) -> str:
+        digest = hashlib.sha256(f"{template}|{z}|{x}|{y}".encode("utf-8")).hexdigest()
+        return os.path.join(self.location, digest[:2], digest[2:4], digest)
+
+    def get(self, template: str, z: int, x: int, y: int) -> Optional[bytes]:
+        path = self.path(template, z, x, y)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            os.utime(path)
+            return content
+        except OSError:
+            return None
+
+    def set(self, template: str, z: int, x: int, y: int, content: bytes):
+        path = self.path(template, z, x, y)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store the tile {template} {z}/{x}/{y} in the cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._written += len(content)
+        if self._written > self.max_size * self.EVICTION_RATIO:
+            self._written = 0
+            self.evict()
+
+    def get_or_fetch(self, template: str, z: int, x: int, y: int, fetch: Callable[[], bytes]) -> bytes:
+        content = self.get(template, z, x, y)
+        if content is None:
+            content = fetch()
+            if content:
+                self.set(template, z, x, y, content)
+        return content
+
+    def evict(self):
+        """
+        Removes the least recently used tiles until the cache size is below the budget, less the eviction ratio.
+        """
+        files = []
+        total = 0
+        for root, _, names in os.walk(self.location):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_size:
+            return
+
+        target = self.max_size * (1 - self.EVICTION_RATIO)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                # already removed by another process
+                pass
+        logger.debug(f"Evicted {removed} tiles from the thumbnails tiles cache")
+
+
+def get_tiles_cache() -> Optional[TilesCache]:
+    """
+    Returns the tiles cache configured by settings.THUMBNAIL_TILES_CACHE, or None if it is disabled.
+    """
+    options = getattr(settings, "THUMBNAIL_TILES_CACHE", {})
+    if not options.get("enabled", False) or not options.get("location"):
+        return None
+    key = (options["location"], options.get("max_size", 512 * 1024 * 1024))
+    if key not in _tiles_caches:
+        _tiles_caches[key] = TilesCache(*key)
+    return _tiles_caches[key]
@@ -21,13 +21,17 @@ import re
 import time
 import base64
 import logging
+import threading
 
 from pyproj import CRS
 from typing import List, Tuple, Callable, Union
 from uuid import uuid4
-from urllib.parse import urlencode
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlencode, urlparse
 
 from django.conf import settings
+from django.db import connections
 from django.contrib.auth import get_user_model
 
 from geonode.utils import bbox_to_projection
@@ -156,6 +160,7 @@ def get_map(
     height: int = 200,
     max_retries: int = 3,
     retry_delay: int = 1,
+    request_info: Tuple = None,
 ):
     """
     Function fetching an image from OGC server.
@@ -175,10 +180,58 @@ def get_map(
     :param height: height of the returned image
     :param max_retries: maximum number of retries before skipping retrieval
     :param retry_delay: number of seconds waited between retries
+    :param request_info: the outcome of get_map_request_info for the OGC server, if already computed
     :returns: retrieved image
     """
     from geonode.geoserver.helpers import ogc_server_settings
 
+    wms_url, headers, additional_kwargs = request_info or get_map_request_info(ogc_server_location)
+
+    image = None
+    for retry in range(max_retries):
+        try:
+            # fetch data
+            image = getmap(
+                wms_url,
+                version=wms_version,
+                headers=headers,
+                layers=layers,
+                styles=styles,
+                srs=bbox[-1] if bbox else None,
+                bbox=[bbox[0], bbox[2], bbox[1], bbox[3]] if bbox else None,
+                size=(width, height),
+                format=mime_type,
+                transparent=True,
+                timeout=getattr(ogc_server_settings, "TIMEOUT", None),
+                **additional_kwargs,
+            )
+
+            # validate response
+            if not image or "ServiceException" in str(image.read()):
+                raise ThumbnailError(f"Fetching partial thumbnail from {wms_url} failed with response: {str(image)}")
+        except Exception as e:
+            if retry + 1 >= max_retries:
+                logger.exception(e)
+                return
+            time.sleep(retry_delay)
+            continue
+        else:
+            break
+
+    return image.read()
+
+
+def get_map_request_info(ogc_server_location: str) -> Tuple[str, dict, dict]:
+    """
+    Function returning the WMS endpoint, the headers and the additional parameters (e.g. access_token)
+    of the GetMap requests to an OGC server.
+    It queries the DB, so it must be called before fetching the images from other threads.
+
+    :param ogc_server_location: OGC server URL
+    :returns: tuple with the WMS URL, the headers and the additional request parameters
+    """
+    from geonode.geoserver.helpers import ogc_server_settings
+
     if ogc_server_location is not None:
         thumbnail_url = ogc_server_location
     else:
@@ -212,40 +265,55 @@ def get_map(
         else:
             headers["Authorization"] = f"Bearer {additional_kwargs['access_token']}"
 
-    image = None
-    for retry in range(max_retries):
-        try:
-            # fetch data
-            image = getmap(
-                f"{thumbnail_url}{wms_endpoint}",
-                version=wms_version,
-                headers=headers,
-                layers=layers,
-                styles=styles,
-                srs=bbox[-1] if bbox else None,
-                bbox=[bbox[0], bbox[2], bbox[1], bbox[3]] if bbox else None,
-                size=(width, height),
-                format=mime_type,
-                transparent=True,
-                timeout=getattr(ogc_server_settings, "TIMEOUT", None),
-                **additional_kwargs,
-            )
+    return f"{thumbnail_url}{wms_endpoint}", headers, additional_kwargs
 
-            # validate response
-            if not image or "ServiceException" in str(image.read()):
-                raise ThumbnailError(
-                    f"Fetching partial thumbnail from {thumbnail_url} failed with response: {str(image)}"
-                )
-        except Exception as e:
-            if retry + 1 >= max_retries:
-                logger.exception(e)
-                return
-            time.sleep(retry_delay)
-            continue
-        else:
-            break
 
-    return image.read()
+def fetch_concurrently(requests: List[Tuple[str, Callable]], timeout: float = None) -> List:
+    """
+    Function running the given fetching functions concurrently, according to settings.THUMBNAIL_FETCH_OPTIONS:
+    at most 'max_workers' functions run at once, and at most 'max_per_host' for the same host.
+
+    :param requests: list of (url, function) tuples, the functions take no arguments
+    :param timeout: overall deadline in seconds (default: the 'timeout' option)
+    :returns: the results of the functions, in the same order as the requests. Functions raising an exception,
+              or not completed before the deadline, result in the exception
+    """
+    options = getattr(settings, "THUMBNAIL_FETCH_OPTIONS", {})
+    max_workers = options.get("max_workers", 8)
+    max_per_host = options.get("max_per_host", 4)
+    timeout = timeout if timeout is not None else options.get("timeout", 60)
+
+    if not requests:
+        return []
+
+    hosts_semaphores = defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+    for url, _ in requests:
+        hosts_semaphores[urlparse(url).netloc]
+
+    def _run(url, fetch):
+        try:
+            with hosts_semaphores[urlparse(url).netloc]:
+                return fetch()
+        finally:
+            # close the DB connections opened by this thread, if any
+            connections.close_all()
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(requests)), thread_name_prefix="thumbs")
+    try:
+        futures = [executor.submit(_run, url, fetch) for url, fetch in requests]
+        wait(futures, timeout=timeout)
+        results = []
+        for (url, _), future in zip(requests, futures):
+            if not future.done():
+                future.cancel()
+                results.append(ThumbnailError(f"Fetching {url} did not complete within {timeout} seconds"))
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+        return results
+    finally:
+        executor.shutdown(wait=False)
 
 
 def _build_getmap_request(
@@ -138,6 +138,10 @@ OGC_SERVER = {
     }
 }
 
+# Max number of pooled HTTP sessions kept by geonode.utils.HttpClient, one for each scheme, host,
+# authentication mode and retries policy; the least recently used ones are closed beyond it
+HTTP_CLIENT_MAX_POOLED_SESSIONS = int(os.getenv("HTTP_CLIENT_MAX_POOLED_SESSIONS", 100))
+
 # If you want to enable Mosaics use the following configuration
 UPLOADER = {
     "BACKEND": "geonode.importer",
@@ -163,6 +167,16 @@ MONITORING_SERVICE_NAME = os.getenv("MONITORING_SERVICE_NAME", "local-geonode")
 # how long monitoring data should be stored
 MONITORING_DATA_TTL = timedelta(days=int(os.getenv("MONITORING_DATA_TTL", 7)))
 
+# the requests events are written in batches by a background thread, out of the requests
+MONITORING_INGESTION_QUEUE_SIZE = int(os.getenv("MONITORING_INGESTION_QUEUE_SIZE", 10000))
+MONITORING_INGESTION_QUEUE_TIMEOUT = int(os.getenv("MONITORING_INGESTION_QUEUE_TIMEOUT", 0))
+MONITORING_INGESTION_BATCH_SIZE = int(os.getenv("MONITORING_INGESTION_BATCH_SIZE", 100))
+MONITORING_INGESTION_FLUSH_INTERVAL = int(os.getenv("MONITORING_INGESTION_FLUSH_INTERVAL", 1))
+MONITORING_DATA_AGGREGATION_CHUNK_SIZE = int(os.getenv("MONITORING_DATA_AGGREGATION_CHUNK_SIZE", 60))
+MONITORING_PARTITIONS_INTERVAL = os.getenv("MONITORING_PARTITIONS_INTERVAL", "day")
+MONITORING_PARTITIONS_AHEAD = int(os.getenv("MONITORING_PARTITIONS_AHEAD", 7))
+MONITORING_DATA_ROLLUPS = ast.literal_eval(os.getenv("MONITORING_DATA_ROLLUPS", "['hour', 'day']"))
+
 # this will disable csrf check for notification config views,
 # use with caution - for dev purpose only
 MONITORING_DISABLE_CSRF = ast.literal_eval(os.environ.get("MONITORING_DISABLE_CSRF", "False"))
@@ -22,6 +22,7 @@ import gc
 import re
 import json
 import time
+import hashlib
 import base64
 import select
 import shutil
@@ -31,6 +32,8 @@ import logging
 import tarfile
 import datetime
 import requests
+import threading
+import http.cookiejar
 import tempfile
 import ipaddress
 import itertools
@@ -47,13 +50,14 @@ from threading import local
 from slugify import slugify
 from contextlib import closing
 from requests.exceptions import RetryError
-from collections import namedtuple, defaultdict
+from collections import namedtuple, defaultdict, OrderedDict
 from rest_framework.exceptions import APIException
 from math import atan, exp, log, pi, sin, tan, floor
 from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
 from geonode.upload.api.exceptions import GeneralUploadException
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import signals
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.apps import apps as django_apps
@@ -1159,6 +1163,120 @@ def check_ogc_backend(backend_package):
     return False
 
 
+class _BlockAllCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """
+    Pooled sessions are shared among users: never store nor send back cookies.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
+class HttpSessionRegistry:
+    """
+    Per-process registry of pooled "requests.Session" objects, keyed by scheme, host,
+    authentication mode and retries policy, so that keep-alive connections are reused
+    across the requests of the same worker.
+
+    The registry is reset when the process is forked (e.g. Celery prefork / uWSGI workers)
+    and holds at most "max_sessions" sessions, the least recently used ones being closed.
+    """
+
+    def __init__(self, max_sessions=100):
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._sessions = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_auth_mode(headers):
+        _auth = (headers or {}).get("Authorization")
+        return _auth.split(" ", 1)[0].lower() if _auth else None
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # do not close the sessions inherited from the parent: the sockets are still in use there
+            self._pid = os.getpid()
+            self._sessions = OrderedDict()
+            self.hits = self.misses = self.evictions = 0
+
+    def get_session(
+        self,
+        url,
+        auth_mode=None,
+        retries=1,
+        backoff_factor=0.3,
+        status_forcelist=(),
+        pool_connections=10,
+        pool_maxsize=10,
+    ):
+        _url = urlsplit(url)
+        key = (_url.scheme, _url.netloc, auth_mode, retries, backoff_factor, tuple(status_forcelist))
+        with self._lock:
+            self._check_pid()
+            session = self._sessions.get(key)
+            if session:
+                self.hits += 1
+                self._sessions.move_to_end(key)
+                return session
+            self.misses += 1
+            session = requests.Session()
+            session.cookies.set_policy(_BlockAllCookiesPolicy())
+            retry = Retry(
+                total=retries,
+                read=retries,
+                connect=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=status_forcelist,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry, pool_maxsize=pool_maxsize, pool_connections=pool_connections
+            )
+            session.mount(f"{_url.scheme}://", adapter)
+            session.verify = False
+            self._sessions[key] = session
+            while len(self._sessions) > self.max_sessions:
+                _, _evicted = self._sessions.popitem(last=False)
+                self.evictions += 1
+                _evicted.close()
+            return session
+
+    def get_stats(self):
+        """
+        Returns the registry counters along with the number of connections opened by the pooled sessions.
+        """
+        with self._lock:
+            self._check_pid()
+            connections = 0
+            for session in self._sessions.values():
+                for adapter in session.adapters.values():
+                    pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+                    if pools is not None:
+                        connections += sum(getattr(pools[_k], "num_connections", 0) for _k in pools.keys())
+            return {
+                "sessions": len(self._sessions),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "connections": connections,
+            }
+
+    def clear(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = OrderedDict()
+
+
+http_sessions = HttpSessionRegistry(max_sessions=getattr(settings, "HTTP_CLIENT_MAX_POOLED_SESSIONS", 100))
+
+
 class HttpClient:
     def __init__(self):
         self.timeout = 5
@@ -1191,6 +1309,8 @@ class HttpClient:
         user=None,
         verify=False,
     ):
+        # never alter the caller's (or the default) headers dictionary
+        headers = dict(headers or {})
         if (
             (user or self.username != "admin")
             and check_ogc_backend(geoserver.BACKEND_PACKAGE)
@@ -1214,20 +1334,15 @@ class HttpClient:
         headers["User-Agent"] = "GeoNode"
         response = None
         content = None
-        session = requests.Session()
-        retry = Retry(
-            total=retries or self.retries,
-            read=retries or self.retries,
-            connect=retries or self.retries,
+        session = http_sessions.get_session(
+            url,
+            auth_mode=HttpSessionRegistry.get_auth_mode(headers),
+            retries=retries or self.retries,
             backoff_factor=self.backoff_factor,
             status_forcelist=self.status_forcelist,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
         )
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=retry, pool_maxsize=self.pool_maxsize, pool_connections=self.pool_connections
-        )
-        scheme = urlsplit(url).scheme
-        session.mount(f"{scheme}://", adapter)
-        session.verify = False
         action = getattr(session, method.lower(), None)
         if action:
             _req_tout = timeout or self.timeout
@@ -1840,7 +1955,44 @@ def json_serializer_producer(dictionary):
     return output
 
 
-def is_monochromatic_image(image_url, image_data=None):
+MONOCHROMATIC_IMAGE_CACHE_KEY_PREFIX = "monochromatic_image"
+# max size the images are decoded to, when their format allows it (e.g. JPEG), for the blank check
+MONOCHROMATIC_IMAGE_SAMPLE_SIZE = (256, 256)
+
+
+def _get_monochromatic_image_cache_key(image_url):
+    return f"{MONOCHROMATIC_IMAGE_CACHE_KEY_PREFIX}:{hashlib.sha1(image_url.encode('utf-8')).hexdigest()}"
+
+
+def cache_monochromatic_image(image_url, monochromatic):
+    """Records whether the image at the given URL is blank, e.g. when it's checked before being stored."""
+    if image_url:
+        cache.set(
+            _get_monochromatic_image_cache_key(image_url),
+            monochromatic,
+            getattr(settings, "MONOCHROMATIC_IMAGE_CACHE_TIMEOUT", 86400),
+        )
+
+
+def _is_single_color(img):
+    if img.mode not in ("1", "L", "LA", "RGB", "RGBA"):
+        img = img.convert("RGBA")
+    # the extrema of each band, computed natively without copying the image
+    extrema = img.getextrema()
+    if not isinstance(extrema[0], tuple):
+        extrema = (extrema,)
+    return all(_min == _max for _min, _max in extrema)
+
+
+def is_monochromatic_image(image_url, image_data=None, image=None):
+    """
+    Checks whether an image is blank, i.e. made of a single color.
+
+    :param image_url: URL of the image, fetched only if the result for it isn't cached already
+    :param image_data: content of the image, checked instead of the URL
+    :param image: PIL Image, e.g. the one just composed, checked instead of the URL and of the content
+    """
+
     def is_local_static(url):
         if url.startswith(settings.STATIC_URL) or (url.startswith(settings.SITEURL) and settings.STATIC_URL in url):
             return True
@@ -1858,33 +2010,31 @@ def is_monochromatic_image(image_url, image_data=None):
 
     def verify_image(stream):
         with Image.open(stream) as _stream:
-            img = _stream.convert("L")
-            img.verify()  # verify that it is, in fact an image
-            extr = img.getextrema()
-            a = 0
-            for i in extr:
-                if isinstance(i, tuple):
-                    a += abs(i[0] - i[1])
-                else:
-                    a = abs(extr[0] - extr[1])
-                    break
-            return a == 0
+            # decode a downscaled sample, if the format supports it
+            _stream.draft("RGB", MONOCHROMATIC_IMAGE_SAMPLE_SIZE)
+            return _is_single_color(_stream)
 
     try:
-        if image_data:
+        if image is not None:
+            return _is_single_color(image)
+        elif image_data:
             logger.debug("...Checking if image is a blank image")
             with BytesIO(image_data) as stream:
                 return verify_image(stream)
         elif image_url:
-            logger.debug(f"...Checking if '{image_url}' is a blank image")
             url = image_url if is_absolute(image_url) else urljoin(settings.SITEURL, image_url)
-            if not is_local_static(url):
-                req, stream_content = http_client.get(url, timeout=5)
-                with BytesIO(stream_content) as stream:
-                    return verify_image(stream)
-            else:
-                with get_thumb_handler(url) as stream:
-                    return verify_image(stream)
+            monochromatic = cache.get(_get_monochromatic_image_cache_key(url))
+            if monochromatic is None:
+                logger.debug(f"...Checking if '{image_url}' is a blank image")
+                if not is_local_static(url):
+                    req, stream_content = http_client.get(url, timeout=5)
+                    with BytesIO(stream_content) as stream:
+                        monochromatic = verify_image(stream)
+                else:
+                    with get_thumb_handler(url) as stream:
+                        monochromatic = verify_image(stream)
+                cache_monochromatic_image(url, monochromatic)
+            return monochromatic
         return True
     except Exception as e:
         logger.debug(e)